@@ -1568,6 +1568,41 @@ function wireEvents() {
   });
 }
 
+function renderDetailText(originalText, highlightTerms) {
+  const wordCount = originalText.split(/\s+/).filter(Boolean).length;
+  const snippet = originalText.split(/\s+/).slice(0, 30).join(" ");
+
+  const highlightedText = highlightText(originalText, highlightTerms);
+  const highlightedSnippet = highlightText(snippet, highlightTerms);
+
+  elements.detailText.innerHTML = highlightedText;
+  elements.detailTextPreview.innerHTML = `${highlightedSnippet}... (${wordCount.toLocaleString()} words)`;
+
+  elements.detailText.classList.add("hidden");
+  elements.detailTextPreview.classList.remove("hidden");
+  elements.detailTextToggle.textContent = "Expand";
+}
+
+async function fetchOriginalText(row) {
+  const original = row.metadata?.original_row || {};
+  const params = new URLSearchParams();
+  if (row.source_row_index !== null && row.source_row_index !== undefined) {
+    params.set("source_row_index", row.source_row_index);
+  }
+  if (original.ref_file && original.ref_offset !== undefined) {
+    params.set("ref_file", original.ref_file);
+    params.set("ref_offset", original.ref_offset);
+  }
+  try {
+    const response = await fetch(`/api/original-text?${params}`);
+    const payload = await response.json();
+    return payload.ok ? payload.text || "" : "";
+  } catch (error) {
+    console.warn("Original text load error", row.filename, error);
+    return "";
+  }
+}
+
 function toggleDetailText() {
   const isExpanded = !elements.detailText.classList.contains("hidden");
   if (isExpanded) {
@@ -1751,19 +1786,24 @@ function renderDetail(row, options = {}) {
   const model = row.metadata?.config?.model || "—";
   elements.detailModel.textContent = model;
 
-  const originalText = row.original_text || "No source text captured.";
-  const wordCount = originalText.split(/\s+/).filter(Boolean).length;
-  const snippet = originalText.split(/\s+/).slice(0, 30).join(" ");
-
-  const highlightedText = highlightText(originalText, highlightTerms);
-  const highlightedSnippet = highlightText(snippet, highlightTerms);
-
-  elements.detailText.innerHTML = highlightedText;
-  elements.detailTextPreview.innerHTML = `${highlightedSnippet}... (${wordCount.toLocaleString()} words)`;
-
-  elements.detailText.classList.add("hidden");
-  elements.detailTextPreview.classList.remove("hidden");
-  elements.detailTextToggle.textContent = "Expand";
+  if (row.original_text) {
+    renderDetailText(row.original_text, highlightTerms);
+  } else if (!row.original_text_requested) {
+    // Records only embed the source text with --embed-original-row; fetch it on demand
+    renderDetailText("Loading source text…", highlightTerms);
+    row.original_text_requested = true;
+    fetchOriginalText(row).then((text) => {
+      row.original_text = text;
+      if (text) {
+        row.search_blob = `${row.search_blob} ${text.toLowerCase()}`;
+      }
+      if (state.activeRowId === (row.filename || null)) {
+        renderDetailText(text || "No source text captured.", getHighlightTerms());
+      }
+    });
+  } else {
+    renderDetailText("No source text captured.", highlightTerms);
+  }
 
   elements.detailInsights.innerHTML =
     row.key_facts.length > 0
@@ -17,6 +17,7 @@ Expected: 70% reduction in total costs (mainly from Tavily reduction)
 
 import hashlib
 import json
+import re
 import sqlite3
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -38,6 +39,17 @@ _TAVILY_CACHE: Dict[str, List[dict]] = {}
 # Database path
 DB_PATH = Path("data/fraud_data.db")
 
+# NIH grant numbers such as "R01 CA12345"
+_GRANT_RE = re.compile(r'\b([A-Z]\d{2})\s+([A-Z]{1,3}\d{4,6})\b', re.IGNORECASE)
+
+# Viability score patterns, tried in priority order. They stay separate rather than
+# fused into one alternation: a fused regex takes the leftmost match, so the loose
+# fallback could win over a strict "Viability Score: N" appearing later in the report.
+_VIABILITY_SCORE_RES = (
+    re.compile(r'Viability\s+Score[^\d]*?:\s*(\d+)', re.IGNORECASE),
+    re.compile(r'Viability.*?Score.*?(\d+)', re.IGNORECASE),
+)
+
 
 def get_query_hash(query: str) -> str:
     """Generate cache key for a query."""
@@ -278,10 +290,79 @@ def build_optimized_searches(lead_data: Dict[str, Any]) -> List[Tuple[str, int,
     return searches
 
 
-def check_database_first(lead_data: Dict[str, Any]) -> Dict[str, Any]:
+def prefetch_database_rows(leads: List[Dict[str, Any]], db_path: Optional[Path] = None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Look up the NCT IDs and PMIDs of several leads in one pass.
+    Uses a single connection and one query per table instead of a
+    connection + query per identifier. Returns {'nct': {nct_id: row},
+    'retraction': {pmid: row}} for check_database_first(prefetched=...);
+    a table whose lookup failed is left out, so those leads query it as usual.
+    Only columns created by etl_loader.create_schema are selected.
+    """
+    if not db_path:
+        db_path = DB_PATH
+
+    prefetched: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    if not db_path.exists():
+        return prefetched
+
+    # Only the first identifier of each kind is ever looked up per lead
+    nct_ids = sorted({lead['nct_ids'][0] for lead in leads if isinstance(lead.get('nct_ids'), list) and lead['nct_ids']})
+    pmids = sorted({str(lead['pmids'][0]) for lead in leads if isinstance(lead.get('pmids'), list) and lead['pmids']})
+
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        if nct_ids:
+            placeholders = ",".join("?" * len(nct_ids))
+            rows = conn.execute(f"""
+                SELECT
+                    nct_id,
+                    title,
+                    status,
+                    principal_investigator
+                FROM clinical_trials
+                WHERE nct_id IN ({placeholders})
+            """, nct_ids).fetchall()
+            prefetched['nct'] = {}
+            for row in rows:
+                prefetched['nct'].setdefault(row['nct_id'], dict(row))
+    except sqlite3.Error as e:
+        print(f"  ! Batched NCT lookup failed: {e}", file=sys.stderr)
+
+    try:
+        if pmids:
+            # retractions has no pmid column; a PMID is matched inside the DOI,
+            # and one scan of the table checks every wanted PMID
+            values = ",".join(["(?)"] * len(pmids))
+            rows = conn.execute(f"""
+                WITH wanted(pmid) AS (VALUES {values})
+                SELECT
+                    wanted.pmid AS pmid,
+                    r.doi,
+                    r.title,
+                    r.journal
+                FROM retractions r
+                JOIN wanted ON r.doi LIKE '%' || wanted.pmid || '%'
+                ORDER BY r.id
+            """, pmids).fetchall()
+            prefetched['retraction'] = {}
+            for row in rows:
+                prefetched['retraction'].setdefault(row['pmid'], dict(row))
+    except sqlite3.Error as e:
+        print(f"  ! Batched retraction lookup failed: {e}", file=sys.stderr)
+    finally:
+        conn.close()
+
+    return prefetched
+
+
+def check_database_first(lead_data: Dict[str, Any], prefetched: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """
     Check local database BEFORE doing Tavily searches.
     Returns dict with database findings that can be used directly.
+    prefetched (from prefetch_database_rows) answers NCT and PMID lookups
+    without a query; a table missing from it is queried as usual.
     """
     db_findings = {
         'nct_data': {},
@@ -300,15 +381,16 @@ def check_database_first(lead_data: Dict[str, Any]) -> Dict[str, Any]:
     original_text = lead_data.get('original_text', '') or ''
     grant_numbers = []
     if original_text:
-        import re
-        grant_pattern = r'\b([A-Z]\d{2})\s+([A-Z]{1,3}\d{4,6})\b'
-        grant_matches = re.findall(grant_pattern, original_text, re.IGNORECASE)
+        grant_matches = _GRANT_RE.findall(original_text)
         grant_numbers = [f"{match[0]} {match[1]}" for match in grant_matches]
 
     # Query database for each identifier
     if nct_ids and isinstance(nct_ids, list):
         for nct_id in nct_ids[:1]:  # Only first NCT ID
-            nct_data = query_database_for_nct(nct_id)
+            if prefetched and 'nct' in prefetched:
+                nct_data = prefetched['nct'].get(nct_id, {})
+            else:
+                nct_data = query_database_for_nct(nct_id)
             if nct_data:
                 db_findings['nct_data'] = nct_data
                 db_findings['has_nct'] = True
@@ -326,7 +408,10 @@ def check_database_first(lead_data: Dict[str, Any]) -> Dict[str, Any]:
 
     if pmids and isinstance(pmids, list):
         for pmid in pmids[:1]:  # Only first PMID
-            retraction_data = query_database_for_retraction(pmid)
+            if prefetched and 'retraction' in prefetched:
+                retraction_data = prefetched['retraction'].get(str(pmid), {})
+            else:
+                retraction_data = query_database_for_retraction(pmid)
             if retraction_data:
                 db_findings['retraction_data'] = retraction_data
                 db_findings['has_retraction'] = True
@@ -417,7 +502,7 @@ def deduplicate_results(results: List[dict]) -> List[dict]:
     return unique_results
 
 
-def investigate_lead_optimized(lead_data: Dict[str, Any]) -> Dict[str, Any]:
+def investigate_lead_optimized(lead_data: Dict[str, Any], prefetched: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """
     OPTIMIZED investigation with 70% cost reduction + 3-4x faster.
 
@@ -442,7 +527,7 @@ def investigate_lead_optimized(lead_data: Dict[str, Any]) -> Dict[str, Any]:
 
         # STEP 1: Check database first (FREE, no Tavily tokens)
         print(f"  → Checking local database...", flush=True)
-        db_findings = check_database_first(lead_data)
+        db_findings = check_database_first(lead_data, prefetched)
         db_hit_count = sum([db_findings['has_nct'], db_findings['has_grant'], db_findings['has_retraction']])
 
         # STEP 2: Build optimized search list (8-12 searches instead of 30-50)
@@ -583,15 +668,9 @@ def extract_viability_score(report: str) -> Optional[int]:
     if not report:
         return None
 
-    import re
-    patterns = [
-        r'Viability\s+Score[^\d]*?:\s*(\d+)',
-        r'Viability.*?Score.*?(\d+)',
-    ]
-
-    for pattern in patterns:
+    for pattern in _VIABILITY_SCORE_RES:
         try:
-            match = re.search(pattern, report, re.IGNORECASE)
+            match = pattern.search(report)
             if match:
                 score = int(match.group(1))
                 if 0 <= score <= 100:
@@ -603,12 +682,12 @@ def extract_viability_score(report: str) -> Optional[int]:
 
 
 # Compatibility function - can be imported as drop-in replacement
-def investigate_lead(lead_data: Dict[str, Any]) -> Dict[str, Any]:
+def investigate_lead(lead_data: Dict[str, Any], prefetched: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """
     Drop-in replacement for clinical_investigator.investigate_lead()
     Uses optimized version by default.
     """
-    return investigate_lead_optimized(lead_data)
+    return investigate_lead_optimized(lead_data, prefetched)
 
 
 if __name__ == "__main__":
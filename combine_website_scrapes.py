@@ -5,27 +5,86 @@ pubmed_trending_*.jsonl, and pubpeer_*.jsonl files into combined_medical_fraud_d
 """
 
 import json
+import os
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 DATA_RAW_DIR = Path("data/raw")
 DATA_PROCESSED_DIR = Path("data/processed")
 OUTPUT_FILE = DATA_PROCESSED_DIR / "combined_medical_fraud_data.jsonl"
 
+
+def validate_json_line(line: bytes) -> None:
+    """Raise ValueError if line is not valid JSON (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        orjson.loads(line)
+    else:
+        json.loads(line)
+
+# Filename prefixes of the *.jsonl scrape outputs to combine, in output order
+SCRAPE_FILE_PREFIXES = ("website_scrape_", "pubmed_trending_", "pubpeer_", "data_")
+
+
+def find_scrape_files() -> dict:
+    """Group data/raw/*.jsonl by scrape prefix (each group sorted) in one directory pass."""
+    groups = {prefix: [] for prefix in SCRAPE_FILE_PREFIXES}
+    try:
+        with os.scandir(DATA_RAW_DIR) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".jsonl") or not entry.is_file():
+                    continue
+                for prefix in SCRAPE_FILE_PREFIXES:
+                    if name.startswith(prefix):
+                        groups[prefix].append(Path(entry.path))
+                        break
+    except FileNotFoundError:
+        pass
+    return {prefix: sorted(files) for prefix, files in groups.items()}
+
+
+def read_valid_lines(scrape_file: Path):
+    """Return (newline-joined valid JSON lines, count, warnings, error) for one scrape file."""
+    lines = []
+    warnings = []
+    error = None
+    try:
+        with open(scrape_file, 'rb') as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                # Records are already one JSON object per line: validate and copy the
+                # original bytes rather than decoding and re-encoding every record
+                try:
+                    validate_json_line(line)
+                except ValueError as e:
+                    warnings.append(f"  Warning: Skipping invalid JSON on line {line_num}: {e}")
+                    continue
+                lines.append(line)
+    except Exception as e:
+        error = str(e)
+    data = b'\n'.join(lines) + b'\n' if lines else b''
+    return data, len(lines), warnings, error
+
+
 def main():
     DATA_PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
     
-    # Find all website scrape files
-    website_scrape_files = sorted(DATA_RAW_DIR.glob("website_scrape_*.jsonl"))
-    
-    # Find all PubMed trending files
-    pubmed_trending_files = sorted(DATA_RAW_DIR.glob("pubmed_trending_*.jsonl"))
-    
-    # Find all PubPeer files
-    pubpeer_files = sorted(DATA_RAW_DIR.glob("pubpeer_*.jsonl"))
-    
-    # Find all Global Fraud Scraper files (data_SOURCENAME.jsonl)
-    global_fraud_files = sorted(DATA_RAW_DIR.glob("data_*.jsonl"))
+    scrape_files = find_scrape_files()
+    website_scrape_files = scrape_files["website_scrape_"]
+    pubmed_trending_files = scrape_files["pubmed_trending_"]
+    pubpeer_files = scrape_files["pubpeer_"]
+    # Global Fraud Scraper files (data_SOURCENAME.jsonl)
+    global_fraud_files = scrape_files["data_"]
     
     # Combine all types
     all_files = website_scrape_files + pubmed_trending_files + pubpeer_files + global_fraud_files
@@ -53,43 +112,46 @@ def main():
         for f in global_fraud_files:
             print(f"    - {f.name}")
     
-    combined_records = []
+    # Validate files in worker processes (JSON decoding is the CPU cost) and write
+    # from this process only, in file order, to a temp file next to the output so a
+    # failed run never leaves a half-written combined file behind. At most `workers`
+    # files are in flight, so only that many files' records are held in memory
+    tmp_file = OUTPUT_FILE.with_name(OUTPUT_FILE.name + ".tmp")
+    total_records = 0
+    workers = min(len(all_files), os.cpu_count() or 1)
     
-    # Read all records from all scrape files
-    for scrape_file in all_files:
-        print(f"\nReading {scrape_file.name}...")
-        file_records = 0
-        try:
-            with open(scrape_file, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        record = json.loads(line)
-                        combined_records.append(record)
-                        file_records += 1
-                    except json.JSONDecodeError as e:
-                        print(f"  Warning: Skipping invalid JSON on line {line_num}: {e}", file=sys.stderr)
-                        continue
+    print(f"\nWriting combined records to {OUTPUT_FILE}...")
+    with open(tmp_file, 'wb') as out, ProcessPoolExecutor(max_workers=workers) as pool:
+        remaining = iter(all_files)
+        in_flight = deque()
+        for scrape_file in remaining:
+            in_flight.append((scrape_file, pool.submit(read_valid_lines, scrape_file)))
+            if len(in_flight) == workers:
+                break
+        while in_flight:
+            scrape_file, future = in_flight.popleft()
+            data, file_records, warnings, error = future.result()
+            next_file = next(remaining, None)
+            if next_file is not None:
+                in_flight.append((next_file, pool.submit(read_valid_lines, next_file)))
+            print(f"\nReading {scrape_file.name}...")
+            for warning in warnings:
+                print(warning, file=sys.stderr)
+            out.write(data)
+            total_records += file_records
+            if error:
+                print(f"  Error reading {scrape_file.name}: {error}", file=sys.stderr)
+                continue
             print(f"  Added {file_records} records from {scrape_file.name}")
-        except Exception as e:
-            print(f"  Error reading {scrape_file.name}: {e}", file=sys.stderr)
-            continue
     
-    if not combined_records:
+    if not total_records:
+        tmp_file.unlink()
         print("\n❌ No records found in scrape files")
         sys.exit(1)
     
-    # Write combined file
-    print(f"\nWriting {len(combined_records)} combined records to {OUTPUT_FILE}...")
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        for i, record in enumerate(combined_records, 1):
-            f.write(json.dumps(record, ensure_ascii=False) + '\n')
-            if i % 100 == 0:
-                print(f"  Written {i}/{len(combined_records)}...", end='\r', flush=True)
+    os.replace(tmp_file, OUTPUT_FILE)
     
-    print(f"\n✅ Combined {len(combined_records)} records from {len(all_files)} file(s)")
+    print(f"\n✅ Combined {total_records} records from {len(all_files)} file(s)")
     print(f"   Output: {OUTPUT_FILE}")
     if OUTPUT_FILE.exists():
         size_mb = OUTPUT_FILE.stat().st_size / (1024 * 1024)
@@ -8,9 +8,16 @@ FILTERS OUT records with fraud_potential_score < 30
 import json
 import csv
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Fix CSV field size limit
 try:
     csv.field_size_limit(sys.maxsize)
@@ -18,6 +25,13 @@ except OverflowError:
     csv.field_size_limit(2**31 - 1)
 
 
+def load_json_line(line: str) -> Dict[str, Any]:
+    """Parse one JSONL line (orjson when available; its errors subclass json.JSONDecodeError)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
 def get_fraud_score(record: Dict[str, Any]) -> Optional[int]:
     """Extract fraud score from record, checking both top level and metadata."""
     # Check top level first
@@ -64,7 +78,7 @@ def jsonl_to_csv(jsonl_path: Path, csv_path: Path, verbose: bool = True, min_sco
                 continue
                 
             try:
-                record = json.loads(line)
+                record = load_json_line(line)
                 
                 # FILTER BY FRAUD SCORE - COMMENTED OUT
                 # fraud_score = get_fraud_score(record)
@@ -124,9 +138,12 @@ def format_record_as_text(record: Dict[str, Any]) -> str:
     if case_status:
         lines.append(f"CASE STATUS: {case_status}")
     
-    # Add fraud score if present
-    fraud_score = metadata.get('fraud_potential_score') or record.get('fraud_potential_score')
-    if fraud_score:
+    # Add fraud score if present (a score of 0 is still a score, so test for None
+    # rather than falsiness before falling back to the top-level field)
+    fraud_score = metadata.get('fraud_potential_score')
+    if fraud_score is None:
+        fraud_score = record.get('fraud_potential_score')
+    if fraud_score is not None:
         lines.append(f"FRAUD POTENTIAL SCORE: {fraud_score}")
     
     lines.append("")
@@ -140,18 +157,8 @@ def format_record_as_text(record: Dict[str, Any]) -> str:
         lines.append("")
     
     # Format based on source
-    if source == "FDA FAERS":
-        lines.extend(format_faers_record(metadata if metadata else record))
-    elif source == "CMS LEIE":
-        lines.extend(format_leie_record(metadata if metadata else record))
-    elif source == "CMS Open Payments":
-        lines.extend(format_open_payments_record(metadata if metadata else record))
-    elif source == "FDA Warning Letters":
-        lines.extend(format_fda_warning_record(metadata if metadata else record))
-    elif source == "DOJ":
-        lines.extend(format_doj_record(metadata if metadata else record))
-    else:
-        lines.extend(format_generic_record(metadata if metadata else record))
+    formatter = SOURCE_FORMATTERS.get(source, format_generic_record)
+    lines.extend(formatter(metadata if metadata else record))
     
     # Add next steps if present
     next_steps = metadata.get('next_steps') or record.get('next_steps')
@@ -162,6 +169,19 @@ def format_record_as_text(record: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+# Analysis boilerplate shared by every record of a source; only the fields vary
+OFF_LABEL_ANALYSIS_LINES = (
+    "  - {indication_diversity} different indications suggests off-label promotion",
+    "  - If Medicare/Medicaid covered these off-label uses → False Claims Act violation",
+)
+
+KICKBACK_ANALYSIS_LINES = (
+    "  - High-value payment (${amount:,.0f}) raises kickback concerns",
+    "  - Cross-reference with Medicare Part D prescribing data for {physician_name}",
+    "  - Check if high prescriber of {company} products",
+)
+
+
 def format_faers_record(record: Dict[str, Any]) -> list:
     """Format FDA FAERS adverse event record."""
     lines = []
@@ -191,8 +211,7 @@ def format_faers_record(record: Dict[str, Any]) -> list:
     if event_count >= 100:
         lines.append(f"  - High volume of adverse events ({event_count}) indicates widespread use")
     if indication_diversity >= 10:
-        lines.append(f"  - {indication_diversity} different indications suggests off-label promotion")
-        lines.append(f"  - If Medicare/Medicaid covered these off-label uses → False Claims Act violation")
+        lines.extend(t.format_map({'indication_diversity': indication_diversity}) for t in OFF_LABEL_ANALYSIS_LINES)
     
     return lines
 
@@ -265,9 +284,8 @@ def format_open_payments_record(record: Dict[str, Any]) -> list:
     if amount_float >= 50000:
         lines.append("")
         lines.append("KICKBACK ANALYSIS:")
-        lines.append(f"  - High-value payment (${amount_float:,.0f}) raises kickback concerns")
-        lines.append(f"  - Cross-reference with Medicare Part D prescribing data for {physician_name}")
-        lines.append(f"  - Check if high prescriber of {company} products")
+        fields = {'amount': amount_float, 'physician_name': physician_name, 'company': company}
+        lines.extend(t.format_map(fields) for t in KICKBACK_ANALYSIS_LINES)
     
     return lines
 
@@ -331,34 +349,63 @@ def format_doj_record(record: Dict[str, Any]) -> list:
     return lines
 
 
+# Meta fields the generic formatter skips
+GENERIC_SKIP_FIELDS = frozenset({'id', 'source', 'metadata', 'text', 'filename', 'fraud_indicators',
+                                 'case_status', 'fraud_potential_score', 'next_steps'})
+
+
+@lru_cache(maxsize=None)
+def field_label(key: str) -> str:
+    """Format a field name as a label, e.g. 'total_cost' -> 'TOTAL COST' (memoized; keys repeat across records)."""
+    return key.replace('_', ' ').upper()
+
+
+def format_list_field(label: str, value: list) -> Optional[str]:
+    """Format the first 10 items of a list field; empty lists are skipped."""
+    if value:
+        return f"{label}: {', '.join(map(str, value[:10]))}"
+    return None
+
+
+def format_scalar_field(label: str, value: Any) -> str:
+    """Format a scalar field."""
+    return f"{label}: {value}"
+
+
+# JSON-loaded values have exact types, so a type() lookup replaces an isinstance chain.
+# Nested dicts are skipped; any type not listed is formatted as a scalar
+GENERIC_FIELD_FORMATTERS = {
+    list: format_list_field,
+    dict: lambda label, value: None,
+}
+
+
 def format_generic_record(record: Dict[str, Any]) -> list:
     """Generic formatter."""
     lines = []
     
-    # Skip these meta fields
-    skip_fields = {'id', 'source', 'metadata', 'text', 'filename', 'fraud_indicators', 
-                   'case_status', 'fraud_potential_score', 'next_steps'}
-    
     for key, value in record.items():
-        if key in skip_fields or value is None:
+        if key in GENERIC_SKIP_FIELDS or value is None:
             continue
         
-        # Format key
-        formatted_key = key.replace('_', ' ').upper()
-        
-        # Format value
-        if isinstance(value, list):
-            if value:
-                value_str = ', '.join(str(v) for v in value[:10])
-                lines.append(f"{formatted_key}: {value_str}")
-        elif isinstance(value, dict):
-            continue  # Skip nested dicts
-        else:
-            lines.append(f"{formatted_key}: {value}")
+        formatter = GENERIC_FIELD_FORMATTERS.get(type(value), format_scalar_field)
+        line = formatter(field_label(key), value)
+        if line is not None:
+            lines.append(line)
     
     return lines
 
 
+# Source-specific formatters, looked up once per record; other sources use the generic one
+SOURCE_FORMATTERS = {
+    "FDA FAERS": format_faers_record,
+    "CMS LEIE": format_leie_record,
+    "CMS Open Payments": format_open_payments_record,
+    "FDA Warning Letters": format_fda_warning_record,
+    "DOJ": format_doj_record,
+}
+
+
 def main():
     """Main entry point."""
     import argparse
@@ -60,20 +60,32 @@ def find_red_flags():
     # FLAG 2: Doctors in CMS OpenPayments with high payments AND PubMed articles
     print("🔴 FLAG 2: Doctors with >$50k payments who have PubMed articles")
     print("-" * 80)
+    # Aggregate the large payments per doctor first, so the expensive text match below
+    # runs once per doctor rather than once per payment row, and totals are not
+    # multiplied by the number of matching articles
     cursor.execute("""
-        SELECT DISTINCT
-            c.physician_first_name || ' ' || c.physician_last_name as doctor_name,
-            SUM(c.payment_amount) as total_payments,
-            COUNT(DISTINCT c.record_id) as payment_count,
+        WITH high_payments AS (
+            SELECT
+                physician_first_name,
+                physician_last_name,
+                SUM(payment_amount) as total_payments,
+                COUNT(DISTINCT record_id) as payment_count
+            FROM cms_openpayments
+            WHERE payment_amount > 50000
+              AND physician_last_name IS NOT NULL AND physician_last_name != ''
+            GROUP BY physician_first_name, physician_last_name
+        )
+        SELECT
+            h.physician_first_name || ' ' || h.physician_last_name as doctor_name,
+            h.total_payments,
+            h.payment_count,
             COUNT(DISTINCT p.pmid) as pubmed_count
-        FROM cms_openpayments c
-        LEFT JOIN pubmed_articles p ON 
-            LOWER(p.text_content) LIKE '%' || LOWER(c.physician_first_name) || '%' ||
-            LOWER(p.text_content) LIKE '%' || LOWER(c.physician_last_name) || '%'
-        WHERE c.payment_amount > 50000
-        GROUP BY doctor_name
-        HAVING pubmed_count > 0
-        ORDER BY total_payments DESC
+        FROM high_payments h
+        JOIN pubmed_articles p ON
+            LOWER(p.text_content) LIKE '%' || LOWER(h.physician_last_name) || '%' AND
+            LOWER(p.text_content) LIKE '%' || LOWER(h.physician_first_name) || '%'
+        GROUP BY h.physician_first_name, h.physician_last_name, h.total_payments, h.payment_count
+        ORDER BY h.total_payments DESC
         LIMIT 20
     """)
     
@@ -9,6 +9,8 @@ import sqlite3
 import sys
 import zipfile
 import csv
+import io
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -17,6 +19,7 @@ import re
 DATA_RAW_DIR = Path("data/raw")
 DATA_DB_DIR = Path("data")
 DB_PATH = DATA_DB_DIR / "fraud_data.db"
+PREFETCH_CHUNK_SIZE = 1 << 20  # main() warms the next JSONL file in 1 MiB reads
 
 # Normalize names for cross-referencing
 def normalize_name(name: str) -> Optional[str]:
@@ -165,6 +168,7 @@ def create_schema(conn: sqlite3.Connection):
     
     # Create indexes for cross-referencing
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_nih_grants_pi_normalized ON nih_grants(pi_name_normalized)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_nih_pi ON nih_grants(pi_name_normalized COLLATE NOCASE)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_cms_physician_normalized ON cms_openpayments(physician_name_normalized)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_cms_recipient_normalized ON cms_openpayments(recipient_name_normalized)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_clinical_trials_pi_normalized ON clinical_trials(pi_name_normalized)")
@@ -174,6 +178,48 @@ def create_schema(conn: sqlite3.Connection):
     conn.commit()
 
 
+# FTS5 shadow indexes over the cross-reference tables (used by gpt_ranker.py)
+FTS_TABLES = {
+    "nih_grants_fts": ("nih_grants", ("pi_name_normalized", "org_name")),
+    "retractions_fts": ("retractions", ("doi", "text_content")),
+    "pubpeer_articles_fts": ("pubpeer_articles", ("text_content",)),
+    "fda_faers_fts": ("fda_faers", ("drug", "text_content")),
+}
+
+
+def create_fts_indexes(conn: sqlite3.Connection):
+    """Create and rebuild the FTS5 full-text indexes used for cross-referencing."""
+    cursor = conn.cursor()
+    for fts_table, (content_table, columns) in FTS_TABLES.items():
+        try:
+            cursor.execute(f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table}
+                USING fts5({", ".join(columns)}, content='{content_table}', content_rowid='id')
+            """)
+            # External-content tables must be rebuilt after bulk INSERT OR REPLACE loads
+            cursor.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES('rebuild')")
+        except sqlite3.OperationalError as e:
+            # Keep going: the other tables' indexes are still useful. A table whose rebuild
+            # failed is dropped so gpt_ranker.py falls back to LIKE for it
+            print(f"  ⚠️  Skipping full-text index {fts_table}: {e}", file=sys.stderr)
+            try:
+                cursor.execute(f"DROP TABLE IF EXISTS {fts_table}")
+            except sqlite3.OperationalError:
+                pass
+            continue
+    conn.commit()
+
+
+def prefetch_file(filepath: Path):
+    """Read a file in chunks and discard them so the OS has it cached for the next load."""
+    try:
+        with open(filepath, 'rb') as f:
+            while f.read(PREFETCH_CHUNK_SIZE):
+                pass
+    except OSError:
+        pass
+
+
 def load_jsonl_file(conn: sqlite3.Connection, filepath: Path):
     """Load a JSONL file into the appropriate table based on source name."""
     cursor = conn.cursor()
@@ -360,24 +406,47 @@ def load_cms_zip(conn: sqlite3.Connection, zip_path: Path):
             print(f"  Extracting {main_csv}...")
             
             with zip_ref.open(main_csv) as csv_file:
-                # Read CSV (handle large files)
-                reader = csv.DictReader(csv_file.read().decode('utf-8', errors='ignore').splitlines())
+                # Decode and parse the member as a stream so memory stays O(row), not O(file)
+                text = io.TextIOWrapper(csv_file, encoding='utf-8', errors='ignore', newline='')
+                reader = csv.reader(text)
+                header = next(reader, [])
+                
+                # Resolve column positions once and index each row list directly,
+                # rather than building a dict per row as csv.DictReader does
+                columns = {name: i for i, name in enumerate(header)}
+                
+                def column_getter(name, default=None):
+                    index = columns.get(name)
+                    if index is None:
+                        return lambda row: default
+                    return lambda row: row[index] if index < len(row) else default
+                
+                get_record_id = column_getter('Record_ID')
+                get_first_name = column_getter('Physician_First_Name', '')
+                get_last_name = column_getter('Physician_Last_Name', '')
+                get_recipient_name = column_getter('Recipient_Name', '')
+                get_payment = column_getter('Total_Amount_of_Payment_USDollars', '0')
+                get_payment_date = column_getter('Date_of_Payment')
+                get_nature = column_getter('Nature_of_Payment_or_Transfer_of_Value')
+                get_category = column_getter('Product_Category_or_Therapeutic_Area_1')
                 
                 for row in reader:
+                    if not row:
+                        continue
                     # Normalize physician name
-                    first_name = row.get('Physician_First_Name', '')
-                    last_name = row.get('Physician_Last_Name', '')
+                    first_name = get_first_name(row)
+                    last_name = get_last_name(row)
                     physician_name = f"{first_name} {last_name}".strip()
                     physician_normalized = normalize_name(physician_name)
                     
                     # Normalize recipient name
-                    recipient_name = row.get('Recipient_Name', '')
+                    recipient_name = get_recipient_name(row)
                     recipient_normalized = normalize_name(recipient_name)
                     
                     # Parse payment amount
                     payment_amount = None
                     try:
-                        payment_str = row.get('Total_Amount_of_Payment_USDollars', '0')
+                        payment_str = get_payment(row)
                         payment_amount = float(payment_str.replace(',', '')) if payment_str else 0
                     except (ValueError, AttributeError):
                         pass
@@ -389,16 +458,16 @@ def load_cms_zip(conn: sqlite3.Connection, zip_path: Path):
                          nature_of_payment, product_category, scraped_at)
                         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """, (
-                        row.get('Record_ID'),
+                        get_record_id(row),
                         first_name,
                         last_name,
                         physician_normalized,
                         recipient_name,
                         recipient_normalized,
                         payment_amount,
-                        row.get('Date_of_Payment'),
-                        row.get('Nature_of_Payment_or_Transfer_of_Value'),
-                        row.get('Product_Category_or_Therapeutic_Area_1'),
+                        get_payment_date(row),
+                        get_nature(row),
+                        get_category(row),
                         datetime.now().isoformat()
                     ))
                     
@@ -430,13 +499,23 @@ def main():
     conn = sqlite3.connect(DB_PATH)
     create_schema(conn)
     
-    # Load JSONL files
-    jsonl_files = sorted(DATA_RAW_DIR.glob("*.jsonl"))
-    for jsonl_file in jsonl_files:
-        if "pubpeer" in jsonl_file.name.lower():
-            load_pubpeer_file(conn, jsonl_file)
-        elif jsonl_file.name.startswith("data_"):
-            load_jsonl_file(conn, jsonl_file)
+    # Load JSONL files. Each file is streamed line by line; while the main thread
+    # (the only SQLite writer) inserts one, a worker pulls the next into the OS cache
+    jsonl_files = [
+        f for f in sorted(DATA_RAW_DIR.glob("*.jsonl"))
+        if "pubpeer" in f.name.lower() or f.name.startswith("data_")
+    ]
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = None
+        for i, jsonl_file in enumerate(jsonl_files):
+            if pending is not None:
+                pending.cancel()  # Drop a prefetch that never started; the loader got there first
+            if i + 1 < len(jsonl_files):
+                pending = executor.submit(prefetch_file, jsonl_files[i + 1])
+            if "pubpeer" in jsonl_file.name.lower():
+                load_pubpeer_file(conn, jsonl_file)
+            else:
+                load_jsonl_file(conn, jsonl_file)
     
     # Load ZIP files
     zip_files = sorted(DATA_RAW_DIR.glob("*.zip"))
@@ -447,6 +526,10 @@ def main():
             # Similar function for MAUDE (implement if needed)
             print(f"  ⚠️  MAUDE ZIP loading not yet implemented: {zip_file.name}")
     
+    # Build full-text indexes for fast cross-reference lookups
+    print("Building full-text indexes...")
+    create_fts_indexes(conn)
+    
     # Print summary
     cursor = conn.cursor()
     print("\n" + "="*60)
@@ -6,13 +6,25 @@ Uses async/await for parallel processing and API keys for faster access
 
 import asyncio
 import aiohttp
+import contextlib
+import hashlib
+import io
 import json
 import os
 import sys
+import time
 import logging
+import xml.etree.ElementTree as ET
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Import config (will fail gracefully if not present)
 try:
@@ -21,12 +33,26 @@ try:
     OPENFDA_API_KEY = config.OPENFDA_API_KEY if hasattr(config, 'OPENFDA_API_KEY') else None
     MY_EMAIL = config.MY_EMAIL if hasattr(config, 'MY_EMAIL') else "fraud.scraper@example.com"
     RATE_LIMIT = config.RATE_LIMIT if hasattr(config, 'RATE_LIMIT') else 1.0
+    MAX_CONCURRENCY_PER_HOST = config.MAX_CONCURRENCY_PER_HOST if hasattr(config, 'MAX_CONCURRENCY_PER_HOST') else 10
+    MAX_RECORDS_PER_SOURCE = config.MAX_RECORDS_PER_SOURCE if hasattr(config, 'MAX_RECORDS_PER_SOURCE') else 400
 except ImportError:
     print("Warning: config.py not found. Using defaults. Create config.py with your API keys.", file=sys.stderr)
     NCBI_API_KEY = None
     OPENFDA_API_KEY = None
     MY_EMAIL = "fraud.scraper@example.com"
     RATE_LIMIT = 1.0
+    MAX_CONCURRENCY_PER_HOST = 10
+    MAX_RECORDS_PER_SOURCE = 400
+
+# NCBI allows 3 requests/second without an API key and 10 with one
+PUBMED_CONCURRENCY = 10 if NCBI_API_KEY else 3
+# Published per-host request limits (requests/second), enforced across all jobs
+HOST_RATE_LIMITS = {
+    "eutils.ncbi.nlm.nih.gov": PUBMED_CONCURRENCY,
+    "api.fda.gov": 4,  # 240 requests/minute per key
+}
+# PMIDs per efetch request; E-utilities accepts a comma-separated id list
+EFETCH_BATCH_SIZE = 20
 
 # Setup output directory
 DATA_DIR = Path("data/raw")
@@ -38,16 +64,95 @@ DATA_DIR.mkdir(parents=True, exist_ok=True)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
 logger = logging.getLogger("FraudScraper")
 
+def encode_json_line(record) -> bytes:
+    """Encode one newline-terminated JSONL record as UTF-8 bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+# One semaphore per host, shared by every job, so concurrent jobs hitting the
+# same API never exceed MAX_CONCURRENCY_PER_HOST requests in flight.
+_HOST_SEMAPHORES = {}
+
+class RateLimiter:
+    """Async token bucket: at most `rate` requests per second, bursting up to `rate`."""
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return self
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+_HOST_LIMITERS = {}
+_NO_LIMIT = contextlib.nullcontext()
+
+def host_rate_limiter(url):
+    """Return the shared RateLimiter for url's host, or a no-op if it has no published limit."""
+    host = urlsplit(url).netloc
+    rate = HOST_RATE_LIMITS.get(host)
+    if rate is None:
+        return _NO_LIMIT
+    limiter = _HOST_LIMITERS.get(host)
+    if limiter is None:
+        limiter = _HOST_LIMITERS[host] = RateLimiter(rate)
+    return limiter
+
+def retry_after_seconds(response, default=10.0):
+    """Seconds to wait from a 429 response's Retry-After header, else default."""
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", default)))
+    except ValueError:  # HTTP-date form
+        return default
+
+def host_semaphore(url):
+    """Return the shared request semaphore for the host of url."""
+    host = urlsplit(url).netloc
+    semaphore = _HOST_SEMAPHORES.get(host)
+    if semaphore is None:
+        semaphore = _HOST_SEMAPHORES[host] = asyncio.Semaphore(MAX_CONCURRENCY_PER_HOST)
+    return semaphore
+
 # ==========================================
 # 1. BASE CLASS (The Blueprint)
 # ==========================================
+# Fields that identify a record for duplicate checking, in priority order
+RECORD_ID_FIELDS = ("pmid", "doi", "nct_id", "project_num", "report_id", "filename")
+
+def record_key(record):
+    """Return the (field, value) duplicate key for a record, or None if it has no identifier."""
+    for field in RECORD_ID_FIELDS:
+        value = record.get(field)
+        if value:
+            return (field, value)
+    return None
+
 class DataSource(ABC):
-    def __init__(self, name, base_url):
+    def __init__(self, name, base_url, max_records=None):
         self.name = name
         self.base_url = base_url
         self.session = None
         self.rate_limit = RATE_LIMIT
+        # Each job stops as soon as it has saved this many new (non-duplicate) records
+        self.max_records = MAX_RECORDS_PER_SOURCE if max_records is None else max_records
         self._existing_records = None  # Cache for duplicate checking
+        self._output = None  # Append handle for data_<name>.jsonl, opened on first save
+
+    @property
+    def output_path(self):
+        return DATA_DIR / f"data_{self.name}.jsonl"
 
     def _load_existing_records(self):
         """Load existing record IDs to avoid duplicates."""
@@ -55,7 +160,7 @@ class DataSource(ABC):
             return self._existing_records
         
         existing = set()
-        filename = DATA_DIR / f"data_{self.name}.jsonl"
+        filename = self.output_path
         if filename.exists():
             try:
                 with open(filename, 'r', encoding='utf-8') as f:
@@ -64,47 +169,25 @@ class DataSource(ABC):
                         if not line:
                             continue
                         try:
-                            record = json.loads(line)
-                            # Extract unique identifier based on record type
-                            if 'pmid' in record and record.get('pmid'):
-                                existing.add(('pmid', record['pmid']))
-                            elif 'doi' in record and record.get('doi'):
-                                existing.add(('doi', record['doi']))
-                            elif 'nct_id' in record and record.get('nct_id'):
-                                existing.add(('nct_id', record['nct_id']))
-                            elif 'project_num' in record and record.get('project_num'):
-                                existing.add(('project_num', record['project_num']))
-                            elif 'report_id' in record and record.get('report_id'):
-                                existing.add(('report_id', record['report_id']))
-                            elif 'filename' in record and record.get('filename'):
-                                existing.add(('filename', record['filename']))
-                        except (json.JSONDecodeError, KeyError):
+                            key = record_key(json.loads(line))
+                        except (json.JSONDecodeError, AttributeError):
                             continue
+                        if key is not None:
+                            existing.add(key)
             except Exception as e:
                 logger.warning(f"[{self.name}] Error loading existing records: {e}")
         
         self._existing_records = existing
         return existing
 
+    async def load_existing_records_async(self):
+        """Load the duplicate cache in a worker thread so jobs start their requests concurrently."""
+        return await asyncio.to_thread(self._load_existing_records)
+
     def _is_duplicate(self, record) -> bool:
         """Check if record already exists."""
-        existing = self._load_existing_records()
-        
-        # Check for unique identifiers
-        if 'pmid' in record and record.get('pmid'):
-            return ('pmid', record['pmid']) in existing
-        elif 'doi' in record and record.get('doi'):
-            return ('doi', record['doi']) in existing
-        elif 'nct_id' in record and record.get('nct_id'):
-            return ('nct_id', record['nct_id']) in existing
-        elif 'project_num' in record and record.get('project_num'):
-            return ('project_num', record['project_num']) in existing
-        elif 'report_id' in record and record.get('report_id'):
-            return ('report_id', record['report_id']) in existing
-        elif 'filename' in record and record.get('filename'):
-            return ('filename', record['filename']) in existing
-        
-        return False
+        key = record_key(record)
+        return key is not None and key in self._load_existing_records()
 
     def save_record(self, record):
         """Appends a single record to a JSONL file (crash-safe storage), skipping duplicates."""
@@ -112,31 +195,29 @@ class DataSource(ABC):
         if self._is_duplicate(record):
             return False
         
-        filename = DATA_DIR / f"data_{self.name}.jsonl"
         # Add a timestamp to every record we save
         record['scraped_at'] = datetime.now(timezone.utc).isoformat()
         record['source'] = self.name
         
-        with open(filename, "a", encoding='utf-8') as f:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        # Unbuffered append handle kept open for the whole job: each record is still one
+        # write() straight to the OS, without reopening the file per record
+        if self._output is None:
+            self._output = open(self.output_path, "ab", buffering=0)
+        self._output.write(encode_json_line(record))
         
         # Update cache
-        if self._existing_records is not None:
-            if 'pmid' in record and record.get('pmid'):
-                self._existing_records.add(('pmid', record['pmid']))
-            elif 'doi' in record and record.get('doi'):
-                self._existing_records.add(('doi', record['doi']))
-            elif 'nct_id' in record and record.get('nct_id'):
-                self._existing_records.add(('nct_id', record['nct_id']))
-            elif 'project_num' in record and record.get('project_num'):
-                self._existing_records.add(('project_num', record['project_num']))
-            elif 'report_id' in record and record.get('report_id'):
-                self._existing_records.add(('report_id', record['report_id']))
-            elif 'filename' in record and record.get('filename'):
-                self._existing_records.add(('filename', record['filename']))
+        key = record_key(record)
+        if key is not None:
+            self._existing_records.add(key)
         
         return True
 
+    def close(self):
+        """Close the output handle, if one was opened."""
+        if self._output is not None:
+            self._output.close()
+            self._output = None
+
     async def fetch_json(self, url, params=None, headers=None, method="GET", payload=None, as_text=False):
         """Robust fetcher that handles Retries and Rate Limits.
         
@@ -147,19 +228,20 @@ class DataSource(ABC):
         while tries < 3:
             try:
                 if method == "GET":
-                    async with self.session.get(url, params=params, headers=headers) as response:
+                    async with host_rate_limiter(url), host_semaphore(url), self.session.get(url, params=params, headers=headers) as response:
                         if response.status == 200:
                             if as_text:
                                 return await response.text()
                             return await response.json()
                         elif response.status == 429:
-                            logger.warning(f"[{self.name}] Rate Limited (429). Sleeping 10s...")
-                            await asyncio.sleep(10)
+                            delay = retry_after_seconds(response)
+                            logger.warning(f"[{self.name}] Rate Limited (429). Sleeping {delay:g}s...")
+                            await asyncio.sleep(delay)
                         else:
                             logger.error(f"[{self.name}] Error {response.status}: {url}")
                             return None
                 elif method == "POST":
-                    async with self.session.post(url, json=payload, headers=headers) as response:
+                    async with host_rate_limiter(url), host_semaphore(url), self.session.post(url, json=payload, headers=headers) as response:
                         if response.status == 200:
                             if as_text:
                                 return await response.text()
@@ -185,15 +267,18 @@ class DataSource(ABC):
 
 class PubMedScraper(DataSource):
     """Target: Scientific Articles (NCBI) using your API Key - Fetches full article details"""
-    def __init__(self):
-        super().__init__("PubMed_US", "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi")
+    def __init__(self, max_records=None):
+        super().__init__("PubMed_US", "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi", max_records)
         self.efetch_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
 
-    async def fetch_article_details(self, pmid: str):
-        """Fetch full article details using efetch API."""
+    async def fetch_articles_details(self, pmids):
+        """Fetch full article details for a batch of PMIDs with one efetch request.
+
+        Returns a dict of pmid -> details; PMIDs missing from the response are absent.
+        """
         params = {
             "db": "pubmed",
-            "id": pmid,
+            "id": ",".join(pmids),
             "retmode": "xml",
         }
         if NCBI_API_KEY:
@@ -202,15 +287,28 @@ class PubMedScraper(DataSource):
         # Fetch XML as text (not JSON)
         xml_data = await self.fetch_json(self.efetch_url, params=params, as_text=True)
         if not xml_data or not isinstance(xml_data, str):
-            return None
+            return {}
         
-        # Parse XML to extract article details
+        # Stream the PubmedArticleSet one article at a time, clearing each element
+        # once parsed so memory stays flat however many PMIDs are in the batch
+        details = {}
+        try:
+            for _, elem in ET.iterparse(io.BytesIO(xml_data.encode("utf-8"))):
+                if elem.tag != "PubmedArticle":
+                    continue
+                pmid = elem.findtext("MedlineCitation/PMID", "").strip()
+                if pmid:
+                    article_details = self.parse_article(elem, pmid)
+                    if article_details:
+                        details[pmid] = article_details
+                elem.clear()
+        except ET.ParseError as e:
+            logger.error(f"  Error parsing efetch XML for {len(pmids)} PMIDs: {e}")
+        return details
+
+    def parse_article(self, root, pmid: str):
+        """Extract article details from one PubmedArticle element."""
         try:
-            import xml.etree.ElementTree as ET
-            
-            # Parse XML string
-            root = ET.fromstring(xml_data)
-            
             # Extract title
             title = ""
             title_elem = root.find(".//Article/ArticleTitle")
@@ -319,10 +417,10 @@ class PubMedScraper(DataSource):
     async def run(self):
         logger.info(f"[{self.name}] Starting Job...")
         # Load existing records to skip duplicates
-        existing_count = len(self._load_existing_records())
-        logger.info(f"[{self.name}] Found {existing_count} existing records. Will scrape new data up to 400 total.")
+        existing_count = len(await self.load_existing_records_async())
+        logger.info(f"[{self.name}] Found {existing_count} existing records. Will stop after {self.max_records} new records.")
         
-        MAX_RECORDS = 400
+        MAX_RECORDS = self.max_records
         record_count = 0
         
         # Search for broad fraud terms or "all" if you remove the term
@@ -348,43 +446,31 @@ class PubMedScraper(DataSource):
             id_list = data['esearchresult']['idlist']
             if not id_list:
                 break
+            
+            # Skip PMIDs already on disk and fetch no more than we still need
+            existing = self._load_existing_records()
+            id_list = [pmid for pmid in id_list if ('pmid', pmid) not in existing]
+            id_list = id_list[:MAX_RECORDS - record_count]
 
-            # Fetch full article details for each PMID
-            for i, pmid in enumerate(id_list, 1):
+            # Fetch full article details EFETCH_BATCH_SIZE PMIDs per request,
+            # PUBMED_CONCURRENCY requests at a time; the NCBI host limiter paces them
+            batches = [id_list[i:i + EFETCH_BATCH_SIZE] for i in range(0, len(id_list), EFETCH_BATCH_SIZE)]
+            fetched = 0
+            for start in range(0, len(batches), PUBMED_CONCURRENCY):
                 if record_count >= MAX_RECORDS:
                     break
-                    
-                if i % 10 == 0:
-                    logger.info(f"  Fetching article details: {i}/{len(id_list)}... (Saved: {record_count}/{MAX_RECORDS})")
                 
-                article_details = await self.fetch_article_details(pmid)
-                if article_details:
-                    if self.save_record({
-                        "pmid": pmid, 
-                        "type": "article", 
-                        "source": "PubMed",
-                        "title": article_details.get("title", ""),
-                        "abstract": article_details.get("abstract", ""),
-                        "authors": article_details.get("authors", ""),
-                        "journal": article_details.get("journal", ""),
-                        "pub_date": article_details.get("pub_date", ""),
-                        "doi": article_details.get("doi", ""),
-                        "filename": article_details.get("filename", f"pubmed_{pmid}.html"),
-                        "text": article_details.get("text", f"PMID: {pmid}")
-                    }):
-                        record_count += 1
-                else:
-                    # Fallback if efetch fails
-                    if self.save_record({
-                        "pmid": pmid, 
-                        "type": "article_id", 
-                        "source": "PubMed",
-                        "filename": f"pubmed_{pmid}.html",
-                        "text": f"PMID: {pmid}\nSource: PubMed search for fraud/misconduct/retraction"
-                    }):
-                        record_count += 1
+                group = batches[start:start + PUBMED_CONCURRENCY]
+                fetched += sum(len(batch) for batch in group)
+                logger.info(f"  Fetching article details: {fetched}/{len(id_list)}... (Saved: {record_count}/{MAX_RECORDS})")
+                group_details = await asyncio.gather(*(self.fetch_articles_details(batch) for batch in group))
                 
-                await asyncio.sleep(self.rate_limit)
+                for batch, batch_details in zip(group, group_details):
+                    for pmid in batch:
+                        if record_count >= MAX_RECORDS:
+                            break
+                        if self._save_pubmed_record(pmid, batch_details.get(pmid)):
+                            record_count += 1
             
             if record_count >= MAX_RECORDS:
                 logger.info(f"[{self.name}] Reached limit of {MAX_RECORDS} records. Stopping.")
@@ -394,18 +480,43 @@ class PubMedScraper(DataSource):
             await asyncio.sleep(self.rate_limit)
         logger.info(f"[{self.name}] Batch Complete.")
 
+    def _save_pubmed_record(self, pmid, article_details):
+        """Save one PubMed article, falling back to a bare PMID record if efetch failed."""
+        if article_details:
+            return self.save_record({
+                "pmid": pmid, 
+                "type": "article", 
+                "source": "PubMed",
+                "title": article_details.get("title", ""),
+                "abstract": article_details.get("abstract", ""),
+                "authors": article_details.get("authors", ""),
+                "journal": article_details.get("journal", ""),
+                "pub_date": article_details.get("pub_date", ""),
+                "doi": article_details.get("doi", ""),
+                "filename": article_details.get("filename", f"pubmed_{pmid}.html"),
+                "text": article_details.get("text", f"PMID: {pmid}")
+            })
+        # Fallback if efetch fails
+        return self.save_record({
+            "pmid": pmid, 
+            "type": "article_id", 
+            "source": "PubMed",
+            "filename": f"pubmed_{pmid}.html",
+            "text": f"PMID: {pmid}\nSource: PubMed search for fraud/misconduct/retraction"
+        })
+
 class RetractionWatchScraper(DataSource):
     """Target: Retracted Papers via Crossref"""
-    def __init__(self):
-        super().__init__("RetractionWatch", "https://api.crossref.org/works")
+    def __init__(self, max_records=None):
+        super().__init__("RetractionWatch", "https://api.crossref.org/works", max_records)
 
     async def run(self):
         logger.info(f"[{self.name}] Starting Job...")
         # Load existing records to skip duplicates
-        existing_count = len(self._load_existing_records())
-        logger.info(f"[{self.name}] Found {existing_count} existing records. Will scrape new data up to 400 total.")
+        existing_count = len(await self.load_existing_records_async())
+        logger.info(f"[{self.name}] Found {existing_count} existing records. Will stop after {self.max_records} new records.")
         
-        MAX_RECORDS = 400
+        MAX_RECORDS = self.max_records
         record_count = 0
         
         cursor = "*"
@@ -452,16 +563,16 @@ class RetractionWatchScraper(DataSource):
 
 class OpenFDAScraper(DataSource):
     """Target: Adverse Drug Events using API Key"""
-    def __init__(self):
-        super().__init__("FDA_FAERS", "https://api.fda.gov/drug/event.json")
+    def __init__(self, max_records=None):
+        super().__init__("FDA_FAERS", "https://api.fda.gov/drug/event.json", max_records)
 
     async def run(self):
         logger.info(f"[{self.name}] Starting Job...")
         # Load existing records to skip duplicates
-        existing_count = len(self._load_existing_records())
-        logger.info(f"[{self.name}] Found {existing_count} existing records. Will scrape new data up to 400 total.")
+        existing_count = len(await self.load_existing_records_async())
+        logger.info(f"[{self.name}] Found {existing_count} existing records. Will stop after {self.max_records} new records.")
         
-        MAX_RECORDS = 400
+        MAX_RECORDS = self.max_records
         record_count = 0
         
         # Note: Even with a key, OpenFDA has a skip limit of 25,000 via API.
@@ -514,16 +625,16 @@ class OpenFDAScraper(DataSource):
 
 class NIHReporterScraper(DataSource):
     """Target: Grant Funding"""
-    def __init__(self):
-        super().__init__("NIH_Grants", "https://api.reporter.nih.gov/v2/projects/search")
+    def __init__(self, max_records=None):
+        super().__init__("NIH_Grants", "https://api.reporter.nih.gov/v2/projects/search", max_records)
 
     async def run(self):
         logger.info(f"[{self.name}] Starting Job...")
         # Load existing records to skip duplicates
-        existing_count = len(self._load_existing_records())
-        logger.info(f"[{self.name}] Found {existing_count} existing records. Will scrape new data up to 400 total.")
+        existing_count = len(await self.load_existing_records_async())
+        logger.info(f"[{self.name}] Found {existing_count} existing records. Will stop after {self.max_records} new records.")
         
-        MAX_RECORDS = 400
+        MAX_RECORDS = self.max_records
         record_count = 0
         
         offset = 0
@@ -585,16 +696,16 @@ class NIHReporterScraper(DataSource):
 
 class ClinicalTrialsScraper(DataSource):
     """Target: Study Protocols - Fetches full protocol details"""
-    def __init__(self):
-        super().__init__("ClinicalTrials", "https://clinicaltrials.gov/api/v2/studies")
+    def __init__(self, max_records=None):
+        super().__init__("ClinicalTrials", "https://clinicaltrials.gov/api/v2/studies", max_records)
 
     async def run(self):
         logger.info(f"[{self.name}] Starting Job...")
         # Load existing records to skip duplicates
-        existing_count = len(self._load_existing_records())
-        logger.info(f"[{self.name}] Found {existing_count} existing records. Will scrape new data up to 400 total.")
+        existing_count = len(await self.load_existing_records_async())
+        logger.info(f"[{self.name}] Found {existing_count} existing records. Will stop after {self.max_records} new records.")
         
-        MAX_RECORDS = 400
+        MAX_RECORDS = self.max_records
         record_count = 0
         
         token = None
@@ -699,16 +810,16 @@ class ClinicalTrialsScraper(DataSource):
 
 class EuropePMCScraper(DataSource):
     """Target: Europe PMC articles - provides abstracts and metadata"""
-    def __init__(self):
-        super().__init__("Europe_PMC", "https://www.ebi.ac.uk/europepmc/webservices/rest/search")
+    def __init__(self, max_records=None):
+        super().__init__("Europe_PMC", "https://www.ebi.ac.uk/europepmc/webservices/rest/search", max_records)
 
     async def run(self):
         logger.info(f"[{self.name}] Starting Job...")
         # Load existing records to skip duplicates
-        existing_count = len(self._load_existing_records())
-        logger.info(f"[{self.name}] Found {existing_count} existing records. Will scrape new data up to 400 total.")
+        existing_count = len(await self.load_existing_records_async())
+        logger.info(f"[{self.name}] Found {existing_count} existing records. Will stop after {self.max_records} new records.")
         
-        MAX_RECORDS = 400
+        MAX_RECORDS = self.max_records
         record_count = 0
         
         page = 1
@@ -807,22 +918,66 @@ class BulkFileDownloader(DataSource):
     def __init__(self, name, download_url):
         super().__init__(name, download_url)
 
+    def _load_validators(self, meta_file):
+        """Return the ETag/Last-Modified saved for the current URL, or {} if none."""
+        try:
+            meta = json.loads(meta_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if meta.get("url") != self.base_url:
+            return {}
+        return meta
+
     async def run(self):
         filename = DATA_DIR / f"{self.name}_raw.zip"
+        meta_file = DATA_DIR / f"{self.name}_raw.meta.json"
+        headers = {}
+        validators = {}
         if filename.exists():
-            logger.info(f"[{self.name}] File {filename} exists. Skipping download.")
-            return
+            # With validators from the last download, ask the server whether the file
+            # changed (304 costs no body bytes); without them keep the old skip behaviour
+            validators = self._load_validators(meta_file)
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+            if not headers:
+                logger.info(f"[{self.name}] File {filename} exists. Skipping download.")
+                return
 
-        logger.info(f"[{self.name}] Starting Download (Large File)...")
+        if headers:
+            logger.info(f"[{self.name}] Checking whether {filename} changed on the server...")
+        else:
+            logger.info(f"[{self.name}] Starting Download (Large File)...")
         logger.info(f"[{self.name}] URL: {self.base_url}")
+        # Download to a .part file and rename it into place once complete, so an
+        # interrupted download is never mistaken for a finished one on the next run
+        part_file = filename.with_name(filename.name + ".part")
         try:
-            async with self.session.get(self.base_url) as response:
-                if response.status == 200:
-                    with open(filename, 'wb') as f:
-                        # Download in chunks to save RAM
+            async with self.session.get(self.base_url, headers=headers) as response:
+                if response.status == 304:
+                    logger.info(f"[{self.name}] File {filename} is unchanged on the server. Skipping download.")
+                elif response.status == 200:
+                    digest = hashlib.blake2b()
+                    with open(part_file, 'wb') as f:
+                        # Download in chunks to save RAM, hashing as we go
                         async for chunk in response.content.iter_chunked(1024*1024):
                             f.write(chunk)
-                    logger.info(f"[{self.name}] Download Complete.")
+                            digest.update(chunk)
+                    content_hash = digest.hexdigest()
+                    # Servers that ignore the validators resend identical bytes; keep the
+                    # existing file (and its mtime) rather than rewriting it
+                    if validators.get("blake2b") == content_hash and filename.exists():
+                        logger.info(f"[{self.name}] Downloaded content matches {filename}. Keeping existing file.")
+                    else:
+                        os.replace(part_file, filename)
+                        logger.info(f"[{self.name}] Download Complete.")
+                    meta_file.write_text(json.dumps({
+                        "url": self.base_url,
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                        "blake2b": content_hash,
+                    }), encoding='utf-8')
                 elif response.status == 404:
                     logger.warning(f"[{self.name}] File not found (404). URL may be outdated or file may not exist.")
                     logger.warning(f"[{self.name}] Skipping download. You may need to manually download from the source website.")
@@ -831,6 +986,9 @@ class BulkFileDownloader(DataSource):
         except Exception as e:
             logger.error(f"[{self.name}] Download Error: {e}")
             logger.warning(f"[{self.name}] Continuing with other scrapers...")
+        finally:
+            if part_file.exists():
+                part_file.unlink()
 
 # ==========================================
 # 4. MAIN ORCHESTRATOR
@@ -852,18 +1010,22 @@ async def main():
         BulkFileDownloader("FDA_MAUDE_2024", "https://www.accessdata.fda.gov/MAUDE/ftparea/mdrfoi-2024.zip")
     ]
 
-    # Create shared session
-    async with aiohttp.ClientSession() as session:
+    # Wrap each job to handle errors gracefully
+    async def safe_run(job):
+        try:
+            await job.run()
+        except Exception as e:
+            logger.error(f"[{job.name}] Fatal error: {e}", exc_info=True)
+            logger.warning(f"[{job.name}] Continuing with other scrapers...")
+        finally:
+            job.close()
+
+    # Create shared session; the connector caps open connections per host
+    connector = aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENCY_PER_HOST)
+    async with aiohttp.ClientSession(connector=connector) as session:
         tasks = []
         for job in jobs:
             job.session = session
-            # Wrap each task to handle errors gracefully
-            async def safe_run(job):
-                try:
-                    await job.run()
-                except Exception as e:
-                    logger.error(f"[{job.name}] Fatal error: {e}", exc_info=True)
-                    logger.warning(f"[{job.name}] Continuing with other scrapers...")
             tasks.append(safe_run(job))
 
         logger.info(f"🚀 STARTING GLOBAL FRAUD SCRAPER WITH {len(jobs)} JOBS...")
@@ -5,36 +5,55 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
+import gzip
+import hashlib
+import importlib.util
 import json
+import mmap
+import os
+import queue
 import re
 import sys
+import threading
 import time
-import re
-from typing import Optional
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-try:
-    import tomllib  # Python 3.11+
-except ModuleNotFoundError:  # pragma: no cover
-    import tomli as tomllib  # type: ignore
+if TYPE_CHECKING:
+    import requests
+    from urllib3.util.retry import Retry
 
-import requests
+# requests, tomllib and the investigators are imported where they are first
+# used, so quick flows such as --list-models and --rebuild-manifest start fast.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 try:
     import sqlite3
     SQLITE_AVAILABLE = True
 except ImportError:
     SQLITE_AVAILABLE = False
 
-# Import investigation functions
-try:
-    from clinical_investigator import investigate_lead as investigate_lead_standard
-    from clinical_investigator_optimized import investigate_lead as investigate_lead_optimized
-    INVESTIGATION_AVAILABLE = True
-except ImportError:
-    INVESTIGATION_AVAILABLE = False
-    investigate_lead_standard = None
-    investigate_lead_optimized = None
+# Investigation modules are only probed here; load_investigator() imports them
+INVESTIGATION_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None
+    for name in ("clinical_investigator", "clinical_investigator_optimized")
+)
+
+
+def load_investigator(optimized: bool) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Import and return the standard or optimized investigate_lead function."""
+    if optimized:
+        from clinical_investigator_optimized import investigate_lead
+    else:
+        from clinical_investigator import investigate_lead
+    return investigate_lead
 
 
 try:
@@ -156,6 +175,64 @@ OUTPUT FORMAT (JSON):
 DEFAULT_SYSTEM_PROMPT = SCIENTIFIC_FRAUD_RANKING_PROMPT
 
 
+def build_retry() -> Retry:
+    """Retry policy for model/server requests: jittered exponential backoff on transient errors.
+
+    Read timeouts are not retried (a hung request would otherwise hold a worker
+    for several full timeouts), and the last error response is returned rather
+    than raised so call_model can report the server's error body.
+    """
+    from urllib3.util.retry import Retry
+
+    options = dict(
+        total=5,
+        read=0,
+        raise_on_status=False,
+        backoff_factor=0.5,
+        status_forcelist=(408, 429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+        respect_retry_after_header=True,
+    )
+    try:
+        return Retry(**options, backoff_jitter=0.25)
+    except TypeError:  # urllib3 < 2 has no backoff_jitter
+        return Retry(**options)
+
+
+def build_http_session(pool_size: int = 64) -> requests.Session:
+    """Create a keep-alive session with a sized connection pool and transient-error retries."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=build_retry(),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared by all worker threads so connections to the model server are reused
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Return the shared session, building it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = build_http_session()
+    return _SESSION
+
+# Request bodies smaller than this are sent uncompressed even with --compress-requests
+_GZIP_MIN_BYTES = 4096
+
+
 # Canonical mappings for fraud types
 FRAUD_TYPE_CANONICAL_MAP = {
     "upcoding": {"upcoding", "up-coding", "code inflation", "billing inflation"},
@@ -174,18 +251,106 @@ PROGRAM_CANONICAL_MAP = {
     "VA": {"va", "veterans affairs", "veterans administration", "department of veterans affairs"},
 }
 
+# Reverse lookups (synonym -> canonical) so canonicalization is a single dict hit
+_FRAUD_REVERSE = {syn: canon for canon, syns in FRAUD_TYPE_CANONICAL_MAP.items() for syn in syns}
+_PROGRAM_REVERSE = {syn: canon for canon, syns in PROGRAM_CANONICAL_MAP.items() for syn in syns}
+
+
+def json_loads(value: Any) -> Any:
+    """Parse JSON text or bytes with orjson when available.
+
+    Anything orjson rejects is re-parsed by the stdlib, which accepts a few
+    extensions (NaN, Infinity) and raises the usual json.JSONDecodeError.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(value)
+
+
+# json.dumps() with non-default options builds a new JSONEncoder per call; reuse one.
+_JSON_ENCODE = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def json_dumps(value: Any) -> str:
+    """Serialize a value to a compact JSON string (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value).decode("utf-8")
+    return _JSON_ENCODE(value)
+
+
+def encode_json_record(record: Dict[str, Any], metadata_fragments: Optional[Dict[str, str]] = None) -> str:
+    """Serialize an output record, splicing pre-encoded JSON values into its metadata."""
+    if not metadata_fragments:
+        return json_dumps(record)
+    metadata = record.get("metadata") or {}
+    body = {key: value for key, value in record.items() if key != "metadata"}
+    metadata_parts = [json_dumps(metadata)[:-1]]
+    separator = "," if metadata else ""
+    for key, fragment in metadata_fragments.items():
+        metadata_parts.append(f"{separator}{json_dumps(key)}:{fragment}")
+        separator = ","
+    metadata_parts.append("}")
+    body_json = json_dumps(body)[:-1]
+    separator = "," if body else ""
+    return f'{body_json}{separator}"metadata":{"".join(metadata_parts)}}}'
+
+
+def encode_json_line(record: Dict[str, Any], metadata_fragments: Optional[Dict[str, str]] = None) -> bytes:
+    """Encode one newline-terminated JSONL record as UTF-8 bytes."""
+    if ORJSON_AVAILABLE and not metadata_fragments:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (encode_json_record(record, metadata_fragments) + "\n").encode("utf-8")
+
+
+def open_append_fd(path: Path, *, truncate: bool = False) -> int:
+    """Open path for O_APPEND writes with os.write, bypassing the stdio buffer."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+    if truncate:
+        flags |= os.O_TRUNC
+    return os.open(path, flags, 0o644)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Replace path with data via a synced temp file, so readers never see a partial file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+
+
+def write_all(fd: int, data: bytes) -> None:
+    """os.write until every byte is written (regular files rarely short-write)."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
 
 def apply_config_defaults(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
     config_path: Path = args.config  # type: ignore[assignment]
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
+    try:
+        import tomllib  # Python 3.11+
+    except ModuleNotFoundError:  # pragma: no cover
+        import tomli as tomllib  # type: ignore
+
     with config_path.open("rb") as handle:
         data = tomllib.load(handle)
+    if not data:
+        return
+    # One pass over the parser's actions instead of a get_default() scan per key
+    defaults = {action.dest: action.default for action in parser._actions}
     for key, value in data.items():
-        if not hasattr(args, key):
+        if key not in defaults or not hasattr(args, key):
             continue
         current = getattr(args, key)
-        default = parser.get_default(key)
+        default = defaults[key]
         if current == default:
             if isinstance(default, Path):
                 setattr(args, key, Path(value))
@@ -277,6 +442,15 @@ def parse_args() -> argparse.Namespace:
         default=Path("data/.qui_tam_checkpoint"),
         help="Plain-text file storing processed filenames (used with --resume).",
     )
+    parser.add_argument(
+        "--checkpoint-flush-every",
+        type=int,
+        default=32,
+        help=(
+            "Flush and fsync the checkpoint after this many completed rows; 1 makes every "
+            "written batch durable immediately (default: 32)."
+        ),
+    )
     parser.add_argument(
         "--known-json",
         action="append",
@@ -301,6 +475,20 @@ def parse_args() -> argparse.Namespace:
         default=Path("data/chunks.json"),
         help="Manifest JSON file listing generated chunks (used by the viewer).",
     )
+    parser.add_argument(
+        "--embed-original-row",
+        action="store_true",
+        help="Embed the full source row (including text) in each JSON record's metadata.",
+    )
+    parser.add_argument(
+        "--original-rows-output",
+        type=Path,
+        default=None,
+        help=(
+            "Append each full source row to this JSONL file and store only its path and byte offset "
+            "(metadata.original_row.ref_file/ref_offset) in the output records. Ignored with --embed-original-row."
+        ),
+    )
     parser.add_argument(
         "--include-action-items",
         action="store_true",
@@ -348,6 +536,19 @@ def parse_args() -> argparse.Namespace:
         default=Path("data/fraud_data.db"),
         help="Path to SQLite database for cross-referencing (default: data/fraud_data.db).",
     )
+    parser.add_argument(
+        "--response-cache",
+        type=Path,
+        default=Path("data/llm_cache.sqlite"),
+        help="SQLite file caching model replies for deterministic runs (default: data/llm_cache.sqlite).",
+    )
+    parser.add_argument(
+        "--no-response-cache",
+        dest="response_cache",
+        action="store_const",
+        const=None,
+        help="Always query the model, bypassing the response cache.",
+    )
     parser.add_argument(
         "--investigate-min-score",
         type=int,
@@ -366,11 +567,61 @@ def parse_args() -> argparse.Namespace:
         action="store_false",
         help="Use standard investigator (more Tavily searches, Sonnet model, slower but potentially more thorough).",
     )
+    parser.add_argument(
+        "--investigate-batch-size",
+        type=int,
+        default=8,
+        help=(
+            "Group up to N concurrently investigated leads (capped at --concurrency) into one "
+            "database prefetch for the optimized investigator; 1 disables batching (default: 8)."
+        ),
+    )
+    parser.add_argument(
+        "--investigate-batch-timeout",
+        type=float,
+        default=2.0,
+        help="Seconds a partial investigation batch waits for more leads before it is sent (default: 2.0).",
+    )
+    parser.add_argument(
+        "--max-text-chars",
+        type=int,
+        default=32000,
+        help="Send at most this many characters of each document to the model (0 = no limit).",
+    )
+    parser.add_argument(
+        "--compress-requests",
+        action="store_true",
+        help="Gzip request bodies over 4 KB (only for servers that accept Content-Encoding: gzip).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help=(
+            "Number of rows sent to the model server concurrently (default: 8). "
+            "Continuous-batching servers (vLLM, llama.cpp) can use 64 or more."
+        ),
+    )
+    parser.add_argument(
+        "--client-batch-size",
+        type=int,
+        default=1,
+        help=(
+            "Submit rows to the server in bursts of K concurrent requests (capped at "
+            "--concurrency) so continuous-batching servers schedule them together (default: 1)."
+        ),
+    )
     parser.add_argument(
         "--sleep",
         type=float,
         default=0.0,
-        help="Seconds to sleep between requests to avoid overwhelming the server.",
+        help="Seconds each worker sleeps between requests to avoid overwhelming the server.",
+    )
+    parser.add_argument(
+        "--log-every",
+        type=int,
+        default=8,
+        help="Flush per-row progress lines to stdout every N lines (default: 8; 1 flushes every line).",
     )
     parser.add_argument(
         "--timeout",
@@ -408,7 +659,8 @@ def parse_args() -> argparse.Namespace:
     )
     args = parser.parse_args()
     config_path = None
-    if args.config:
+    if args.config and args.config != parser.get_default("config"):
+        # Explicit --config: apply_config_defaults reports a missing file
         config_path = Path(args.config)
     else:
         for candidate in (Path("ranker_config.toml"), Path("ranker_config.example.toml")):
@@ -420,18 +672,173 @@ def parse_args() -> argparse.Namespace:
         apply_config_defaults(parser, args)
     return args
 
+# Precompiled patterns for the per-row hot paths
+_FRAUD_SCORE_RE = re.compile(r'FRAUD POTENTIAL SCORE:\s*(\d+)', re.IGNORECASE)
+_NAME_RE = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b')
+_PMID_RE = re.compile(r'PMID[:\s]*(\d{8,})|/(\d{8,})/')
+_NCT_RE = re.compile(r'NCT\d{8}')
+_DOI_RE = re.compile(r'DOI[:\s]*([^\s,]+)|10\.\d{4,}/[^\s,]+')
+_DRUG_RE = re.compile(r'\b([A-Z][a-z]+(?:[a-z]+)?)\s+(?:drug|medication|treatment|therapy)\b')
+_PAREN_RE = re.compile(r"\s*\(.*?\)\s*")
+
+
 def extract_fraud_score_from_text(text: str) -> Optional[int]:
     """Extract fraud potential score from the CSV text field."""
-    match = re.search(r'FRAUD POTENTIAL SCORE:\s*(\d+)', text, re.IGNORECASE)
+    match = _FRAUD_SCORE_RE.search(text)
     if match:
         return int(match.group(1))
     return None
 
 
+# Cross-reference lookups. Each SELECT runs once per candidate term, batched
+# into a single UNION ALL statement per table (see _run_union_lookup).
+_GRANTS_Q = """
+    SELECT project_num, pi_name, org_name, total_cost
+    FROM nih_grants
+    WHERE pi_name_normalized LIKE ? OR org_name LIKE ?
+    LIMIT 5
+"""
+_RETRACTIONS_BY_PMID_Q = """
+    SELECT doi, title, journal
+    FROM retractions
+    WHERE doi LIKE ? OR text_content LIKE ?
+    LIMIT 3
+"""
+_RETRACTIONS_BY_DOI_Q = """
+    SELECT doi, title, journal
+    FROM retractions
+    WHERE doi LIKE ?
+    LIMIT 3
+"""
+_PUBPEER_Q = """
+    SELECT pub_id, title, comment_count, url
+    FROM pubpeer_articles
+    WHERE text_content LIKE ? AND comment_count > 0
+    LIMIT 5
+"""
+_FAERS_Q = """
+    SELECT report_id, drug, reaction
+    FROM fda_faers
+    WHERE drug LIKE ? OR text_content LIKE ?
+    LIMIT 3
+"""
+
+# FTS5 variants, used when etl_loader has built the *_fts shadow tables.
+# Each takes one MATCH expression built by _fts_phrase.
+_GRANTS_FTS_Q = """
+    SELECT g.project_num, g.pi_name, g.org_name, g.total_cost
+    FROM nih_grants_fts JOIN nih_grants g ON g.id = nih_grants_fts.rowid
+    WHERE nih_grants_fts MATCH ?
+    LIMIT 5
+"""
+_RETRACTIONS_BY_PMID_FTS_Q = """
+    SELECT r.doi, r.title, r.journal
+    FROM retractions_fts JOIN retractions r ON r.id = retractions_fts.rowid
+    WHERE retractions_fts MATCH ?
+    LIMIT 3
+"""
+_RETRACTIONS_BY_DOI_FTS_Q = """
+    SELECT r.doi, r.title, r.journal
+    FROM retractions_fts JOIN retractions r ON r.id = retractions_fts.rowid
+    WHERE retractions_fts.doi MATCH ?
+    LIMIT 3
+"""
+_PUBPEER_FTS_Q = """
+    SELECT p.pub_id, p.title, p.comment_count, p.url
+    FROM pubpeer_articles_fts JOIN pubpeer_articles p ON p.id = pubpeer_articles_fts.rowid
+    WHERE pubpeer_articles_fts MATCH ? AND p.comment_count > 0
+    LIMIT 5
+"""
+_FAERS_FTS_Q = """
+    SELECT f.report_id, f.drug, f.reaction
+    FROM fda_faers_fts JOIN fda_faers f ON f.id = fda_faers_fts.rowid
+    WHERE fda_faers_fts MATCH ?
+    LIMIT 3
+"""
+
+# lookup name -> (FTS table, LIKE query, FTS query)
+_XREF_LOOKUPS: Dict[str, Tuple[str, str, str]] = {
+    "grants": ("nih_grants_fts", _GRANTS_Q, _GRANTS_FTS_Q),
+    "retractions_by_pmid": ("retractions_fts", _RETRACTIONS_BY_PMID_Q, _RETRACTIONS_BY_PMID_FTS_Q),
+    "retractions_by_doi": ("retractions_fts", _RETRACTIONS_BY_DOI_Q, _RETRACTIONS_BY_DOI_FTS_Q),
+    "pubpeer": ("pubpeer_articles_fts", _PUBPEER_Q, _PUBPEER_FTS_Q),
+    "faers": ("fda_faers_fts", _FAERS_Q, _FAERS_FTS_Q),
+}
+
+# Per-thread connections (with each database's FTS tables) so workers read in parallel
+_XREF_LOCAL = threading.local()
+
+# Formatted cross-references keyed by (blake2b digest of the text, db path)
+_XREF_CACHE: "OrderedDict[Tuple[bytes, Path], str]" = OrderedDict()
+_XREF_CACHE_SIZE = 4096
+_XREF_CACHE_LOCK = threading.Lock()
+
+
+def _get_xref_connection(db_path: Path) -> Tuple["sqlite3.Connection", Set[str]]:
+    """Return this thread's connection for db_path and the names of its FTS tables."""
+    connections = getattr(_XREF_LOCAL, "connections", None)
+    if connections is None:
+        connections = _XREF_LOCAL.connections = {}
+    cached = connections.get(db_path)
+    if cached is None:
+        # Read-only: the lookups never write, and indexes are created by etl_loader.py
+        conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        fts_tables = {
+            row[0]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+            if row[0].endswith("_fts")
+        }
+        cached = (conn, fts_tables)
+        connections[db_path] = cached
+    return cached
+
+
+def _fts_phrase(term: str) -> str:
+    """Quote a term as a single FTS5 phrase so punctuation can't act as query syntax."""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _run_union_lookup(cursor: Any, select_sql: str, param_sets: List[Tuple[Any, ...]]) -> List[List[Any]]:
+    """Run select_sql once per parameter set as one UNION ALL query.
+
+    Returns the result rows grouped per parameter set, in input order.
+    """
+    if not param_sets:
+        return []
+    query = " UNION ALL ".join(
+        f"SELECT {term_idx} AS term_idx, * FROM ({select_sql})" for term_idx in range(len(param_sets))
+    )
+    cursor.execute(query, [param for params in param_sets for param in params])
+    grouped: List[List[Any]] = [[] for _ in param_sets]
+    for row in cursor.fetchall():
+        grouped[row["term_idx"]].append(row)
+    return grouped
+
+
+def _xref_lookup(
+    cursor: Any,
+    fts_tables: Set[str],
+    lookup: str,
+    terms: List[str],
+    like_params: List[Tuple[str, ...]],
+) -> List[List[Any]]:
+    """Look up every term in one table, via FTS5 MATCH when its index exists, else LIKE.
+
+    like_params holds the prebuilt LIKE parameters for each term, in order.
+    """
+    fts_table, like_sql, fts_sql = _XREF_LOOKUPS[lookup]
+    if fts_table in fts_tables:
+        return _run_union_lookup(cursor, fts_sql, [(_fts_phrase(term),) for term in terms])
+    return _run_union_lookup(cursor, like_sql, like_params)
+
+
 def query_database_cross_references(text: str, db_path: Optional[Path] = None) -> str:
     """
     Query the SQLite database for cross-references related to the current record.
     Returns a formatted string with related data from other sources.
+
+    Results are memoized per text, so duplicate records skip the SQL entirely.
     """
     if not SQLITE_AVAILABLE:
         return ""
@@ -441,118 +848,129 @@ def query_database_cross_references(text: str, db_path: Optional[Path] = None) -
     
     if not db_path.exists():
         return ""
-    
+
+    # PMIDs, DOIs and drug indicators are read from the whole text, so key on all of it
+    key = (hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(), db_path)
+    with _XREF_CACHE_LOCK:
+        cached = _XREF_CACHE.get(key)
+        if cached is not None:
+            _XREF_CACHE.move_to_end(key)
+            return cached
+
+    result = _query_cross_references(text, db_path)
+    if result is None:
+        # A failed lookup (e.g. database is locked) may succeed next time; don't cache it
+        return ""
+
+    with _XREF_CACHE_LOCK:
+        _XREF_CACHE[key] = result
+        if len(_XREF_CACHE) > _XREF_CACHE_SIZE:
+            _XREF_CACHE.popitem(last=False)
+    return result
+
+
+def _query_cross_references(text: str, db_path: Path) -> Optional[str]:
+    """Run the cross-reference lookups for one text and format the matches (None if a query failed)."""
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
         cross_refs = []
         text_lower = text.lower()
         
         # Extract potential entity names (simple heuristic: capitalized words)
         # Look for patterns like "Dr. Smith" or "John Smith" or institution names
-        name_pattern = r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b'
-        potential_names = re.findall(name_pattern, text[:2000])  # First 2000 chars to limit
+        potential_names = _NAME_RE.findall(text[:2000])  # First 2000 chars to limit
         
         # Extract PMIDs
-        pmids = re.findall(r'PMID[:\s]*(\d{8,})|/(\d{8,})/', text)
+        pmids = _PMID_RE.findall(text)
         pmid_list = [pmid[0] or pmid[1] for pmid in pmids if pmid[0] or pmid[1]]
         
         # Extract DOIs
-        dois = re.findall(r'DOI[:\s]*([^\s,]+)|10\.\d{4,}/[^\s,]+', text)
+        dois = _DOI_RE.findall(text)
         doi_list = [doi[0] if isinstance(doi, tuple) else doi for doi in dois if doi]
         
         # Extract drug names (common pattern: drug names often capitalized)
         # This is a heuristic - could be improved
         drug_indicators = ['drug', 'medication', 'treatment', 'therapeutic']
-        
-        # 1. Check for matching NIH Grants (by PI name or institution)
-        for name in potential_names[:10]:  # Limit to avoid too many queries
-            if len(name) < 4 or len(name.split()) > 5:  # Skip very short or very long names
+
+        # Candidate terms per table (limited to avoid oversized queries), with
+        # each "%term%" pattern built once and shared between lookups
+        grant_names: List[str] = []
+        grant_params: List[Tuple[str, ...]] = []
+        pubpeer_names: List[str] = []
+        pubpeer_params: List[Tuple[str, ...]] = []
+        for name in potential_names[:10]:
+            if len(name) < 4:  # Skip very short names
                 continue
-            cursor.execute("""
-                SELECT project_num, pi_name, org_name, total_cost
-                FROM nih_grants
-                WHERE pi_name_normalized LIKE ? OR org_name LIKE ?
-                LIMIT 5
-            """, (f"%{name.lower()}%", f"%{name}%"))
-            grants = cursor.fetchall()
+            like = f"%{name}%"
+            pubpeer_names.append(name)
+            pubpeer_params.append((like,))
+            if len(name.split()) <= 5:  # Skip very long names
+                grant_names.append(name)
+                grant_params.append((like.lower(), like))
+        pmid_terms = pmid_list[:5]
+        doi_terms = doi_list[:5]
+        potential_drugs: List[str] = []
+        if any(indicator in text_lower for indicator in drug_indicators):
+            # Extract potential drug names (heuristic)
+            potential_drugs = _DRUG_RE.findall(text[:1000])[:5]
+
+        conn, fts_tables = _get_xref_connection(db_path)
+        cursor = conn.cursor()
+        grant_hits = _xref_lookup(cursor, fts_tables, "grants", grant_names, grant_params)
+        pmid_hits = _xref_lookup(
+            cursor, fts_tables, "retractions_by_pmid", pmid_terms,
+            [(like, like) for like in (f"%{pmid}%" for pmid in pmid_terms)],
+        )
+        doi_hits = _xref_lookup(
+            cursor, fts_tables, "retractions_by_doi", doi_terms,
+            [(f"%{doi}%",) for doi in doi_terms],
+        )
+        pubpeer_hits = _xref_lookup(cursor, fts_tables, "pubpeer", pubpeer_names, pubpeer_params)
+        faers_hits = _xref_lookup(
+            cursor, fts_tables, "faers", potential_drugs,
+            [(like, like) for like in (f"%{drug}%" for drug in potential_drugs)],
+        )
+
+        # 1. Matching NIH Grants (by PI name or institution)
+        for grants in grant_hits:
             if grants:
                 cross_refs.append(f"\n[CROSS-REFERENCE: NIH GRANTS]")
                 for grant in grants:
                     cost_display = f"${grant['total_cost']:,.0f}" if grant['total_cost'] else "Not specified"
                     cross_refs.append(f"  - Grant {grant['project_num']}: PI={grant['pi_name']}, Org={grant['org_name']}, Amount={cost_display}")
         
-        # 2. Check for retractions (by PMID or DOI)
-        for pmid in pmid_list[:5]:
-            cursor.execute("""
-                SELECT doi, title, journal
-                FROM retractions
-                WHERE doi LIKE ? OR text_content LIKE ?
-                LIMIT 3
-            """, (f"%{pmid}%", f"%{pmid}%"))
-            retractions = cursor.fetchall()
+        # 2. Retractions (by PMID or DOI)
+        for pmid, retractions in zip(pmid_list, pmid_hits):
             if retractions:
                 cross_refs.append(f"\n[CROSS-REFERENCE: RETRACTIONS] (PMID {pmid})")
                 for ret in retractions:
                     cross_refs.append(f"  - Retracted: {ret['title'][:80]}... (Journal: {ret['journal']})")
         
-        for doi in doi_list[:5]:
-            cursor.execute("""
-                SELECT doi, title, journal
-                FROM retractions
-                WHERE doi LIKE ?
-                LIMIT 3
-            """, (f"%{doi}%",))
-            retractions = cursor.fetchall()
+        for doi, retractions in zip(doi_list, doi_hits):
             if retractions:
                 cross_refs.append(f"\n[CROSS-REFERENCE: RETRACTIONS] (DOI {doi})")
                 for ret in retractions:
                     cross_refs.append(f"  - Retracted: {ret['title'][:80]}...")
         
-        # 3. Check PubPeer articles (by institution or author name)
-        for name in potential_names[:10]:
-            if len(name) < 4:
-                continue
-            cursor.execute("""
-                SELECT pub_id, title, comment_count, url
-                FROM pubpeer_articles
-                WHERE text_content LIKE ? AND comment_count > 0
-                LIMIT 5
-            """, (f"%{name}%",))
-            pubpeer = cursor.fetchall()
+        # 3. PubPeer articles (by institution or author name)
+        for pubpeer in pubpeer_hits:
             if pubpeer:
                 cross_refs.append(f"\n[CROSS-REFERENCE: PUBPEER DISCUSSIONS]")
                 for pp in pubpeer:
                     cross_refs.append(f"  - PubPeer {pp['pub_id']}: {pp['title'][:60]}... ({pp['comment_count']} comments)")
         
-        # 4. Check FDA FAERS (by drug name mentions)
-        if any(indicator in text_lower for indicator in drug_indicators):
-            # Extract potential drug names (heuristic)
-            drug_pattern = r'\b([A-Z][a-z]+(?:[a-z]+)?)\s+(?:drug|medication|treatment|therapy)\b'
-            potential_drugs = re.findall(drug_pattern, text[:1000])
-            for drug in potential_drugs[:5]:
-                cursor.execute("""
-                    SELECT report_id, drug, reaction
-                    FROM fda_faers
-                    WHERE drug LIKE ? OR text_content LIKE ?
-                    LIMIT 3
-                """, (f"%{drug}%", f"%{drug}%"))
-                faers = cursor.fetchall()
-                if faers:
-                    cross_refs.append(f"\n[CROSS-REFERENCE: FDA ADVERSE EVENTS] (Drug: {drug})")
-                    for fda in faers:
-                        cross_refs.append(f"  - Report {fda['report_id']}: {fda['drug'][:50]}... → {fda['reaction'][:50]}")
-        
-        conn.close()
+        # 4. FDA FAERS (by drug name mentions)
+        for drug, faers in zip(potential_drugs, faers_hits):
+            if faers:
+                cross_refs.append(f"\n[CROSS-REFERENCE: FDA ADVERSE EVENTS] (Drug: {drug})")
+                for fda in faers:
+                    cross_refs.append(f"  - Report {fda['report_id']}: {fda['drug'][:50]}... → {fda['reaction'][:50]}")
         
         if cross_refs:
             return "\n" + "="*80 + "\nCROSS-REFERENCED DATA FROM DATABASE:\n" + "="*80 + "\n".join(cross_refs) + "\n" + "="*80 + "\n"
         
     except Exception as e:
-        # If database query fails, silently continue without cross-references
-        pass
+        # If database query fails, continue without cross-references for this row
+        return None
     
     return ""
 
@@ -606,6 +1024,94 @@ def load_system_prompt(args: argparse.Namespace) -> Tuple[str, str]:
     return prompt, str(prompt_file)
 
 
+def _cache_key(
+    *,
+    model: str,
+    system_prompt: str,
+    user_content: str,
+    temperature: float,
+    reasoning_effort: Optional[str],
+) -> str:
+    """Hash every request input that can change the model's reply."""
+    material = json.dumps(
+        {
+            "model": model,
+            "system_prompt": system_prompt,
+            "user_content": user_content,
+            "temperature": temperature,
+            "reasoning_effort": reasoning_effort,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed store of model replies, shared by all worker threads."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, response_json TEXT NOT NULL, ts INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response_json FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, response_json: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, response_json, ts) VALUES (?, ?, ?)",
+                (key, response_json, int(time.time())),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_USER_CONTENT_SLOT = "\x00user-content\x00"
+
+
+@functools.lru_cache(maxsize=16)
+def _request_body_template(
+    model: str,
+    temperature: float,
+    system_prompt: str,
+    reasoning_effort: Optional[str],
+    config_metadata_json: Optional[str],
+) -> Tuple[bytes, bytes]:
+    """Encode everything but the user message once; the message goes between the two halves."""
+    payload: Dict[str, Any] = {
+        "model": model,
+        "temperature": temperature,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {
+                "role": "user",
+                "content": _USER_CONTENT_SLOT,
+            },
+        ],
+    }
+    if reasoning_effort:
+        payload["reasoning"] = {"effort": reasoning_effort}
+    body = json_dumps(payload)
+    if config_metadata_json:
+        body = f'{body[:-1]},"metadata":{config_metadata_json}}}'
+    prefix, suffix = body.split(json_dumps(_USER_CONTENT_SLOT), 1)
+    return prefix.encode("utf-8"), suffix.encode("utf-8")
+
+
 def call_model(
     *,
     endpoint: str,
@@ -618,19 +1124,33 @@ def call_model(
     temperature: float,
     reasoning_effort: Optional[str],
     config_metadata: Optional[Dict[str, Any]] = None,
+    config_metadata_json: Optional[str] = None,
     db_path: Optional[Path] = None,
     enable_cross_reference: bool = True,
+    session: Optional[requests.Session] = None,
+    cache: Optional[ResponseCache] = None,
+    max_text_chars: Optional[int] = None,
+    compress_request: bool = False,
 ) -> Dict[str, Any]:
     """Send the document to the local GPT server and return parsed JSON.
     
     Args:
+        config_metadata_json: Pre-encoded config_metadata; saves re-encoding it for every request
         enable_cross_reference: If True, queries database for related records and includes in analysis
+        session: HTTP session to send the request with (defaults to the shared keep-alive session)
+        cache: Response cache consulted before POSTing; only used for deterministic (temperature 0) runs
+        max_text_chars: If set, only the first N characters of the document are sent to the model
+        compress_request: Gzip request bodies over 4 KB (the server must accept Content-Encoding: gzip)
     """
     # Get cross-reference data if enabled
     cross_ref_data = ""
     if enable_cross_reference and db_path:
         cross_ref_data = query_database_cross_references(text, db_path)
     
+    document = text.strip()
+    if max_text_chars and len(document) > max_text_chars:
+        document = document[:max_text_chars]
+
     # Build user message with cross-reference context
     user_content_parts = [
         "Analyze the following scientific article or abstract and respond with the JSON schema ",
@@ -638,7 +1158,7 @@ def call_model(
         "",
         f"Article ID: {filename}",
         "--------",
-        text.strip(),
+        document,
         "--------"
     ]
     
@@ -659,42 +1179,54 @@ def call_model(
             "Score based on the combination of the article itself AND these cross-references."
         ])
     
-    payload = {
-        "model": model,
-        "temperature": temperature,
-        "messages": [
-            {"role": "system", "content": system_prompt},
-            {
-                "role": "user",
-                "content": "\n".join(user_content_parts),
-            },
-        ],
-    }
-    if reasoning_effort:
-        payload["reasoning"] = {"effort": reasoning_effort}
+    user_content = "\n".join(user_content_parts)
+
+    cache_key = None
+    if cache is not None and temperature <= 0:
+        cache_key = _cache_key(
+            model=model,
+            system_prompt=system_prompt,
+            user_content=user_content,
+            temperature=temperature,
+            reasoning_effort=reasoning_effort,
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return ensure_json_dict(cached)
 
     # Include config metadata in the request if provided
-    if config_metadata:
-        payload["metadata"] = config_metadata
+    if config_metadata_json is None and config_metadata:
+        config_metadata_json = json_dumps(config_metadata)
+    prefix, suffix = _request_body_template(
+        model, temperature, system_prompt, reasoning_effort, config_metadata_json
+    )
 
-    headers = {}
+    headers = {"Connection": "keep-alive", "Content-Type": "application/json"}
     if api_key:
         headers["Authorization"] = f"Bearer {api_key}"
 
+    body = prefix + json_dumps(user_content).encode("utf-8") + suffix
+    if compress_request and len(body) > _GZIP_MIN_BYTES:
+        body = gzip.compress(body)
+        headers["Content-Encoding"] = "gzip"
+
     url = f"{endpoint.rstrip('/')}/chat/completions"
-    response = requests.post(url, json=payload, timeout=timeout, headers=headers)
-    try:
-        response.raise_for_status()
-    except requests.HTTPError as exc:  # noqa: PERF203
+    # Transient failures (408/429/5xx) are retried inside the session's adapter;
+    # a non-retryable status or the last retried one reaches this check.
+    response = (session or get_http_session()).post(url, data=body, timeout=timeout, headers=headers)
+    if response.status_code >= 400:
         snippet = response.text[:500].replace("\n", " ")
-        raise RuntimeError(f"HTTP {response.status_code} from {url}: {snippet}") from exc
-    data = response.json()
+        raise RuntimeError(f"HTTP {response.status_code} from {url}: {snippet}")
+    data = json_loads(response.content)
     try:
         content = data["choices"][0]["message"]["content"]
     except (KeyError, IndexError) as exc:
         raise RuntimeError(f"Unexpected response format: {data}") from exc
 
-    return ensure_json_dict(content)
+    parsed = ensure_json_dict(content)
+    if cache_key is not None:
+        cache.put(cache_key, content)
+    return parsed
 
 
 def ensure_json_dict(content: str) -> Dict[str, Any]:
@@ -705,26 +1237,89 @@ def ensure_json_dict(content: str) -> Dict[str, Any]:
 
     # Try direct JSON parse first.
     try:
-        parsed = json.loads(candidate)
+        parsed = json_loads(candidate)
     except json.JSONDecodeError:
         start = candidate.find("{")
         end = candidate.rfind("}")
         if start == -1 or end == -1 or start >= end:
             raise
-        parsed = json.loads(candidate[start : end + 1])
+        parsed = json_loads(candidate[start : end + 1])
 
     if not isinstance(parsed, dict):
         raise TypeError(f"Expected a JSON object, received: {type(parsed)}")
     return parsed
 
 
+def _column_indexes(header: List[str]) -> Tuple[int, int]:
+    """Resolve the (filename, text) column positions from a CSV header row."""
+    try:
+        return header.index("filename"), header.index("text")
+    except ValueError:
+        raise ValueError("Input CSV must contain 'filename' and 'text' columns.") from None
+
+
 def iter_rows(path: Path) -> Iterable[Dict[str, str]]:
+    """Yield {"filename", "text"} for each CSV row, skipping DictReader's per-row dicts."""
     with path.open(newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
+            return
+        filename_idx, text_idx = _column_indexes(header)
         for row in reader:
-            if "text" not in row or "filename" not in row:
-                raise ValueError("Input CSV must contain 'filename' and 'text' columns.")
-            yield row
+            if not row:
+                continue
+            # Short rows yield "" for missing columns instead of raising IndexError
+            yield {
+                "filename": row[filename_idx] if filename_idx < len(row) else "",
+                "text": row[text_idx] if text_idx < len(row) else "",
+            }
+
+
+def read_original_row(path: Path, offset: int) -> Optional[Dict[str, Any]]:
+    """Read the source row stored at offset (metadata.original_row.ref_offset) in an --original-rows-output file."""
+    with path.open("rb") as handle:
+        handle.seek(offset)
+        line = handle.readline()
+    if not line.strip():
+        return None
+    return json_loads(line)
+
+
+def source_row_texts(path: Path, indexes: Iterable[int]) -> Dict[int, str]:
+    """Map source_row_index -> text for the given input CSV rows, stopping once all are found."""
+    wanted = set(indexes)
+    texts: Dict[int, str] = {}
+    if not wanted:
+        return texts
+    for idx, row in enumerate(iter_rows(path), start=1):
+        if idx in wanted:
+            texts[idx] = row["text"]
+            if len(texts) == len(wanted):
+                break
+    return texts
+
+
+def original_row_text(metadata: Dict[str, Any], source_csv: Optional[Path] = None) -> str:
+    """Source text for an output record's metadata, wherever the run stored it.
+
+    Records carry the text inline only with --embed-original-row. Otherwise
+    original_row holds a ref_file/ref_offset pair (--original-rows-output), or
+    just the filename, in which case the row is read back from source_csv by
+    source_row_index.
+    """
+    original = metadata.get("original_row") or {}
+    if original.get("text"):
+        return original["text"]
+    ref_file, ref_offset = original.get("ref_file"), original.get("ref_offset")
+    if ref_file and ref_offset is not None and Path(ref_file).exists():
+        stored = read_original_row(Path(ref_file), int(ref_offset))
+        if stored and stored.get("text"):
+            return stored["text"]
+    source_row_index = metadata.get("source_row_index")
+    if source_csv and source_row_index is not None and source_csv.exists():
+        return source_row_texts(source_csv, [int(source_row_index)]).get(int(source_row_index), "")
+    return ""
 
 
 def load_checkpoint(path: Optional[Path]) -> Set[str]:
@@ -739,20 +1334,34 @@ def load_checkpoint(path: Optional[Path]) -> Set[str]:
     return completed
 
 
+# Output records start with their top-level "filename", so the first match is the one we want
+_FILENAME_RE = re.compile(rb'"filename"\s*:\s*"([^"\\]*(?:\\.[^"\\]*)*)"')
+
+
 def load_jsonl_filenames(path: Optional[Path]) -> Set[str]:
+    """Collect the "filename" of every record, without fully parsing each line."""
     completed: Set[str] = set()
     if not path or not path.exists():
         return completed
-    with path.open(encoding="utf-8") as handle:
+    with path.open("rb") as handle:
         for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                record = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            filename = record.get("filename")
+            match = _FILENAME_RE.search(line)
+            if match:
+                raw = match.group(1)
+                if b"\\" in raw:
+                    # Let the JSON decoder handle escape sequences
+                    filename = json.loads(b'"' + raw + b'"')
+                else:
+                    filename = raw.decode("utf-8")
+            else:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                filename = record.get("filename") if isinstance(record, dict) else None
             if filename:
                 completed.add(filename)
     return completed
@@ -769,14 +1378,14 @@ def ensure_list(value: Any) -> List[str]:
     return [str(value)]
 
 
-def canonicalize_from_map(value: str, mapping: Dict[str, Set[str]], *, title_case: bool = False, upper_case: bool = False) -> Optional[str]:
+def canonicalize_from_map(value: str, reverse: Dict[str, str], *, title_case: bool = False, upper_case: bool = False) -> Optional[str]:
+    """Map value to its canonical name via a synonym -> canonical dict (e.g. _FRAUD_REVERSE)."""
     cleaned = " ".join(value.strip().split())
     if not cleaned:
         return None
-    lookup = cleaned.lower()
-    for canonical, synonyms in mapping.items():
-        if lookup in synonyms:
-            return canonical if not upper_case else canonical.upper()
+    canonical = reverse.get(cleaned.lower())
+    if canonical:
+        return canonical if not upper_case else canonical.upper()
     if upper_case:
         return cleaned.upper()
     if title_case:
@@ -789,7 +1398,7 @@ def normalize_fraud_types(values: List[str]) -> List[str]:
     normalized: List[str] = []
     seen: Set[str] = set()
     for value in values:
-        canonical = canonicalize_from_map(value, FRAUD_TYPE_CANONICAL_MAP, title_case=False)
+        canonical = canonicalize_from_map(value, _FRAUD_REVERSE, title_case=False)
         if not canonical:
             continue
         canonical = canonical.lower()
@@ -801,35 +1410,49 @@ def normalize_fraud_types(values: List[str]) -> List[str]:
 
 def normalize_programs(values: List[str]) -> List[str]:
     """Normalize federal program names."""
+    if not values:
+        return []
+    # Program lists repeat heavily across rows ("NIH", "CDC", ...), so results are memoized
+    return list(_normalize_programs_cached(tuple(values)))
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_programs_cached(values: Tuple[str, ...]) -> Tuple[str, ...]:
     normalized: List[str] = []
     seen: Set[str] = set()
     for value in values:
-        canonical = canonicalize_from_map(value, PROGRAM_CANONICAL_MAP, upper_case=False)
+        canonical = canonicalize_from_map(value, _PROGRAM_REVERSE, upper_case=False)
         if not canonical:
             continue
         canonical = canonical.strip()
         if canonical not in seen:
             normalized.append(canonical)
             seen.add(canonical)
-    return normalized
+    return tuple(normalized)
 
 
 def clean_entity_label(value: str) -> str:
     cleaned = " ".join(value.strip().split())
     if not cleaned:
         return ""
-    cleaned = re.sub(r"\s*\(.*?\)\s*", " ", cleaned)
+    cleaned = _PAREN_RE.sub(" ", cleaned)
     for delimiter in (" - ", " – ", " — "):
         if delimiter in cleaned:
             cleaned = cleaned.split(delimiter, 1)[0]
     return " ".join(cleaned.split())
 
 
+@functools.lru_cache(maxsize=8192)
+def _clean_text_value(value: str, strip_descriptor: bool) -> str:
+    """Whitespace-normalize one list entry (memoized: entity names recur across rows)."""
+    return clean_entity_label(value) if strip_descriptor else " ".join(value.strip().split())
+
+
 def normalize_text_list(values: List[str], *, strip_descriptor: bool = False) -> List[str]:
     normalized: List[str] = []
     seen: Set[str] = set()
     for value in values:
-        cleaned = clean_entity_label(value) if strip_descriptor else " ".join(value.strip().split())
+        cleaned = _clean_text_value(value, strip_descriptor)
         if not cleaned:
             continue
         if cleaned not in seen:
@@ -838,11 +1461,94 @@ def normalize_text_list(values: List[str], *, strip_descriptor: bool = False) ->
     return normalized
 
 
+def normalize_text_lists_bulk(
+    groups: List[List[str]],
+    *,
+    strip_descriptor: Optional[List[bool]] = None,
+) -> List[List[str]]:
+    """Normalize several lists in one pass; de-duplication is scoped to each list.
+
+    Equivalent to calling normalize_text_list on every group, with
+    strip_descriptor giving the per-group flag (default False).
+    """
+    flags = strip_descriptor or [False] * len(groups)
+    normalized: List[List[str]] = [[] for _ in groups]
+    seen: Set[Tuple[int, str]] = set()
+    for index, value in ((i, v) for i, group in enumerate(groups) for v in group):
+        cleaned = _clean_text_value(value, flags[index])
+        if not cleaned:
+            continue
+        key = (index, cleaned)
+        if key not in seen:
+            normalized[index].append(cleaned)
+            seen.add(key)
+    return normalized
+
+
+@contextmanager
+def _mmap_csv_reader(path: Path) -> Iterator[Iterator[List[str]]]:
+    """Yield a csv.reader over a read-only memory map of path.
+
+    Used for the whole-file scans done before processing starts, where
+    lines are pulled straight from the page cache without text-mode buffering.
+    """
+    with path.open("rb") as handle:
+        if path.stat().st_size == 0:
+            yield iter(())
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield csv.reader(line.decode("utf-8") for line in iter(mapped.readline, b""))
+
+
+_LINE_COUNT_BLOCK = 1 << 20
+
+
+def count_jsonl_lines(path: Path) -> int:
+    """Number of records in a JSONL file (0 if it does not exist)."""
+    try:
+        handle = path.open("rb", buffering=0)
+    except FileNotFoundError:
+        return 0
+    count = 0
+    last = b"\n"
+    with handle:
+        while block := handle.read(_LINE_COUNT_BLOCK):
+            count += block.count(b"\n")
+            last = block[-1:]
+    # A final record without a trailing newline still counts
+    return count + (last != b"\n")
+
+
 def count_total_csv_rows(path: Path) -> int:
-    """Count total number of data rows in the CSV (excluding header)."""
-    with path.open(newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        return sum(1 for _ in reader)
+    """Count data rows in the CSV (excluding header); JSONL files count one row per line.
+
+    Counts record-ending newlines in raw 1 MiB blocks with bytes.count
+    instead of parsing fields. A newline ends a record only when an even
+    number of quote characters precedes it (escaped quotes come in pairs),
+    so newlines embedded in quoted text are not counted; blocks without any
+    quote take the plain bytes.count path. Blank lines count as rows, so
+    the result is an upper bound for the metadata it feeds.
+    """
+    if path.suffix == ".jsonl":
+        return count_jsonl_lines(path)
+    records = 0
+    in_quotes = False
+    last = b"\n"
+    with path.open("rb", buffering=0) as handle:
+        while block := handle.read(_LINE_COUNT_BLOCK):
+            last = block[-1:]
+            if not in_quotes and b'"' not in block:
+                records += block.count(b"\n")
+                continue
+            *lines, tail = block.split(b"\n")
+            for line in lines:
+                in_quotes ^= line.count(b'"') & 1 == 1
+                if not in_quotes:
+                    records += 1
+            in_quotes ^= tail.count(b'"') & 1 == 1
+    if last != b"\n":
+        records += 1  # final record without a trailing newline
+    return max(records - 1, 0)
 
 
 def calculate_workload(
@@ -852,23 +1558,45 @@ def calculate_workload(
     completed_filenames: Set[str],
     start_row: int,
     end_row: Optional[int],
+    count_dataset_rows: bool = False,
 ) -> Dict[str, int]:
+    """Count rows in the requested range and how many are already done.
+
+    With count_dataset_rows, the same pass keeps reading to the end of the
+    file and also reports "dataset_rows" (replacing a count_total_csv_rows pass).
+    """
     total = 0
     already_done = 0
-    with path.open(newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        for idx, row in enumerate(reader, start=1):
+    dataset_rows = 0
+    in_range = True
+    with _mmap_csv_reader(path) as reader:
+        header = next(reader, None)
+        filename_idx = _column_indexes(header)[0] if header is not None else 0
+        for row in reader:
+            if not row:
+                continue
+            dataset_rows += 1
+            if not in_range:
+                continue
+            idx = dataset_rows
             if idx < start_row:
                 continue
             if end_row is not None and idx > end_row:
-                break
-            total += 1
-            if completed_filenames and row.get("filename") in completed_filenames:
-                already_done += 1
-            if max_rows is not None and total >= max_rows:
+                in_range = False
+            else:
+                total += 1
+                filename = row[filename_idx] if filename_idx < len(row) else ""
+                if completed_filenames and filename in completed_filenames:
+                    already_done += 1
+                if max_rows is not None and total >= max_rows:
+                    in_range = False
+            if not in_range and not count_dataset_rows:
                 break
     workload = max(0, total - already_done)
-    return {"total": total, "already_done": already_done, "workload": workload}
+    stats = {"total": total, "already_done": already_done, "workload": workload}
+    if count_dataset_rows:
+        stats["dataset_rows"] = dataset_rows
+    return stats
 
 
 def format_duration(seconds: float) -> str:
@@ -878,6 +1606,12 @@ def format_duration(seconds: float) -> str:
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 
+# Last ETA string and when it was computed; format_eta reuses it for up to a second
+_ETA_CACHE: Dict[str, Any] = {"t": 0.0, "msg": ""}
+_ETA_REFRESH_SECONDS = 1.0
+_SECONDS_PER_HOUR = 3600.0
+
+
 def format_eta(
     start_time: float,
     processed: int,
@@ -889,7 +1623,10 @@ def format_eta(
         return ""
     if processed == 0:
         return "(ETA estimating...)"
-    elapsed = time.monotonic() - start_time
+    now = time.monotonic()
+    if _ETA_CACHE["msg"] and now - _ETA_CACHE["t"] < _ETA_REFRESH_SECONDS:
+        return _ETA_CACHE["msg"]
+    elapsed = now - start_time
     if elapsed <= 0:
         return "(ETA --:--:--)"
     rate = processed / elapsed
@@ -899,30 +1636,58 @@ def format_eta(
     eta_seconds = remaining / rate if rate else 0
 
     # Base ETA message
-    eta_msg = f"(ETA {format_duration(eta_seconds)})"
+    eta_parts = [f"(ETA {format_duration(eta_seconds)})"]
 
     # Add energy/cost estimates if available
     if power_watts is not None and electric_rate is not None:
-        total_estimated_hours = (elapsed + eta_seconds) / 3600
-        energy_cost = calculate_energy_cost(power_watts, electric_rate, total_estimated_hours)
-        if energy_cost:
-            eta_msg += f" | Est. total: {energy_cost['energy_kwh']:.2f} kWh / ${energy_cost['cost_usd']:.2f}"
-
+        total_estimated_hours = (elapsed + eta_seconds) / _SECONDS_PER_HOUR
+        if total_estimated_hours > 0:
+            energy_kwh = power_watts * total_estimated_hours / 1000.0
+            eta_parts.append(f"| Est. total: {energy_kwh:.2f} kWh / ${energy_kwh * electric_rate:.2f}")
+    eta_msg = " ".join(eta_parts)
+
+    _ETA_CACHE["t"] = now
+    _ETA_CACHE["msg"] = eta_msg
     return eta_msg
 
 
 class OutputRouter:
-    def __init__(self, args: argparse.Namespace, fieldnames: List[str]):
+    FSYNC_EVERY = 64
+    # Closed chunks are appended to the manifest log at once; the full manifest
+    # is rewritten at most this often (and always on close()).
+    MANIFEST_MIN_INTERVAL = 60.0
+    # Large enough that a full writer batch of CSV rows goes out in one syscall
+    CSV_BUFFER_BYTES = 1 << 20
+
+    def __init__(
+        self,
+        args: argparse.Namespace,
+        fieldnames: List[str],
+        config_metadata: Optional[Dict[str, Any]] = None,
+    ):
         self.args = args
         self.fieldnames = fieldnames
+        # Config metadata is identical for every row, so encode it once up front.
+        self.config_json = json_dumps(config_metadata) if config_metadata is not None else None
         self.chunk_size = max(0, args.chunk_size)
         self.mode = "chunk" if self.chunk_size > 0 else "single"
         self.include_action_items = args.include_action_items
         self.csv_handle = None
-        self.json_handle = None
+        self.json_fd: Optional[int] = None
+        # Records written since the last fsync of json_fd / flush of csv_handle
+        self._unsynced = 0
+        self._rows_since_flush = 0
         self.csv_writer = None
         self.current_chunk: Optional[Tuple[int, int]] = None
         self.current_json_path: Optional[Path] = None
+        self.current_json_posix: Optional[str] = None
+        # Full source rows kept out of line (--original-rows-output); records store their offset
+        self.original_rows_fd: Optional[int] = None
+        self._original_rows_offset = 0
+        if args.original_rows_output and not args.embed_original_row:
+            args.original_rows_output.parent.mkdir(parents=True, exist_ok=True)
+            self.original_rows_fd = open_append_fd(args.original_rows_output)
+            self._original_rows_offset = os.lseek(self.original_rows_fd, 0, os.SEEK_END)
         if self.mode == "single":
             self._init_single()
         else:
@@ -932,30 +1697,44 @@ class OutputRouter:
         # Append if files exist, otherwise create new files
         csv_mode = "a" if self.args.output.exists() else "w"
         self.args.output.parent.mkdir(parents=True, exist_ok=True)
-        self.csv_handle = self.args.output.open(csv_mode, newline="", encoding="utf-8")
+        self.csv_handle = self.args.output.open(
+            csv_mode, newline="", encoding="utf-8", buffering=self.CSV_BUFFER_BYTES
+        )
         self.csv_writer = csv.DictWriter(self.csv_handle, fieldnames=self.fieldnames)
         if csv_mode == "w":
             self.csv_writer.writeheader()
-        json_mode = "a" if self.args.json_output.exists() else "w"
         self.args.json_output.parent.mkdir(parents=True, exist_ok=True)
-        self.json_handle = self.args.json_output.open(json_mode, encoding="utf-8")
+        # O_APPEND|O_CREAT appends to an existing file or creates a new one
+        self.json_fd = open_append_fd(self.args.json_output)
 
     def _init_chunk_state(self) -> None:
         self.chunk_dir: Path = self.args.chunk_dir
         self.chunk_dir.mkdir(parents=True, exist_ok=True)
         self.chunk_manifest: Path = self.args.chunk_manifest
-        self.manifest_entries = self._load_manifest()
+        # Append-only sidecar: one JSON line per chunk closed since the last full manifest write
+        self.manifest_log: Path = self.chunk_manifest.with_name(self.chunk_manifest.name + ".log")
         self.manifest_dirty = False
+        self.manifest_entries = self._load_manifest()
+        # Lines per chunk file, kept in step with writes so the manifest never rescans files
+        self._chunk_row_counts: Dict[Tuple[int, int], int] = {
+            key: entry["row_count"]
+            for key, entry in self.manifest_entries.items()
+            if isinstance(entry.get("row_count"), int)
+        }
+        self._manifest_written_at = 0.0
         self.total_dataset_rows = None  # Will be set by main()
+        # Chunk files opened by this process; reopening them never needs the existence checks.
+        self._created_paths: Set[Path] = set()
 
     def _load_manifest(self) -> Dict[Tuple[int, int], Dict[str, Any]]:
-        if not self.chunk_manifest.exists():
-            return {}
-        try:
-            with self.chunk_manifest.open(encoding="utf-8") as handle:
-                data = json.load(handle)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {}
+        chunk_list: List[Any] = []
+        data = None
+        if self.chunk_manifest.exists():
+            try:
+                with self.chunk_manifest.open(encoding="utf-8") as handle:
+                    data = json.load(handle)
+            except (json.JSONDecodeError, FileNotFoundError):
+                data = None
 
         # Handle both old format (array) and new format (object with chunks)
         if isinstance(data, list):
@@ -964,29 +1743,91 @@ class OutputRouter:
         elif isinstance(data, dict) and "chunks" in data:
             # New format: object with metadata and chunks
             chunk_list = data["chunks"]
-        else:
-            return {}
+
+        # Chunks closed after the last full manifest write (later lines win)
+        if self.manifest_log.exists():
+            with self.manifest_log.open("rb") as handle:
+                for line in handle:
+                    try:
+                        chunk_list.append(json_loads(line))
+                    except json.JSONDecodeError:
+                        continue  # torn final line from a crash
 
         entries: Dict[Tuple[int, int], Dict[str, Any]] = {}
         for entry in chunk_list:
+            if not isinstance(entry, dict):
+                continue
             key = (entry.get("start_row"), entry.get("end_row"))
             if not isinstance(key[0], int) or not isinstance(key[1], int):
                 continue
             entries[key] = entry
+        if self.manifest_log.exists():
+            self.manifest_dirty = True
         return entries
 
-    def write(self, row_idx: int, csv_row: Dict[str, Any], json_record: Dict[str, Any]) -> None:
+    def _append_manifest_log(self, entry: Dict[str, Any]) -> None:
+        self.manifest_log.parent.mkdir(parents=True, exist_ok=True)
+        fd = open_append_fd(self.manifest_log)
+        try:
+            write_all(fd, encode_json_line(entry))
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def write(
+        self,
+        row_idx: int,
+        json_record: Dict[str, Any],
+        csv_row: Optional[Dict[str, Any]] = None,
+        metadata_fragments: Optional[Dict[str, str]] = None,
+        original_row: Optional[bytes] = None,
+    ) -> None:
+        """Write one result; metadata_fragments holds pre-serialized JSON spliced into metadata.
+
+        original_row is the encoded source row line for --original-rows-output.
+        """
+        if original_row is not None and self.original_rows_fd is not None:
+            json_record["metadata"]["original_row"]["ref_offset"] = self._original_rows_offset
+            write_all(self.original_rows_fd, original_row)
+            self._original_rows_offset += len(original_row)
+        if self.config_json is not None:
+            metadata_fragments = {"config": self.config_json, **(metadata_fragments or {})}
+        json_line = encode_json_line(json_record, metadata_fragments)
         if self.mode == "single":
-            self.csv_writer.writerow(csv_row)
-            self.csv_handle.flush()
-            self.json_handle.write(json.dumps(json_record, ensure_ascii=False) + "\n")
-            self.json_handle.flush()
+            if csv_row is not None:
+                self.csv_writer.writerow(csv_row)
+        else:
+            self._ensure_chunk(self._chunk_bounds(row_idx))
+            self._chunk_row_counts[self.current_chunk] += 1
+        write_all(self.json_fd, json_line)
+        self._unsynced += 1
+        self._rows_since_flush += 1
+
+    def flush(self) -> None:
+        """Push buffered output to the OS (called once per written batch).
+
+        JSONL lines already reach the kernel via os.write; they are fsynced
+        once every FSYNC_EVERY records rather than per batch.
+        """
+        if not self._rows_since_flush:
             return
+        self._rows_since_flush = 0
+        if self.csv_handle:
+            self.csv_handle.flush()
+        if self.json_fd is not None and self._unsynced >= self.FSYNC_EVERY:
+            self._sync_json()
 
-        chunk_bounds = self._chunk_bounds(row_idx)
-        self._ensure_chunk(chunk_bounds)
-        self.json_handle.write(json.dumps(json_record, ensure_ascii=False) + "\n")
-        self.json_handle.flush()
+    def _sync_json(self) -> None:
+        if self.json_fd is not None and self._unsynced:
+            os.fsync(self.json_fd)
+        self._unsynced = 0
+
+    def _close_json(self) -> None:
+        if self.json_fd is None:
+            return
+        self._sync_json()
+        os.close(self.json_fd)
+        self.json_fd = None
 
     def _chunk_bounds(self, row_idx: int) -> Tuple[int, int]:
         chunk_start = ((row_idx - 1) // self.chunk_size) * self.chunk_size + 1
@@ -1003,47 +1844,61 @@ class OutputRouter:
         chunk_start, chunk_end = chunk_bounds
         base = f"qui_tam_ranked_{chunk_start:05d}_{chunk_end:05d}"
         json_path = self.chunk_dir / f"{base}.jsonl"
-        json_exists = json_path.exists()
-        if json_exists and not self.args.resume and not self.args.overwrite_output:
-            raise FileExistsError(
-                f"Chunk JSON {json_path} exists. Use --resume or --overwrite-output."
-            )
-        json_mode = "a" if self.args.resume and json_exists else "w"
-        self.json_handle = json_path.open(json_mode, encoding="utf-8")
+        if json_path in self._created_paths:
+            json_mode = "a"
+        else:
+            json_exists = json_path.exists()
+            if json_exists and not self.args.resume and not self.args.overwrite_output:
+                raise FileExistsError(
+                    f"Chunk JSON {json_path} exists. Use --resume or --overwrite-output."
+                )
+            json_mode = "a" if self.args.resume and json_exists else "w"
+            self._created_paths.add(json_path)
+        self.json_fd = open_append_fd(json_path, truncate=json_mode == "w")
+        if json_mode == "w":
+            self._chunk_row_counts[chunk_bounds] = 0
+        elif chunk_bounds not in self._chunk_row_counts:
+            self._chunk_row_counts[chunk_bounds] = count_jsonl_lines(json_path)
         self.current_json_path = json_path
+        self.current_json_posix = json_path.as_posix()
 
     def _close_chunk(self) -> None:
-        if self.json_handle:
-            self.json_handle.close()
-            self.json_handle = None
-        if self.current_chunk and self.current_json_path:
+        self._close_json()
+        if self.current_chunk and self.current_json_posix:
             chunk_start, chunk_end = self.current_chunk
             entry = {
                 "start_row": chunk_start,
                 "end_row": chunk_end,
-                "json": str(self.current_json_path.as_posix()),
+                "json": self.current_json_posix,
+                "row_count": self._chunk_row_counts.get(self.current_chunk, 0),
             }
             self.manifest_entries[self.current_chunk] = entry
             self.manifest_dirty = True
-            # Write manifest immediately after each chunk closes
+            # Record the chunk durably now; the full manifest follows on its timer
+            self._append_manifest_log(entry)
             self._write_manifest()
         self.current_chunk = None
         self.current_json_path = None
+        self.current_json_posix = None
 
-    def _write_manifest(self) -> None:
-        """Write the manifest file to disk."""
+    def _write_manifest(self, force: bool = False) -> None:
+        """Write the manifest file to disk (at most once per MANIFEST_MIN_INTERVAL unless forced)."""
         if not self.manifest_dirty:
             return
+        now = time.monotonic()
+        if not force and now - self._manifest_written_at < self.MANIFEST_MIN_INTERVAL:
+            return
         entries = sorted(self.manifest_entries.values(), key=lambda e: e["start_row"])
 
-        # Calculate total rows processed
+        # Calculate total rows processed; only legacy entries without a
+        # row_count are counted from disk, once.
         total_processed = 0
         for entry in entries:
-            # Count actual lines in the chunk file
-            chunk_path = Path(entry["json"])
-            if chunk_path.exists():
-                with chunk_path.open(encoding="utf-8") as f:
-                    total_processed += sum(1 for _ in f)
+            key = (entry["start_row"], entry["end_row"])
+            if key not in self._chunk_row_counts:
+                self._chunk_row_counts[key] = count_jsonl_lines(Path(entry["json"]))
+                entry["row_count"] = self._chunk_row_counts[key]
+            total_processed += self._chunk_row_counts[key]
 
         # Build manifest with metadata
         manifest = {
@@ -1056,19 +1911,196 @@ class OutputRouter:
         }
 
         self.chunk_manifest.parent.mkdir(parents=True, exist_ok=True)
-        with self.chunk_manifest.open("w", encoding="utf-8") as handle:
-            json.dump(manifest, handle, indent=2)
+        # Compact: this is rewritten during the run and re-parsed on the next one
+        write_atomic(self.chunk_manifest, json_dumps(manifest).encode("utf-8"))
+        # Everything in the log is now in the manifest
+        self.manifest_log.unlink(missing_ok=True)
         self.manifest_dirty = False
+        self._manifest_written_at = now
 
     def close(self) -> None:
+        if self.original_rows_fd is not None:
+            os.fsync(self.original_rows_fd)
+            os.close(self.original_rows_fd)
+            self.original_rows_fd = None
         if self.mode == "single":
             if self.csv_handle:
                 self.csv_handle.close()
-            if self.json_handle:
-                self.json_handle.close()
+            self._close_json()
             return
         self._close_chunk()
-        self._write_manifest()
+        self._write_manifest(force=True)
+
+
+class ProgressLog:
+    """Per-row progress lines on stdout, flushed every `every` lines instead of per print."""
+
+    def __init__(self, every: int = 8):
+        self.every = max(1, every)
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def write(self, text: str) -> None:
+        with self._lock:
+            sys.stdout.write(text + "\n")
+            self._pending += 1
+            if self._pending >= self.every:
+                sys.stdout.flush()
+                self._pending = 0
+
+    def flush(self) -> None:
+        with self._lock:
+            sys.stdout.flush()
+            self._pending = 0
+
+
+_PROGRESS = ProgressLog()
+
+
+class BackgroundWriter:
+    """Write results and checkpoints from a dedicated thread.
+
+    Each wake-up drains up to batch_size queued results, writes them, and
+    flushes once. Checkpoint entries are written only after their output
+    has been flushed, so a crash never checkpoints an unwritten row; the
+    checkpoint itself is flushed and fsynced every checkpoint_flush_every
+    rows, so a crash re-processes at most that many rows on --resume.
+    """
+
+    _SENTINEL = object()
+
+    def __init__(
+        self,
+        router: OutputRouter,
+        checkpoint_handle: Optional[Any],
+        *,
+        maxsize: int,
+        batch_size: int = 64,
+        checkpoint_flush_every: int = 32,
+    ):
+        self.router = router
+        self.checkpoint_handle = checkpoint_handle
+        self.batch_size = batch_size
+        self.checkpoint_flush_every = max(1, checkpoint_flush_every)
+        self._checkpoint_pending = 0
+        self.queue: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        self.error: Optional[BaseException] = None
+        self.thread = threading.Thread(target=self._run, name="output-writer", daemon=True)
+        self.thread.start()
+
+    def put(
+        self,
+        row_idx: int,
+        filename: str,
+        json_record: Dict[str, Any],
+        csv_row: Optional[Dict[str, Any]],
+        metadata_fragments: Optional[Dict[str, str]],
+        original_row: Optional[bytes] = None,
+    ) -> None:
+        if self.error is not None:
+            raise self.error
+        self.queue.put((row_idx, filename, json_record, csv_row, metadata_fragments, original_row))
+
+    def close(self) -> None:
+        """Write everything still queued, stop the thread and re-raise any write error."""
+        self.queue.put(self._SENTINEL)
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def _sync_checkpoint(self) -> None:
+        self.checkpoint_handle.flush()
+        os.fsync(self.checkpoint_handle.fileno())
+        self._checkpoint_pending = 0
+
+    def _run(self) -> None:
+        finished = False
+        while not finished:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if self.error is not None:
+                # Keep draining so producers never block on a dead writer
+                finished = any(item is self._SENTINEL for item in batch)
+                continue
+            try:
+                written: List[str] = []
+                for item in batch:
+                    if item is self._SENTINEL:
+                        finished = True
+                        continue
+                    row_idx, filename, json_record, csv_row, metadata_fragments, original_row = item
+                    self.router.write(row_idx, json_record, csv_row, metadata_fragments, original_row)
+                    written.append(filename)
+                self.router.flush()
+                if self.checkpoint_handle and written:
+                    self.checkpoint_handle.write("".join(f"{name}\n" for name in written))
+                    self._checkpoint_pending += len(written)
+                if self._checkpoint_pending >= self.checkpoint_flush_every or (finished and self._checkpoint_pending):
+                    self._sync_checkpoint()
+            except BaseException as exc:  # noqa: BLE001
+                self.error = exc
+                # The sentinel may sit behind the failed item in this batch
+                finished = any(item is self._SENTINEL for item in batch)
+
+
+class InvestigationBatcher:
+    """Group leads from concurrent workers into one database prefetch.
+
+    Workers call submit(lead) and block on the returned future. A batch is
+    sent once batch_size leads are waiting or timeout seconds after its
+    first lead, and every lead in it receives the shared prefetch result
+    (None if it failed, in which case leads query the database themselves).
+    """
+
+    def __init__(self, prefetch: Callable[[List[Dict[str, Any]]], Any], *, batch_size: int, timeout: float):
+        self.prefetch = prefetch
+        self.batch_size = max(1, batch_size)
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[Dict[str, Any], Future]] = []
+        self._timer: Optional[threading.Timer] = None
+
+    def submit(self, lead: Dict[str, Any]) -> Future:
+        future: Future = Future()
+        batch = None
+        with self._lock:
+            self._pending.append((lead, future))
+            if len(self._pending) >= self.batch_size:
+                batch = self._take()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.timeout, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if batch:
+            self._run(batch)
+        return future
+
+    def flush(self) -> None:
+        with self._lock:
+            batch = self._take()
+        if batch:
+            self._run(batch)
+
+    def _take(self) -> List[Tuple[Dict[str, Any], Future]]:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        return batch
+
+    def _run(self, batch: List[Tuple[Dict[str, Any], Future]]) -> None:
+        try:
+            result = self.prefetch([lead for lead, _ in batch])
+        except Exception as exc:  # noqa: BLE001
+            print(f"  ! Batched investigation prefetch failed: {exc}", file=sys.stderr)
+            result = None
+        for _, future in batch:
+            future.set_result(result)
+
 
 def build_config_metadata(args: argparse.Namespace, prompt_source: str) -> Dict[str, Any]:
     """Build metadata dictionary from config for inclusion in requests and outputs."""
@@ -1124,7 +2156,7 @@ def list_models(endpoint: str, api_key: Optional[str], timeout: float) -> None:
     headers = {}
     if api_key:
         headers["Authorization"] = f"Bearer {api_key}"
-    response = requests.get(url, headers=headers, timeout=timeout)
+    response = get_http_session().get(url, headers=headers, timeout=timeout)
     response.raise_for_status()
     data = response.json()
     models = data.get("data", [])
@@ -1139,35 +2171,32 @@ def list_models(endpoint: str, api_key: Optional[str], timeout: float) -> None:
         print(f" - {model_id}{extra}")
 
 
-def rebuild_manifest(chunk_dir: Path, manifest_path: Path) -> None:
-    """Scan chunk directory and rebuild the manifest file."""
-    import re
+# Chunk files: qui_tam_ranked_XXXXX_YYYYY.jsonl
+_CHUNK_RE = re.compile(r"qui_tam_ranked_(\d{5})_(\d{5})\.jsonl$")
 
-    # Pattern to match chunk files: qui_tam_ranked_XXXXX_YYYYY.jsonl
-    pattern = re.compile(r"qui_tam_ranked_(\d{5})_(\d{5})\.jsonl")
 
+def rebuild_manifest(chunk_dir: Path, manifest_path: Path) -> None:
+    """Scan chunk directory and rebuild the manifest file."""
     chunks = []
     if not chunk_dir.exists():
         print(f"Chunk directory not found: {chunk_dir}")
         return
 
-    for file_path in sorted(chunk_dir.glob("qui_tam_ranked_*.jsonl")):
-        match = pattern.match(file_path.name)
-        if not match:
-            print(f"Skipping non-matching file: {file_path.name}")
-            continue
-
-        start_row = int(match.group(1))
-        end_row = int(match.group(2))
-
-        # Use relative path: chunk_dir/filename
-        relative_path = chunk_dir / file_path.name
+    with os.scandir(chunk_dir) as entries:
+        for dir_entry in entries:
+            if not (dir_entry.name.startswith("qui_tam_ranked_") and dir_entry.name.endswith(".jsonl")):
+                continue
+            match = _CHUNK_RE.match(dir_entry.name)
+            if not match:
+                print(f"Skipping non-matching file: {dir_entry.name}")
+                continue
 
-        chunks.append({
-            "start_row": start_row,
-            "end_row": end_row,
-            "json": str(relative_path.as_posix()),
-        })
+            # Use relative path: chunk_dir/filename
+            chunks.append({
+                "start_row": int(match.group(1)),
+                "end_row": int(match.group(2)),
+                "json": (chunk_dir / dir_entry.name).as_posix(),
+            })
 
     if not chunks:
         print(f"No chunk files found in {chunk_dir}")
@@ -1179,10 +2208,8 @@ def rebuild_manifest(chunk_dir: Path, manifest_path: Path) -> None:
     # Count total rows processed
     total_processed = 0
     for chunk in chunks:
-        chunk_path = Path(chunk["json"])
-        if chunk_path.exists():
-            with chunk_path.open(encoding="utf-8") as f:
-                total_processed += sum(1 for _ in f)
+        chunk["row_count"] = count_jsonl_lines(Path(chunk["json"]))
+        total_processed += chunk["row_count"]
 
     # Try to get total dataset rows from the source CSV
     csv_candidates = [
@@ -1217,8 +2244,14 @@ def rebuild_manifest(chunk_dir: Path, manifest_path: Path) -> None:
 
     # Write manifest
     manifest_path.parent.mkdir(parents=True, exist_ok=True)
-    with manifest_path.open("w", encoding="utf-8") as handle:
-        json.dump(manifest, handle, indent=2)
+    # Runs once, so keep the rebuilt manifest readable
+    if ORJSON_AVAILABLE:
+        manifest_bytes = orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+    else:
+        manifest_bytes = json.dumps(manifest, indent=2, ensure_ascii=False).encode("utf-8")
+    write_atomic(manifest_path, manifest_bytes)
+    # The rebuilt manifest supersedes any chunk entries still pending in the log
+    manifest_path.with_name(manifest_path.name + ".log").unlink(missing_ok=True)
 
     print(f"Rebuilt manifest with {len(chunks)} chunks:")
     for chunk in chunks:
@@ -1230,6 +2263,251 @@ def rebuild_manifest(chunk_dir: Path, manifest_path: Path) -> None:
     print(f"Manifest written to: {manifest_path}")
 
 
+# (keywords, label): label applies when any keyword occurs in the field (case-sensitive)
+_STATUTE_RULES: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (("NIH", "Grant"), "False Claims Act (Grant Fraud)"),
+    (("FDA", "Clinical Trial"), "False Claims Act (FDA Fraud)"),
+    (("Off-Label", "Marketing"), "False Claims Act (Off-Label Marketing)"),
+    (("Kickback",), "Anti-Kickback Statute"),
+)
+_PROGRAM_RULES: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (("NIH",), "NIH"),
+    (("CDC",), "CDC"),
+    (("DoD", "DOD"), "DoD"),
+)
+
+
+def _match_rules(value: Any, rules: Tuple[Tuple[Tuple[str, ...], str], ...]) -> List[str]:
+    """Labels of the rules whose keywords occur in value, in rule order."""
+    if not value:
+        return []
+    return [label for keywords, label in rules if any(keyword in value for keyword in keywords)]
+
+
+def _semi(items: List[str]) -> str:
+    """Join a list field into its '; '-separated CSV/lead-data form."""
+    return "; ".join(items)
+
+
+def analyze_row(
+    args: argparse.Namespace,
+    idx: int,
+    row: Dict[str, str],
+    *,
+    system_prompt: str,
+    config_metadata_json: Optional[str],
+    build_csv: bool,
+    session: Optional[requests.Session] = None,
+    cache: Optional[ResponseCache] = None,
+    investigation_batcher: Optional[InvestigationBatcher] = None,
+) -> Optional[Tuple[Dict[str, Any], Optional[Dict[str, Any]], Optional[Dict[str, str]], Optional[bytes]]]:
+    """Score one source row (plus investigation) and build its output records.
+
+    Runs on a worker thread. Returns (json_record, csv_row, metadata_fragments, original_row),
+    or None when the row failed or scored below --min-score.
+    """
+    filename = row["filename"]
+    text = row["text"]
+
+    try:
+        result = call_model(
+            endpoint=args.endpoint,
+            model=args.model,
+            filename=filename,
+            text=text,
+            system_prompt=system_prompt,
+            api_key=args.api_key,
+            timeout=args.timeout,
+            temperature=args.temperature,
+            reasoning_effort=args.reasoning_effort,
+            config_metadata_json=config_metadata_json,
+            db_path=args.db_path if args.cross_reference else None,
+            enable_cross_reference=args.cross_reference,
+            session=session,
+            cache=cache,
+            max_text_chars=args.max_text_chars or None,
+            compress_request=args.compress_requests,
+        )
+        if args.sleep:
+            # Per-worker pause between requests to avoid overwhelming the server
+            time.sleep(args.sleep)
+
+        # Filter based on GPT's NEW score (not the old scraper score)
+        new_score = result.get("qui_tam_score", 0)
+        if args.min_score > 0 and new_score < args.min_score:
+            _PROGRESS.write(f"  → Skipping {filename}: GPT score {new_score} < {args.min_score}")
+            return None
+
+    except Exception as exc:  # noqa: BLE001
+        print(f"  ! Failed to analyze {filename}: {exc}", file=sys.stderr)
+        return None
+
+    # Map scientific fraud fields to output format
+    # New prompt doesn't explicitly list statute violations, derive from fraud_vector
+    fraud_vector = result.get("fraud_vector", "")
+    statute_violations = _match_rules(fraud_vector, _STATUTE_RULES)
+    # Derive federal programs from funding_source if available
+    funding_source = result.get("funding_source", "")
+    federal_programs_involved = _match_rules(funding_source, _PROGRAM_RULES)
+    # Use fraud_vector if fraud_type not available
+    fraud_type = result.get("fraud_type") or fraud_vector or "Unknown"
+
+    # Normalize every list field in a single pass.
+    # New prompt uses "scientific_red_flags" instead of "key_facts",
+    # "implicated_institutions" instead of "implicated_entities"
+    # and "next_step" instead of "action_items".
+    (
+        key_facts,
+        statute_violations,
+        implicated_actors,
+        federal_programs_involved,
+        action_items,
+    ) = normalize_text_lists_bulk(
+        [
+            ensure_list(result.get("scientific_red_flags") or result.get("key_facts")),
+            statute_violations or ensure_list(result.get("statute_violations")),
+            ensure_list(result.get("implicated_institutions") or result.get("implicated_entities")),
+            federal_programs_involved or ensure_list(result.get("federal_programs_involved")),
+            ensure_list(result.get("next_step") or result.get("action_items"))
+            if args.include_action_items
+            else [],
+        ],
+        strip_descriptor=[False, False, True, True, False],
+    )
+    federal_programs_involved = normalize_programs(federal_programs_involved)
+
+    # Build reason from potential_damages_theory and investigation_status
+    reason_parts = []
+    damages_theory = result.get("potential_damages_theory")
+    if damages_theory:
+        reason_parts.append(damages_theory)
+    investigation_status = result.get("investigation_status")
+    if investigation_status:
+        reason_parts.append(f"Status: {investigation_status}")
+    raw_reason = result.get("reason", "")
+    if raw_reason:
+        reason_parts.append(raw_reason)
+    reason = " | ".join(reason_parts) if reason_parts else raw_reason
+
+    # Lists are joined only when a CSV row or an investigation needs the text
+    # form, and then once for both; JSONL records keep the lists.
+    investigate = INVESTIGATION_AVAILABLE and new_score >= args.investigate_min_score
+    if build_csv or investigate:
+        key_facts_text = _semi(key_facts)
+        implicated_actors_text = _semi(implicated_actors)
+        federal_programs_text = _semi(federal_programs_involved)
+
+    # Perform clinical investigation for high-scoring leads (automatically enabled)
+    investigation_report = None
+    investigation_viability_score = None
+    if investigate:
+        print(f"  → Investigating lead (score {new_score} >= {args.investigate_min_score})...", flush=True)
+        try:
+            # Extract identifiers from filename and text for better investigation
+            # (scanned separately so the document is never copied into a joined string)
+            nct_ids = _NCT_RE.findall(filename) + _NCT_RE.findall(text)
+            pmid_list = [
+                match.group(1) or match.group(2)
+                for source in (filename, text)
+                for match in _PMID_RE.finditer(source)
+            ]
+
+            # Prepare lead data for investigation with original data
+            lead_data = {
+                "headline": result.get("headline", ""),
+                "qui_tam_score": new_score,
+                "key_facts": key_facts_text,
+                "fraud_type": fraud_type,
+                "implicated_actors": implicated_actors_text,
+                "federal_programs_involved": federal_programs_text,
+                "reason": reason,
+                "filename": filename,  # Original filename (may contain NCT ID, PMID, etc.)
+                "original_text": text[:2000] if text else "",  # First 2000 chars of original text for context
+                "nct_ids": nct_ids,  # Extracted NCT IDs
+                "pmids": pmid_list[:5],  # Extracted PMIDs (limit to 5)
+            }
+            # Choose investigator based on flag
+            investigate_lead = load_investigator(args.use_optimized_investigator)
+            if investigation_batcher is not None:
+                prefetched = investigation_batcher.submit(lead_data).result()
+                investigation_result = investigate_lead(lead_data, prefetched)
+            else:
+                investigation_result = investigate_lead(lead_data)
+            mode_label = "optimized" if args.use_optimized_investigator else "standard"
+
+            investigation_report = investigation_result.get("report", "")
+            investigation_viability_score = investigation_result.get("viability_score", 0)
+
+            # Log optimization stats if available
+            if "search_count" in investigation_result:
+                print(f"  ✓ Investigation complete ({mode_label}): Viability={investigation_viability_score}, Searches={investigation_result.get('search_count', 'N/A')}, DB hits={investigation_result.get('database_hits', 0)}", flush=True)
+            else:
+                print(f"  ✓ Investigation complete ({mode_label}): Viability score={investigation_viability_score}", flush=True)
+        except Exception as exc:
+            print(f"  ! Investigation failed: {exc}", file=sys.stderr, flush=True)
+            investigation_report = f"# Investigation Error\n\nInvestigation failed: {str(exc)}"
+            investigation_viability_score = None
+
+    # Chunk mode only writes JSONL, so the CSV row is never built there.
+    csv_row: Optional[Dict[str, Any]] = None
+    if build_csv:
+        csv_row = {
+            "filename": filename,
+            "source_row_index": idx,
+            "headline": result.get("headline", ""),
+            "qui_tam_score": result.get("qui_tam_score", ""),
+            "reason": reason,
+            "key_facts": key_facts_text,
+            "statute_violations": _semi(statute_violations),
+            "implicated_actors": implicated_actors_text,
+            "federal_programs_involved": federal_programs_text,
+            "fraud_type": fraud_type,
+            "evidence_quality": result.get("evidence_quality", "UNKNOWN"),
+            "investigation_viability_score": investigation_viability_score if investigation_viability_score is not None else "",
+            "investigation_report": (investigation_report[:500] + "...") if investigation_report and len(investigation_report) > 500 else (investigation_report or ""),  # Truncate for CSV
+        }
+        if args.include_action_items:
+            csv_row["action_items"] = _semi(action_items)
+
+    json_record: Dict[str, Any] = {
+        "filename": filename,
+        "headline": result.get("headline", ""),
+        "qui_tam_score": result.get("qui_tam_score", ""),
+        "reason": reason,
+        "key_facts": key_facts,
+        "statute_violations": statute_violations,
+        "implicated_actors": implicated_actors,
+        "federal_programs_involved": federal_programs_involved,
+        "fraud_type": fraud_type,
+        "evidence_quality": result.get("evidence_quality", "UNKNOWN"),
+        "investigation_viability_score": investigation_viability_score,
+        "investigation_report": investigation_report,
+        "metadata": {
+            "source_row_index": idx,
+            # Include new fields for reference
+            "fraud_vector": fraud_vector,
+            "funding_source": funding_source,
+            "investigation_status": result.get("investigation_status", ""),
+        },
+    }
+    if args.include_action_items:
+        json_record["action_items"] = action_items
+
+    # Only embed the full source row on request; it duplicates the model input text.
+    original_row = None
+    if args.embed_original_row:
+        metadata_fragments = {"original_row": json_dumps(row)}
+    else:
+        json_record["metadata"]["original_row"] = {"filename": filename}
+        metadata_fragments = None
+        if args.original_rows_output:
+            json_record["metadata"]["original_row"]["ref_file"] = args.original_rows_output.as_posix()
+            # Encoded here, off the writer thread; the writer assigns its offset
+            original_row = encode_json_line(row)
+
+    return json_record, csv_row, metadata_fragments, original_row
+
+
 def main() -> None:
     args = parse_args()
     if args.list_models:
@@ -1269,6 +2547,7 @@ def main() -> None:
         "implicated_actors",
         "federal_programs_involved",
         "fraud_type",
+        "evidence_quality",
         "investigation_viability_score",
         "investigation_report",
     ]
@@ -1293,6 +2572,7 @@ def main() -> None:
         completed_filenames=completed_filenames,  # Always use completed_filenames to prevent duplicates
         start_row=args.start_row,
         end_row=args.end_row,
+        count_dataset_rows=args.chunk_size > 0,  # Chunk manifests record the dataset size
     )
     total_candidates = workload_stats["total"]
     already_done = workload_stats["already_done"]
@@ -1316,251 +2596,183 @@ def main() -> None:
         print(f"Investigation enabled: {investigator_type}")
         print(f"  → Will automatically investigate leads with score >= {args.investigate_min_score}")
 
-    output_router = OutputRouter(args, fieldnames)
+    # Build config metadata to include in requests and outputs
+    config_metadata = build_config_metadata(args, prompt_source)
+    # Encoded once and spliced into every request body
+    config_metadata_json = json_dumps(config_metadata) if config_metadata else None
+
+    output_router = OutputRouter(args, fieldnames, config_metadata)
 
     # Count total rows in dataset for manifest metadata
     if output_router.mode == "chunk":
-        print("Counting total rows in dataset...")
-        output_router.total_dataset_rows = count_total_csv_rows(args.input)
+        output_router.total_dataset_rows = workload_stats["dataset_rows"]
         print(f"Total dataset: {output_router.total_dataset_rows:,} rows")
 
+    # The writer thread flushes the checkpoint every --checkpoint-flush-every rows.
     checkpoint_handle = (
-        args.checkpoint.open("a", encoding="utf-8") if args.checkpoint else None
+        args.checkpoint.open("a", encoding="utf-8", buffering=1 << 16) if args.checkpoint else None
     )
 
-    # Build config metadata to include in requests and outputs
-    config_metadata = build_config_metadata(args, prompt_source)
+    _PROGRESS.every = max(1, args.log_every)
+    # Check once whether cross-referencing is enabled and the database exists
+    cross_ref_note = ""
+    if args.cross_reference and args.db_path and args.db_path.exists():
+        cross_ref_note = f"\n  → Cross-referencing with database: {args.db_path.name}"
 
-    start_time = time.monotonic()
-    try:
+    def pending_rows() -> Iterable[Tuple[int, Dict[str, str]]]:
         for idx, row in enumerate(iter_rows(args.input), start=1):
             if idx < args.start_row:
                 continue
             if args.end_row is not None and idx > args.end_row:
                 break
-            if args.max_rows is not None and processed >= args.max_rows:
-                break
+            yield idx, row
 
+    def next_row() -> Tuple[int, Dict[str, str]]:
+        """Next row to submit: requeued duplicates first, then the input (StopIteration when none)."""
+        while True:
+            idx, row = ready_rows.popleft() if ready_rows else next(rows)
             filename = row["filename"]
-            text = row["text"]
-
             if filename in completed_filenames:
-                print(f"[Row {idx}] [skip] {filename} already processed.", flush=True)
+                _PROGRESS.write(f"[Row {idx}] [skip] {filename} already processed.")
+                continue
+            if filename in in_flight_filenames:
+                # Wait for the in-flight twin; it is retried from here if the twin fails
+                _PROGRESS.write(f"[Row {idx}] [defer] {filename} is already in progress.")
+                deferred_rows.setdefault(filename, []).append((idx, row))
                 continue
+            return idx, row
+
+    concurrency = max(1, args.concurrency)
+    client_batch_size = min(max(1, args.client_batch_size), concurrency)
+    # Size the connection pool to the worker count so every in-flight row keeps
+    # its own keep-alive socket, even at hundreds of concurrent requests.
+    session = get_http_session() if concurrency <= 64 else build_http_session(concurrency)
+    cache = None
+    if args.response_cache and SQLITE_AVAILABLE and args.temperature <= 0:
+        cache = ResponseCache(args.response_cache)
+    investigation_batcher = None
+    investigate_batch_size = min(args.investigate_batch_size, concurrency)
+    if INVESTIGATION_AVAILABLE and args.use_optimized_investigator and investigate_batch_size > 1:
+        from clinical_investigator_optimized import prefetch_database_rows
+
+        investigation_batcher = InvestigationBatcher(
+            prefetch_database_rows,
+            batch_size=investigate_batch_size,
+            timeout=args.investigate_batch_timeout,
+        )
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    writer = BackgroundWriter(
+        output_router,
+        checkpoint_handle,
+        maxsize=concurrency * 4,
+        checkpoint_flush_every=args.checkpoint_flush_every,
+    )
+    in_flight: Dict[Future, Tuple[int, str]] = {}
+    # Every submitted row in source order; results leave from the left once
+    # done, so output keeps row order while requests finish out of order.
+    pending_writes: Deque[Tuple[Future, int, str]] = deque()
+    reorder_limit = concurrency * 4
+    in_flight_filenames: Set[str] = set()
+    # Duplicate rows held back while a row with the same filename is in flight,
+    # and those requeued because that row failed
+    deferred_rows: Dict[str, List[Tuple[int, Dict[str, str]]]] = {}
+    ready_rows: Deque[Tuple[int, Dict[str, str]]] = deque()
+    rows = iter(pending_rows())
+    rows_exhausted = False
 
-            # Show both source row index and processing progress
-            if target_total:
-                progress_prefix = f"[Row {idx}] [{processed + 1}/{target_total} new]"
-            else:
-                progress_prefix = f"[Row {idx}] [{processed + 1}]"
-
-            eta_text = format_eta(
-                start_time,
-                processed,
-                target_total,
-                args.power_watts,
-                args.electric_rate,
-            )
-            print(f"{progress_prefix} Processing {filename}... {eta_text}", flush=True)
-            
-            # Check if cross-referencing is enabled and database exists
-            if args.cross_reference and args.db_path and args.db_path.exists():
-                print(f"  → Cross-referencing with database: {args.db_path.name}", flush=True)
+    start_time = time.monotonic()
+    try:
+        while True:
+            # Keep up to --concurrency rows in flight; rows rejected by the model
+            # free their slot, so --max-rows still counts written rows. Refills
+            # wait for --client-batch-size free slots so each burst reaches the
+            # server together and is scheduled as one batch. A slow row holds
+            # back at most reorder_limit finished rows behind it.
+            refill = not in_flight or concurrency - len(in_flight) >= client_batch_size
+            while (
+                refill
+                and (ready_rows or not rows_exhausted)
+                and len(in_flight) < concurrency
+                and len(pending_writes) < reorder_limit
+                and (args.max_rows is None or processed + len(pending_writes) < args.max_rows)
+            ):
+                try:
+                    idx, row = next_row()
+                except StopIteration:
+                    rows_exhausted = True
+                    break
+                filename = row["filename"]
+
+                # Show both source row index and processing progress
+                position = processed + len(pending_writes) + 1
+                if target_total:
+                    progress_prefix = f"[Row {idx}] [{position}/{target_total} new]"
+                else:
+                    progress_prefix = f"[Row {idx}] [{position}]"
+
+                eta_text = format_eta(
+                    start_time,
+                    processed,
+                    target_total,
+                    args.power_watts,
+                    args.electric_rate,
+                )
+                _PROGRESS.write(f"{progress_prefix} Processing {filename}... {eta_text}{cross_ref_note}")
 
-            try:
-                result = call_model(
-                    endpoint=args.endpoint,
-                    model=args.model,
-                    filename=filename,
-                    text=text,
+                future = executor.submit(
+                    analyze_row,
+                    args,
+                    idx,
+                    row,
                     system_prompt=system_prompt,
-                    api_key=args.api_key,
-                    timeout=args.timeout,
-                    temperature=args.temperature,
-                    reasoning_effort=args.reasoning_effort,
-                    config_metadata=config_metadata,
-                    db_path=args.db_path if args.cross_reference else None,
-                    enable_cross_reference=args.cross_reference,
+                    config_metadata_json=config_metadata_json,
+                    build_csv=output_router.mode == "single",
+                    session=session,
+                    cache=cache,
+                    investigation_batcher=investigation_batcher,
                 )
-                
-                # Filter based on GPT's NEW score (not the old scraper score)
-                new_score = result.get("qui_tam_score", 0)
-                if args.min_score > 0 and new_score < args.min_score:
-                    print(f"  → Skipping {filename}: GPT score {new_score} < {args.min_score}", flush=True)
-                    continue
-                    
-            except Exception as exc:  # noqa: BLE001
-                print(f"  ! Failed to analyze {filename}: {exc}", file=sys.stderr)
-                continue
+                in_flight[future] = (idx, filename)
+                pending_writes.append((future, idx, filename))
+                in_flight_filenames.add(filename)
 
-            # Map scientific fraud fields to output format
-            # New prompt uses "scientific_red_flags" instead of "key_facts"
-            key_facts = normalize_text_list(ensure_list(
-                result.get("scientific_red_flags") or result.get("key_facts")
-            ))
-            # New prompt doesn't explicitly list statute violations, derive from fraud_vector
-            statute_violations = []
-            fraud_vector = result.get("fraud_vector", "")
-            if fraud_vector:
-                if "NIH" in fraud_vector or "Grant" in fraud_vector:
-                    statute_violations.append("False Claims Act (Grant Fraud)")
-                if "FDA" in fraud_vector or "Clinical Trial" in fraud_vector:
-                    statute_violations.append("False Claims Act (FDA Fraud)")
-                if "Off-Label" in fraud_vector or "Marketing" in fraud_vector:
-                    statute_violations.append("False Claims Act (Off-Label Marketing)")
-                if "Kickback" in fraud_vector:
-                    statute_violations.append("Anti-Kickback Statute")
-            statute_violations = normalize_text_list(
-                statute_violations or ensure_list(result.get("statute_violations"))
-            )
-            # New prompt uses "implicated_institutions" instead of "implicated_entities"
-            implicated_actors = normalize_text_list(
-                ensure_list(result.get("implicated_institutions") or result.get("implicated_entities")),
-                strip_descriptor=True
-            )
-            # Derive federal programs from funding_source if available
-            federal_programs_involved = []
-            funding_source = result.get("funding_source", "")
-            if funding_source:
-                if "NIH" in funding_source:
-                    federal_programs_involved.append("NIH")
-                if "CDC" in funding_source:
-                    federal_programs_involved.append("CDC")
-                if "DoD" in funding_source or "DOD" in funding_source:
-                    federal_programs_involved.append("DoD")
-            federal_programs_involved = normalize_programs(
-                federal_programs_involved or normalize_text_list(
-                    ensure_list(result.get("federal_programs_involved")), strip_descriptor=True
-                )
-            )
-            # Use fraud_vector if fraud_type not available
-            fraud_type = result.get("fraud_type") or fraud_vector or "Unknown"
-            
-            # New prompt uses "next_step" instead of "action_items"
-            action_items = (
-                normalize_text_list(ensure_list(
-                    result.get("next_step") or result.get("action_items")
-                ))
-                if args.include_action_items
-                else []
-            )
+            if not in_flight:
+                break
 
-            # Build reason from potential_damages_theory and investigation_status
-            reason_parts = []
-            if result.get("potential_damages_theory"):
-                reason_parts.append(result.get("potential_damages_theory"))
-            if result.get("investigation_status"):
-                reason_parts.append(f"Status: {result.get('investigation_status')}")
-            if result.get("reason"):
-                reason_parts.append(result.get("reason"))
-            reason = " | ".join(reason_parts) if reason_parts else result.get("reason", "")
-            
-            # Perform clinical investigation for high-scoring leads (automatically enabled)
-            investigation_report = None
-            investigation_viability_score = None
-            if INVESTIGATION_AVAILABLE and new_score >= args.investigate_min_score:
-                print(f"  → Investigating lead (score {new_score} >= {args.investigate_min_score})...", flush=True)
-                try:
-                    # Extract identifiers from filename and text for better investigation
-                    import re
-                    nct_ids = re.findall(r'NCT\d{8}', filename + " " + text)
-                    pmids = re.findall(r'PMID[:\s]*(\d{8,})|/(\d{8,})/', filename + " " + text)
-                    pmid_list = [pmid[0] or pmid[1] for pmid in pmids if pmid[0] or pmid[1]]
-                    
-                    # Prepare lead data for investigation with original data
-                    lead_data = {
-                        "headline": result.get("headline", ""),
-                        "qui_tam_score": new_score,
-                        "key_facts": "; ".join(key_facts) if key_facts else "",
-                        "fraud_type": fraud_type,
-                        "implicated_actors": "; ".join(implicated_actors) if implicated_actors else "",
-                        "federal_programs_involved": "; ".join(federal_programs_involved) if federal_programs_involved else "",
-                        "reason": reason,
-                        "filename": filename,  # Original filename (may contain NCT ID, PMID, etc.)
-                        "original_text": text[:2000] if text else "",  # First 2000 chars of original text for context
-                        "nct_ids": nct_ids,  # Extracted NCT IDs
-                        "pmids": pmid_list[:5],  # Extracted PMIDs (limit to 5)
-                    }
-                    # Choose investigator based on flag
-                    if args.use_optimized_investigator:
-                        investigation_result = investigate_lead_optimized(lead_data)
-                        mode_label = "optimized"
-                    else:
-                        investigation_result = investigate_lead_standard(lead_data)
-                        mode_label = "standard"
-
-                    investigation_report = investigation_result.get("report", "")
-                    investigation_viability_score = investigation_result.get("viability_score", 0)
-
-                    # Log optimization stats if available
-                    if "search_count" in investigation_result:
-                        print(f"  ✓ Investigation complete ({mode_label}): Viability={investigation_viability_score}, Searches={investigation_result.get('search_count', 'N/A')}, DB hits={investigation_result.get('database_hits', 0)}", flush=True)
-                    else:
-                        print(f"  ✓ Investigation complete ({mode_label}): Viability score={investigation_viability_score}", flush=True)
-                except Exception as exc:
-                    print(f"  ! Investigation failed: {exc}", file=sys.stderr, flush=True)
-                    investigation_report = f"# Investigation Error\n\nInvestigation failed: {str(exc)}"
-                    investigation_viability_score = None
-            
-            csv_row = {
-                "filename": filename,
-                "source_row_index": idx,
-                "headline": result.get("headline", ""),
-                "qui_tam_score": result.get("qui_tam_score", ""),
-                "reason": reason,
-                "key_facts": "; ".join(key_facts),
-                "statute_violations": "; ".join(statute_violations),
-                "implicated_actors": "; ".join(implicated_actors),
-                "federal_programs_involved": "; ".join(federal_programs_involved),
-                "fraud_type": fraud_type,
-                "evidence_quality": result.get("evidence_quality", "UNKNOWN"),
-                "investigation_viability_score": investigation_viability_score if investigation_viability_score is not None else "",
-                "investigation_report": (investigation_report[:500] + "...") if investigation_report and len(investigation_report) > 500 else (investigation_report or ""),  # Truncate for CSV
-            }
-            if args.include_action_items:
-                csv_row["action_items"] = "; ".join(action_items)
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                del in_flight[future]
+            # Results are handed to the writer thread in submission order.
+            while pending_writes and pending_writes[0][0].done():
+                future, idx, filename = pending_writes.popleft()
+                in_flight_filenames.discard(filename)
+                outcome = future.result()
+                if outcome is None:
+                    # Give a duplicate of the failed row its own attempt
+                    ready_rows.extend(deferred_rows.pop(filename, ()))
+                    continue
+                json_record, csv_row, metadata_fragments, original_row = outcome
 
-            json_record: Dict[str, Any] = {
-                "filename": filename,
-                "headline": result.get("headline", ""),
-                "qui_tam_score": result.get("qui_tam_score", ""),
-                "reason": reason,
-                "key_facts": key_facts,
-                "statute_violations": statute_violations,
-                "implicated_actors": implicated_actors,
-                "federal_programs_involved": federal_programs_involved,
-                "fraud_type": fraud_type,
-                "evidence_quality": result.get("evidence_quality", "UNKNOWN"),
-                "investigation_viability_score": investigation_viability_score,
-                "investigation_report": investigation_report,
-                "metadata": {
-                    "source_row_index": idx,
-                    "original_row": row,
-                    "config": config_metadata,
-                    # Include new fields for reference
-                    "fraud_vector": fraud_vector,
-                    "funding_source": result.get("funding_source", ""),
-                    "investigation_status": result.get("investigation_status", ""),
-                },
-            }
-            if args.include_action_items:
-                json_record["action_items"] = action_items
+                writer.put(idx, filename, json_record, csv_row, metadata_fragments, original_row)
 
-            output_router.write(idx, csv_row, json_record)
+                completed_filenames.add(filename)
+                processed += 1
+                for dup_idx, _ in deferred_rows.pop(filename, ()):
+                    _PROGRESS.write(f"[Row {dup_idx}] [skip] {filename} already processed.")
 
-            if checkpoint_handle:
-                checkpoint_handle.write(filename + "\n")
-                checkpoint_handle.flush()
-
-            completed_filenames.add(filename)
-            processed += 1
-            if args.sleep:
-                time.sleep(args.sleep)
-                
     finally:
-        if checkpoint_handle:
-            checkpoint_handle.close()
-        output_router.close()
+        _PROGRESS.flush()
+        if investigation_batcher:
+            # Release workers still waiting on a partial batch
+            investigation_batcher.flush()
+        executor.shutdown(wait=True, cancel_futures=True)
+        if cache:
+            cache.close()
+        try:
+            writer.close()
+        finally:
+            if checkpoint_handle:
+                checkpoint_handle.close()
+            output_router.close()
 
     elapsed = time.monotonic() - start_time
     elapsed_hours = elapsed / 3600
@@ -1,16 +1,50 @@
 #!/usr/bin/env python3
 """
 PubMed Trending Scraper - Scrapes all trending articles from PubMed
-Extracts PMIDs from listing pages and scrapes individual article pages
+Extracts PMIDs from listing pages and fetches article details in batches
+through the NCBI E-utilities efetch API (article pages are the fallback)
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import io
 import json
 import sys
 from pathlib import Path
 import time
 import re
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# lxml builds the tree several times faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# diskcache keeps fetched PubMed responses between runs (optional)
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# Import config (optional - an NCBI API key raises the E-utilities rate limit)
+try:
+    import config
+    NCBI_API_KEY = config.NCBI_API_KEY if hasattr(config, 'NCBI_API_KEY') else None
+except ImportError:
+    NCBI_API_KEY = None
 
 DATA_DIR = Path("data/raw")
 DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -20,19 +54,71 @@ HEADERS = {
 }
 
 MAX_TEXT_LENGTH = 3000  # Keep text chunks manageable
+ARTICLE_FETCH_WORKERS = 8  # Article pages fetched concurrently when efetch fails
+# The fallback workers share one request clock so together they stay at NCBI's 3 requests/s
+ARTICLE_PAGE_INTERVAL = 1 / 3
+LISTING_FETCH_WORKERS = 5  # Listing pages fetched concurrently in Step 1
+
+# E-utilities efetch returns up to 200 articles per request; NCBI allows 3 requests/s
+# without an API key and 10/s with one
+EFETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+EFETCH_BATCH_SIZE = 200
+EFETCH_INTERVAL = 0.1 if NCBI_API_KEY else 0.34
+
+# Article content is immutable per PMID, so responses are cached on disk for 30 days:
+# efetch XML per PMID (tag pubmed_xml) and fallback article pages (tag pubmed_html).
+# Only raw responses are cached, so parser changes take effect on the next run
+CACHE_DIR = DATA_DIR.parent / ".pubmed_cache"
+CACHE_EXPIRE = 30 * 86400
+_CACHE = diskcache.Cache(str(CACHE_DIR)) if DISKCACHE_AVAILABLE else None
+
+# PMID patterns, compiled once for the listing-page and article-URL scans
+SEARCH_TERMS_RE = re.compile(r'Search terms:\s*([\d,]+)')
+PUBMED_HREF_RE = re.compile(r'/pubmed/(\d{8,})')
+PMID_REF_RE = re.compile(r'\b(\d{8,})\b')
+PMID_URL_RE = re.compile(r'/(\d{8,})/')
+
+# Class-name patterns for the article page fallback, compiled once rather than per page
+ABSTRACT_PARA_CLASS_RE = re.compile('abstract|paragraph')
+AUTHOR_CLASS_RE = re.compile('author|name')
+SUMMARY_CLASS_RE = re.compile('summary|content')
 
 
-def extract_pmids_from_listing_page(soup) -> list:
-    """Extract all PMIDs from a PubMed listing page."""
+def build_session() -> requests.Session:
+    """Keep-alive session shared by the listing, efetch and article page requests."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=ARTICLE_FETCH_WORKERS * 2,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                          respect_retry_after_header=True),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = build_session()
+
+
+def encode_json_line(record) -> bytes:
+    """Encode one newline-terminated JSONL record as UTF-8 bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def extract_pmids_from_listing_page(page_text: str) -> set:
+    """Extract the set of PMIDs in the raw HTML of a PubMed listing page (unordered)."""
     pmids = set()
     
     # Method 1: Extract from saved search terms (comma-separated PMIDs in the page)
     # The saved search contains all PMIDs like "41535475,41519150,4240108,..."
-    page_text = str(soup)
     
     # Look for the saved search terms pattern - long comma-separated PMIDs
     # Pattern: "Search terms: 41535475,41519150,4240108,..."
-    search_terms_match = re.search(r'Search terms:\s*([\d,]+)', page_text)
+    search_terms_match = SEARCH_TERMS_RE.search(page_text)
     if search_terms_match:
         pmids_str = search_terms_match.group(1)
         # Split by comma and extract PMIDs
@@ -41,55 +127,214 @@ def extract_pmids_from_listing_page(soup) -> list:
             if pmid.isdigit() and 8 <= len(pmid) <= 12:
                 pmids.add(pmid)
     
-    # Method 2: Extract PMIDs from links on the page
-    links = soup.find_all('a', href=True)
-    for link in links:
-        href = link.get('href', '')
-        # Look for /pubmed/{PMID}/ pattern
-        pmid_match = re.search(r'/pubmed/(\d{8,})', href)
-        if pmid_match:
-            pmid = pmid_match.group(1)
-            if pmid.isdigit() and 8 <= len(pmid) <= 12:
-                pmids.add(pmid)
+    # Method 2: Extract PMIDs from /pubmed/{PMID}/ links, scanned straight from the
+    # raw HTML so no parse tree is needed
+    for pmid in PUBMED_HREF_RE.findall(page_text):
+        if 8 <= len(pmid) <= 12:
+            pmids.add(pmid)
+    
+    if pmids:
+        return pmids
     
-    # Method 3: Extract from any PMID references in text
+    # Method 3 (fallback only): any 8+ digit number in the page. This also picks up
+    # phone numbers, timestamps and other IDs, so it is used only when the search terms
+    # and article links found nothing
     # Pattern: PMID: 41545779 or just 8+ digit numbers in certain contexts
-    pmid_refs = re.findall(r'\b(\d{8,})\b', page_text)
+    pmid_refs = PMID_REF_RE.findall(page_text)
     for pmid in pmid_refs:
         if 8 <= len(pmid) <= 12:  # PMIDs are usually 8 digits, sometimes more
             pmids.add(pmid)
     
-    return sorted(list(pmids), reverse=True)  # Most recent first
+    return pmids
+
+
+def build_article_record(pubmed_url: str, pmid: str, title: str, journal: str, pub_date: str,
+                         authors: list, abstract: str, summary: str = "") -> dict:
+    """Build the JSONL record for one article, prioritizing abstract and key metadata."""
+    text_parts = []
+    
+    if title:
+        text_parts.append(f"Title: {title}")
+    
+    if pmid:
+        text_parts.append(f"PMID: {pmid}")
+    
+    if journal:
+        text_parts.append(f"Journal: {journal}")
+    
+    if pub_date:
+        text_parts.append(f"Publication Date: {pub_date}")
+    
+    if authors:
+        text_parts.append(f"Authors: {', '.join(authors)}")
+    
+    if abstract:
+        text_parts.append(f"\nAbstract:\n{abstract}")
+    elif summary:
+        text_parts.append(f"\nSummary:\n{summary}")
+    
+    full_text = "\n\n".join(text_parts)
+    
+    # Truncate if needed
+    if len(full_text) > MAX_TEXT_LENGTH:
+        full_text = full_text[:MAX_TEXT_LENGTH]
+        last_period = full_text.rfind('.')
+        if last_period > MAX_TEXT_LENGTH * 0.8:
+            full_text = full_text[:last_period + 1]
+        full_text += f"\n\n[Text truncated - showing first {MAX_TEXT_LENGTH} characters]"
+    
+    # Generate filename from PMID
+    filename = f"pubmed_{pmid}.html" if pmid else pubmed_url.split('/')[-1] + ".html"
+    filename = filename[:100]
+    
+    return {
+        'filename': filename,
+        'text': f"URL: {pubmed_url}\n\n{full_text}",
+        'url': pubmed_url,
+        'title': title,
+        'pmid': pmid,
+        'journal': journal
+    }
 
 
-def scrape_pubmed_article(pubmed_url: str) -> dict:
-    """Scrape a single PubMed article page, focusing on fraud-relevant content."""
+def parse_efetch_article(article, require_abstract: bool = False):
+    """
+    Build an article record from one efetch PubmedArticle element.
+    
+    With require_abstract, articles without an abstract return None before any other
+    field is extracted.
+    """
+    pmid = article.findtext("MedlineCitation/PMID", "").strip()
+    
+    abstract_texts = []
+    for abs_text in article.iterfind(".//Abstract/AbstractText"):
+        label = abs_text.get("Label", "")
+        text = "".join(abs_text.itertext()).strip()
+        abstract_texts.append(f"{label}: {text}" if label else text)
+    abstract = "\n".join(abstract_texts)
+    if require_abstract and not abstract:
+        return None
+    
+    title_elem = article.find(".//Article/ArticleTitle")
+    title = "".join(title_elem.itertext()).strip() if title_elem is not None else ""
+    
+    # The article page shows the abbreviated journal name, so prefer it here too
+    journal = (article.findtext(".//Journal/ISOAbbreviation") or article.findtext(".//Journal/Title") or "").strip()
+    
+    pub_date = ""
+    pub_date_elem = article.find(".//Journal/JournalIssue/PubDate")
+    if pub_date_elem is not None:
+        date_parts = [pub_date_elem.findtext(part) for part in ("Year", "Month", "Day")]
+        pub_date = " ".join(part for part in date_parts if part) or pub_date_elem.findtext("MedlineDate", "")
+    
+    # First 5 authors, in the "Last Initials" form the article page uses
+    authors = []
+    for author in article.iterfind(".//AuthorList/Author"):
+        name = author.findtext("CollectiveName") or " ".join(
+            part for part in (author.findtext("LastName"), author.findtext("Initials")) if part
+        )
+        if name and len(name) > 2:
+            authors.append(name)
+        if len(authors) == 5:
+            break
+    
+    pubmed_url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/"
+    return build_article_record(pubmed_url, pmid, title, journal, pub_date, authors, abstract)
+
+
+def load_cached_articles(pmids: list, require_abstract: bool = False) -> dict:
+    """Build records for PMIDs whose efetch XML is already in the disk cache (see fetch_articles_efetch)."""
+    records = {}
+    if _CACHE is None:
+        return records
+    for pmid in pmids:
+        article_xml = _CACHE.get(f"efetch:{pmid}")
+        if article_xml is not None:
+            records[pmid] = parse_efetch_article(ET.fromstring(article_xml), require_abstract)
+    return records
+
+
+def fetch_articles_efetch(pmids: list, require_abstract: bool = False) -> dict:
+    """
+    Fetch article records for up to EFETCH_BATCH_SIZE PMIDs with one efetch request.
+    
+    Returns a dict of pmid -> record; PMIDs that PubMed does not know are absent, and
+    articles skipped by require_abstract map to None.
+    Raises on HTTP or XML errors so the caller can fall back to article pages.
+    """
+    params = {"db": "pubmed", "id": ",".join(pmids), "rettype": "abstract", "retmode": "xml"}
+    if NCBI_API_KEY:
+        params["api_key"] = NCBI_API_KEY
+    
+    response = SESSION.get(EFETCH_URL, params=params, timeout=60)
+    response.raise_for_status()
+    
+    # Stream the PubmedArticleSet, clearing each article once it is parsed
+    records = {}
+    for _, elem in ET.iterparse(io.BytesIO(response.content)):
+        if elem.tag != "PubmedArticle":
+            continue
+        pmid = elem.findtext("MedlineCitation/PMID", "").strip()
+        if pmid:
+            records[pmid] = parse_efetch_article(elem, require_abstract)
+            if _CACHE is not None:
+                _CACHE.set(f"efetch:{pmid}", ET.tostring(elem), expire=CACHE_EXPIRE, tag="pubmed_xml")
+        elem.clear()
+    return records
+
+
+_article_slot_lock = threading.Lock()
+_next_article_slot = 0.0
+
+
+def wait_for_article_slot():
+    """Block until the next article page request may start (ARTICLE_PAGE_INTERVAL apart)."""
+    global _next_article_slot
+    with _article_slot_lock:
+        now = time.monotonic()
+        slot = max(now, _next_article_slot)
+        _next_article_slot = slot + ARTICLE_PAGE_INTERVAL
+    if slot > now:
+        time.sleep(slot - now)
+
+
+def fetch_article_html(pubmed_url: str) -> bytes:
+    """Fetch an article page, serving it from the disk cache when available."""
+    if _CACHE is not None:
+        html = _CACHE.get(pubmed_url)
+        if html is not None:
+            return html
+    
+    wait_for_article_slot()
+    print(f"  Fetching: {pubmed_url}")
+    response = SESSION.get(pubmed_url, timeout=30)
+    response.raise_for_status()
+    
+    if _CACHE is not None:
+        _CACHE.set(pubmed_url, response.content, expire=CACHE_EXPIRE, tag="pubmed_html")
+    return response.content
+
+
+def scrape_pubmed_article(pubmed_url: str, require_abstract: bool = False) -> dict:
+    """
+    Scrape a single PubMed article page, focusing on fraud-relevant content.
+    
+    With require_abstract, pages without an abstract return None before the title,
+    journal and author lookups.
+    """
     try:
-        print(f"  Fetching: {pubmed_url}")
-        response = requests.get(pubmed_url, headers=HEADERS, timeout=30)
-        response.raise_for_status()
+        html = fetch_article_html(pubmed_url)
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER)
         
         # Remove unnecessary elements
         for elem in soup(["script", "style", "nav", "header", "footer", "aside"]):
             elem.decompose()
         
         # Extract PMID from URL
-        pmid_match = re.search(r'/(\d{8,})/', pubmed_url)
+        pmid_match = PMID_URL_RE.search(pubmed_url)
         pmid = pmid_match.group(1) if pmid_match else ""
         
-        # Extract title - focus on main heading
-        title_elem = soup.find('h1', class_='heading-title') or soup.find('h1') or soup.find('div', class_='abstract-title')
-        title = ""
-        if title_elem:
-            title = title_elem.get_text(strip=True)
-        # Also try finding in citation
-        if not title:
-            citation_elem = soup.find('div', class_='citation') or soup.find('span', class_='docsum-title')
-            if citation_elem:
-                title = citation_elem.get_text(strip=True)
-        
         # Extract abstract - most important content
         abstract_elem = (
             soup.find('div', class_='abstract-content') or
@@ -100,12 +345,26 @@ def scrape_pubmed_article(pubmed_url: str) -> dict:
         abstract = ""
         if abstract_elem:
             # Get all paragraphs in abstract
-            abstract_paras = abstract_elem.find_all('p', class_=re.compile('abstract|paragraph'))
+            abstract_paras = abstract_elem.find_all('p', class_=ABSTRACT_PARA_CLASS_RE)
             if abstract_paras:
                 abstract = '\n'.join([p.get_text(strip=True) for p in abstract_paras])
             else:
                 abstract = abstract_elem.get_text(separator=' ', strip=True)
         
+        if require_abstract and not abstract:
+            return None
+        
+        # Extract title - focus on main heading
+        title_elem = soup.find('h1', class_='heading-title') or soup.find('h1') or soup.find('div', class_='abstract-title')
+        title = ""
+        if title_elem:
+            title = title_elem.get_text(strip=True)
+        # Also try finding in citation
+        if not title:
+            citation_elem = soup.find('div', class_='citation') or soup.find('span', class_='docsum-title')
+            if citation_elem:
+                title = citation_elem.get_text(strip=True)
+        
         # Extract journal and publication info
         journal_elem = soup.find('button', class_='journal-actions-trigger') or soup.find('span', class_='journal')
         journal = journal_elem.get_text(strip=True) if journal_elem else ""
@@ -117,141 +376,140 @@ def scrape_pubmed_article(pubmed_url: str) -> dict:
         authors = []
         author_section = soup.find('div', class_='authors') or soup.find('div', class_='authors-list')
         if author_section:
-            author_elems = author_section.find_all(['a', 'span'], class_=re.compile('author|name'))
+            author_elems = author_section.find_all(['a', 'span'], class_=AUTHOR_CLASS_RE)
             for auth in author_elems[:5]:  # Limit to first 5
                 author_text = auth.get_text(strip=True)
                 if author_text and len(author_text) > 2:
                     authors.append(author_text)
         
-        # Build focused text - prioritize abstract and key metadata
-        text_parts = []
-        
-        if title:
-            text_parts.append(f"Title: {title}")
-        
-        if pmid:
-            text_parts.append(f"PMID: {pmid}")
-        
-        if journal:
-            text_parts.append(f"Journal: {journal}")
-        
-        if pub_date:
-            text_parts.append(f"Publication Date: {pub_date}")
-        
-        if authors:
-            text_parts.append(f"Authors: {', '.join(authors)}")
-        
-        if abstract:
-            text_parts.append(f"\nAbstract:\n{abstract}")
-        else:
+        summary = ""
+        if not abstract:
             # If no abstract, try to get summary or first paragraph
-            summary_elem = soup.find('div', class_=re.compile('summary|content'))
+            summary_elem = soup.find('div', class_=SUMMARY_CLASS_RE)
             if summary_elem:
-                text_parts.append(f"\nSummary:\n{summary_elem.get_text(separator=' ', strip=True)}")
-        
-        full_text = "\n\n".join(text_parts)
-        
-        # Truncate if needed
-        if len(full_text) > MAX_TEXT_LENGTH:
-            full_text = full_text[:MAX_TEXT_LENGTH]
-            last_period = full_text.rfind('.')
-            if last_period > MAX_TEXT_LENGTH * 0.8:
-                full_text = full_text[:last_period + 1]
-            full_text += f"\n\n[Text truncated - showing first {MAX_TEXT_LENGTH} characters]"
+                summary = summary_elem.get_text(separator=' ', strip=True)
         
-        # Generate filename from PMID
-        filename = f"pubmed_{pmid}.html" if pmid else pubmed_url.split('/')[-1] + ".html"
-        filename = filename[:100]
-        
-        return {
-            'filename': filename,
-            'text': f"URL: {pubmed_url}\n\n{full_text}",
-            'url': pubmed_url,
-            'title': title,
-            'pmid': pmid,
-            'journal': journal
-        }
+        return build_article_record(pubmed_url, pmid, title, journal, pub_date, authors, abstract, summary)
     except Exception as e:
         print(f"  Error scraping article {pubmed_url}: {e}", file=sys.stderr)
         return None
 
 
-def scrape_pubmed_trending(base_url: str = "https://pubmed.ncbi.nlm.nih.gov/trending/?sort=date", max_pages: int = 100) -> list:
+def fetch_listing_pmids(base_url: str, page_num: int):
+    """Fetch one listing page and return its PMIDs, or None if the request failed."""
+    listing_url = base_url if page_num == 1 else f"{base_url}&page={page_num}"
+    try:
+        response = SESSION.get(listing_url, timeout=30)
+        response.raise_for_status()
+        return extract_pmids_from_listing_page(response.text)
+    except Exception as e:
+        print(f"    Error on page {page_num}: {e}", file=sys.stderr)
+        return None
+
+
+def scrape_pubmed_trending(base_url: str = "https://pubmed.ncbi.nlm.nih.gov/trending/?sort=date", max_pages: int = 100,
+                           require_abstract: bool = False):
     """
     Scrape all trending articles from PubMed trending pages.
     
     Iterates through listing pages (1-100) and extracts PMIDs from each,
-    then scrapes individual article pages.
+    then fetches article details in efetch batches.
     
     Args:
         base_url: The base PubMed trending page URL
         max_pages: Maximum number of listing pages to process (default 100)
+        require_abstract: Skip articles without an abstract (and their other fields)
     
-    Returns:
-        List of article records
+    Yields:
+        Article records, most recent first, as soon as each efetch batch is parsed
     """
     all_pmids = set()
-    all_records = []
     
     print(f"Step 1: Extracting PMIDs from {max_pages} listing pages...")
     
-    # Step 1: Collect all PMIDs from listing pages
-    for page_num in range(1, max_pages + 1):
-        if page_num == 1:
-            listing_url = base_url
-        else:
-            listing_url = f"{base_url}&page={page_num}"
-        
-        try:
-            print(f"  Page {page_num}/{max_pages}: Fetching listing page...")
-            response = requests.get(listing_url, headers=HEADERS, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract PMIDs from this page
-            pmids = extract_pmids_from_listing_page(soup)
-            
-            if pmids:
-                for pmid in pmids:
-                    all_pmids.add(pmid)
-                print(f"    Found {len(pmids)} PMIDs (total so far: {len(all_pmids)})")
-            else:
-                print(f"    No PMIDs found on page {page_num}")
-                if page_num > 5:  # If we hit several empty pages, stop
-                    break
-            
-            time.sleep(0.5)  # Be polite between page requests
+    # Step 1: Collect all PMIDs from listing pages, LISTING_FETCH_WORKERS pages at a time.
+    # Pages are handled in order within each window, so the empty-page stop still applies
+    # (at most one window of pages past the end is fetched)
+    page_nums = list(range(1, max_pages + 1))
+    
+    with ThreadPoolExecutor(max_workers=LISTING_FETCH_WORKERS) as executor:
+        for start in range(0, len(page_nums), LISTING_FETCH_WORKERS):
+            window = page_nums[start:start + LISTING_FETCH_WORKERS]
+            print(f"  Pages {window[0]}-{window[-1]}/{max_pages}: Fetching listing pages...")
             
-        except Exception as e:
-            print(f"    Error on page {page_num}: {e}", file=sys.stderr)
-            continue
+            reached_end = False
+            for page_num, pmids in zip(window, executor.map(lambda n: fetch_listing_pmids(base_url, n), window)):
+                if pmids is None:
+                    continue  # Fetch failed; error already reported
+                if pmids:
+                    all_pmids |= pmids
+                    print(f"    Page {page_num}: found {len(pmids)} PMIDs (total so far: {len(all_pmids)})")
+                else:
+                    print(f"    No PMIDs found on page {page_num}")
+                    if page_num > 5:  # If we hit several empty pages, stop
+                        reached_end = True
+                        break
+            if reached_end:
+                break
     
     if not all_pmids:
         print("\n❌ No PMIDs found on any listing page")
-        return []
+        return
     
-    print(f"\nStep 2: Scraping {len(all_pmids)} individual articles...")
+    print(f"\nStep 2: Fetching {len(all_pmids)} articles via E-utilities efetch...")
     
-    # Step 2: Scrape each article page
-    pmid_list = sorted(list(all_pmids), reverse=True)  # Most recent first
+    # Step 2: One efetch request per EFETCH_BATCH_SIZE PMIDs, skipping PMIDs already in
+    # the disk cache. Numbers that are not real PMIDs simply come back absent; a batch
+    # whose request fails is scraped from the article pages instead (concurrently,
+    # capped at ARTICLE_FETCH_WORKERS and 3 requests/s). Each batch is yielded as soon as it is parsed
+    # Sort numerically once: a string sort puts '9999999' ahead of '10000000'
+    pmid_list = sorted(all_pmids, key=int, reverse=True)  # Most recent first
     
-    for i, pmid in enumerate(pmid_list, 1):
-        article_url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/"
-        
-        if i % 10 == 0:
-            print(f"  Progress: {i}/{len(pmid_list)} articles...")
+    for start in range(0, len(pmid_list), EFETCH_BATCH_SIZE):
+        batch = pmid_list[start:start + EFETCH_BATCH_SIZE]
+        # Values are None for articles skipped by require_abstract
+        records_by_pmid = load_cached_articles(batch, require_abstract)
+        missing = [pmid for pmid in batch if pmid not in records_by_pmid]
         
-        record = scrape_pubmed_article(article_url)
-        if record:
-            all_records.append(record)
+        if missing:
+            try:
+                records_by_pmid.update(fetch_articles_efetch(missing, require_abstract))
+            except Exception as e:
+                print(f"  efetch failed for {len(missing)} PMIDs ({e}); scraping article pages", file=sys.stderr)
+                article_urls = [f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/" for pmid in missing]
+                with ThreadPoolExecutor(max_workers=ARTICLE_FETCH_WORKERS) as executor:
+                    records = executor.map(lambda url: scrape_pubmed_article(url, require_abstract), article_urls)
+                    for pmid, record in zip(missing, records):
+                        if record:
+                            records_by_pmid[pmid] = record
+            time.sleep(EFETCH_INTERVAL)  # Stay under the E-utilities request rate
         
-        time.sleep(1)  # Be polite - 1 second between article requests
-    
-    return all_records
+        batch_records = [records_by_pmid[pmid] for pmid in batch if records_by_pmid.get(pmid)]
+        print(f"  Progress: {start + len(batch)}/{len(pmid_list)} PMIDs "
+              f"({len(batch) - len(missing)} from cache, {len(batch_records)} articles in batch)")
+        yield from batch_records
 
 
 def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Scrape PubMed trending articles to JSONL")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Discard cached PubMed responses and fetch everything again"
+    )
+    parser.add_argument(
+        "--abstracts-only",
+        action="store_true",
+        help="Skip articles that have no abstract"
+    )
+    args = parser.parse_args()
+    
+    if args.no_cache and _CACHE is not None:
+        _CACHE.evict("pubmed_xml")
+        _CACHE.evict("pubmed_html")
+    
     base_url = "https://pubmed.ncbi.nlm.nih.gov/trending/?sort=date"
     max_pages = 100  # 100 pages * 10 articles = 1000 articles
     
@@ -260,23 +518,26 @@ def main():
     print(f"Will process up to {max_pages} listing pages (up to 1000 articles)")
     print(f"\nStarting scrape...")
     
-    records = scrape_pubmed_trending(base_url, max_pages)
-    
-    if not records:
-        print("\n❌ No articles scraped", file=sys.stderr)
-        sys.exit(1)
-    
     # Generate output filename
     timestamp = int(time.time())
     output_file = DATA_DIR / f"pubmed_trending_{timestamp}.jsonl"
     
-    # Write JSONL file
-    print(f"\nWriting {len(records)} article records to {output_file}...")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        for record in records:
-            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    # Write each record as soon as it arrives, so a crash late in the run keeps the
+    # articles already written and downstream steps can start reading the file
+    print(f"\nWriting article records to {output_file}...")
+    count = 0
+    with open(output_file, 'wb') as f:
+        for record in scrape_pubmed_trending(base_url, max_pages, require_abstract=args.abstracts_only):
+            f.write(encode_json_line(record))
+            f.flush()
+            count += 1
+    
+    if not count:
+        output_file.unlink()
+        print("\n❌ No articles scraped", file=sys.stderr)
+        sys.exit(1)
     
-    print(f"✅ Scraped {len(records)} articles from PubMed trending")
+    print(f"✅ Scraped {count} articles from PubMed trending")
     print(f"   Output: {output_file}")
     if output_file.exists():
         size_mb = output_file.stat().st_size / (1024 * 1024)
@@ -5,18 +5,19 @@ Handles JavaScript "Load More" button to get all articles
 """
 
 import json
+import queue
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 import re
 
 try:
     from selenium import webdriver
-    from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
-    from selenium.common.exceptions import TimeoutException, NoSuchElementException
+    from selenium.common.exceptions import TimeoutException
     from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.chrome.service import Service
     from bs4 import BeautifulSoup
@@ -25,15 +26,98 @@ except ImportError:
     print("  pip install selenium beautifulsoup4", file=sys.stderr)
     sys.exit(1)
 
+# lxml builds the tree several times faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 DATA_DIR = Path("data/raw")
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 BASE_URL = "https://pubpeer.com/"
 MAX_TEXT_LENGTH = 3000  # Keep text chunks manageable
+ARTICLE_SCRAPE_WORKERS = 4  # Chrome instances scraping article pages in parallel
+PAGE_READY_TIMEOUT = 10  # Seconds to wait for a page to finish rendering
+PAGE_READY_STABLE_POLLS = 3  # Consecutive 200 ms polls with an unchanged element count
+
+# Publication link hrefs are read in the browser, so the growing homepage is not
+# serialized through page_source and re-parsed after every "Load More" click
+PUBLICATION_HREFS_JS = """
+    return Array.from(document.querySelectorAll("a[href*='/publications/']"), a => a.getAttribute('href'));
+"""
+PUBLICATION_ID_RE = re.compile(r'/publications/([A-Z0-9]+)')
+
+# Requests the scraper never needs: web fonts and analytics (images are disabled through
+# Chrome prefs). Stylesheets stay enabled - the Load More and readiness checks rely on
+# CSS visibility
+BLOCKED_URL_PATTERNS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+]
+
+# readyState, element count, and (optionally) how many elements match arguments[0]
+PAGE_STATE_JS = """
+    return [
+        document.readyState,
+        document.getElementsByTagName('*').length,
+        arguments[0] ? document.querySelectorAll(arguments[0]).length : 1
+    ];
+"""
+
+# Clicks "Load More" up to arguments[0] times in one async script, waiting up to
+# arguments[1] ms after each click for new publication links; resolves with the
+# number of clicks that loaded more links
+LOAD_MORE_CLICKS_PER_CALL = 50
+LOAD_MORE_WAIT_MS = 10000
+LOAD_MORE_JS = """
+    var maxClicks = arguments[0], waitMs = arguments[1], done = arguments[arguments.length - 1];
+    var clicks = 0;
+    function linkCount() {
+        return document.querySelectorAll("a[href*='/publications/']").length;
+    }
+    function findButton() {
+        var buttons = document.querySelectorAll('button, a');
+        for (var i = 0; i < buttons.length; i++) {
+            var button = buttons[i];
+            var text = (button.textContent || '').toLowerCase();
+            var cls = (button.className || '').toString().toLowerCase();
+            var isLoadMore = text.includes('load more') ||
+                (button.tagName === 'BUTTON' && (cls.includes('load') || cls.includes('more')));
+            if (isLoadMore && button.offsetParent !== null) {
+                return button;
+            }
+        }
+        return null;
+    }
+    function step() {
+        var button = clicks < maxClicks ? findButton() : null;
+        if (!button) {
+            done(clicks);
+            return;
+        }
+        var before = linkCount(), waited = 0;
+        button.scrollIntoView(true);
+        button.click();
+        var timer = setInterval(function () {
+            waited += 100;
+            if (linkCount() > before) {
+                clearInterval(timer);
+                clicks++;
+                step();
+            } else if (waited >= waitMs) {
+                clearInterval(timer);
+                done(clicks);
+            }
+        }, 100);
+    }
+    step();
+"""
 
 
-def setup_driver():
-    """Set up Selenium WebDriver with Chrome."""
+def setup_driver(exit_on_error: bool = True):
+    """Set up Selenium WebDriver with Chrome (returns None on failure unless exit_on_error)."""
     chrome_options = Options()
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--no-sandbox")
@@ -41,111 +125,130 @@ def setup_driver():
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--window-size=1920,1080")
     chrome_options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+    # Skip images and background work the scraper never uses
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--disable-background-timer-throttling")
+    chrome_options.add_argument("--disable-renderer-backgrounding")
+    chrome_options.add_argument("--disable-features=TranslateUI")
+    chrome_options.add_argument("--mute-audio")
+    chrome_options.add_argument("--hide-scrollbars")
+    chrome_options.add_argument("--metrics-recording-only")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.plugins": 2,
+    })
     
     try:
         driver = webdriver.Chrome(options=chrome_options)
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            print(f"Warning: could not block font/analytics requests: {e}", file=sys.stderr)
         return driver
     except Exception as e:
         print(f"Error setting up Chrome driver: {e}", file=sys.stderr)
+        if not exit_on_error:
+            return None
         print("Make sure ChromeDriver is installed and in PATH", file=sys.stderr)
         sys.exit(1)
 
 
+def wait_for_page_ready(driver, selector: str = None, timeout: float = PAGE_READY_TIMEOUT):
+    """
+    Wait until the page is loaded and rendered, instead of sleeping a fixed time.
+    
+    Ready means document.readyState is 'complete', at least one element matches
+    selector (when given), and the element count is unchanged for
+    PAGE_READY_STABLE_POLLS polls, since PubPeer renders its content with JavaScript
+    after the load event. On timeout the page is used as it is.
+    """
+    state = {'count': None, 'stable': 0}
+    
+    def rendered(d):
+        ready_state, count, matches = d.execute_script(PAGE_STATE_JS, selector)
+        if ready_state == 'complete' and matches and count == state['count']:
+            state['stable'] += 1
+        else:
+            state['stable'] = 0
+        state['count'] = count
+        return state['stable'] >= PAGE_READY_STABLE_POLLS
+    
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.2).until(rendered)
+    except TimeoutException:
+        pass
+
+
+def parse_page(html: str):
+    """Parse rendered page HTML (lxml when available)."""
+    # page_source is already a str, so BeautifulSoup does no charset detection here;
+    # the cost is tree building, which lxml does in C
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+def collect_new_articles(driver, base_url, articles_loaded, seen_hrefs):
+    """Return (pub_id, url) pairs for publication links not seen on an earlier pass."""
+    new_articles = set()
+    # Find article links matching pattern /publications/[alphanumeric]; hrefs seen on
+    # an earlier pass are skipped, so each link is matched only once
+    for href in driver.execute_script(PUBLICATION_HREFS_JS) or []:
+        if not href or href in seen_hrefs:
+            continue
+        seen_hrefs.add(href)
+        # Extract the publication ID
+        match = PUBLICATION_ID_RE.search(href)
+        if match:
+            article = (match.group(1), urljoin(base_url, href))
+            if article not in articles_loaded:
+                new_articles.add(article)
+    return new_articles
+
+
 def load_all_articles(driver, base_url):
     """Load all articles by clicking 'Load More' button until no more articles."""
     print(f"Loading PubPeer homepage: {base_url}")
     driver.get(base_url)
-    time.sleep(3)  # Wait for initial page load
+    wait_for_page_ready(driver, "a[href*='/publications/']")  # Wait for initial page load
     
     articles_loaded = set()
+    seen_hrefs = set()
     load_more_clicked = 0
     max_clicks = 1000  # Safety limit
     
-    while load_more_clicked < max_clicks:
-        # Parse current page to find article links
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        current_articles = set()
-        
-        # Find all article links matching pattern /publications/[alphanumeric]
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '')
-            if '/publications/' in href:
-                # Extract the publication ID
-                match = re.search(r'/publications/([A-Z0-9]+)', href)
-                if match:
-                    pub_id = match.group(1)
-                    full_url = urljoin(base_url, href)
-                    current_articles.add((pub_id, full_url))
-        
-        new_articles = current_articles - articles_loaded
+    # Each call clicks up to LOAD_MORE_CLICKS_PER_CALL times inside the browser, waiting
+    # for new links after each click, so the script timeout stays bounded and progress
+    # is reported between calls
+    driver.set_script_timeout(LOAD_MORE_CLICKS_PER_CALL * LOAD_MORE_WAIT_MS / 1000 + 30)
+    
+    while True:
+        new_articles = collect_new_articles(driver, base_url, articles_loaded, seen_hrefs)
         if new_articles:
-            articles_loaded.update(current_articles)
+            articles_loaded.update(new_articles)
             print(f"  Found {len(new_articles)} new articles (total: {len(articles_loaded)})")
         
-        # Try to find and click "Load More" button
+        if load_more_clicked >= max_clicks:
+            break
+        
         try:
-            # Look for common "Load More" button patterns
-            load_more = None
-            selectors = [
-                "button:contains('Load More')",
-                "a:contains('Load More')",
-                "button[class*='load']",
-                "button[class*='more']",
-                "a[class*='load']",
-                "a[class*='more']",
-                "//button[contains(text(), 'Load More')]",
-                "//a[contains(text(), 'Load More')]",
-            ]
-            
-            for selector in selectors:
-                try:
-                    if selector.startswith("//"):
-                        # XPath
-                        load_more = driver.find_element(By.XPATH, selector)
-                    else:
-                        # CSS selector
-                        load_more = driver.find_element(By.CSS_SELECTOR, selector)
-                    if load_more and load_more.is_displayed():
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            if load_more and load_more.is_displayed():
-                # Scroll to button
-                driver.execute_script("arguments[0].scrollIntoView(true);", load_more)
-                time.sleep(0.5)
-                load_more.click()
-                load_more_clicked += 1
-                print(f"  Clicked 'Load More' ({load_more_clicked})...")
-                time.sleep(2)  # Wait for new content to load
-            else:
-                # Try JavaScript approach - look for load more function
-                try:
-                    driver.execute_script("""
-                        var buttons = document.querySelectorAll('button, a');
-                        for (var i = 0; i < buttons.length; i++) {
-                            var text = buttons[i].textContent || buttons[i].innerText || '';
-                            if (text.toLowerCase().includes('load more') || 
-                                text.toLowerCase().includes('more')) {
-                                buttons[i].click();
-                                return true;
-                            }
-                        }
-                        return false;
-                    """)
-                    time.sleep(2)
-                    load_more_clicked += 1
-                    print(f"  Clicked 'Load More' via JavaScript ({load_more_clicked})...")
-                except:
-                    # No more "Load More" button found
-                    print("  No more 'Load More' button found. All articles loaded.")
-                    break
+            clicks = driver.execute_async_script(
+                LOAD_MORE_JS, min(LOAD_MORE_CLICKS_PER_CALL, max_clicks - load_more_clicked), LOAD_MORE_WAIT_MS
+            )
         except Exception as e:
             print(f"  Could not find/click 'Load More' button: {e}")
-            # Check if we got new articles in this iteration
-            if not new_articles:
-                print("  No new articles found. Stopping.")
-                break
+            clicks = 0
+        
+        if clicks:
+            load_more_clicked += clicks
+            print(f"  Clicked 'Load More' {load_more_clicked} times...")
+        if clicks < LOAD_MORE_CLICKS_PER_CALL:
+            # The button disappeared or stopped producing new links; pick up the last batch
+            new_articles = collect_new_articles(driver, base_url, articles_loaded, seen_hrefs)
+            if new_articles:
+                articles_loaded.update(new_articles)
+                print(f"  Found {len(new_articles)} new articles (total: {len(articles_loaded)})")
+            print("  No more 'Load More' button found. All articles loaded.")
+            break
     
     print(f"\nTotal articles found: {len(articles_loaded)}")
     return list(articles_loaded)
@@ -156,9 +259,9 @@ def scrape_article(driver, article_url, pub_id):
     try:
         print(f"  Scraping: {article_url}")
         driver.get(article_url)
-        time.sleep(2)  # Wait for page to load
+        wait_for_page_ready(driver)  # Wait for page to load
         
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        soup = parse_page(driver.page_source)
         
         # Remove script and style elements
         for elem in soup(["script", "style"]):
@@ -257,9 +360,10 @@ def main():
     print("\nStarting scrape...")
     print("Note: This uses Selenium to handle JavaScript 'Load More' button")
     
-    driver = None
+    drivers = []
     try:
         driver = setup_driver()
+        drivers.append(driver)
         
         # Step 1: Load all articles by clicking "Load More"
         articles = load_all_articles(driver, BASE_URL)
@@ -268,19 +372,35 @@ def main():
             print("\n❌ No articles found", file=sys.stderr)
             sys.exit(1)
         
-        # Step 2: Scrape each article
-        print(f"\nScraping {len(articles)} articles...")
-        records = []
+        # Step 2: Scrape articles on a pool of drivers (the listing driver plus up to
+        # ARTICLE_SCRAPE_WORKERS - 1 more); each worker borrows a driver per article
+        for _ in range(ARTICLE_SCRAPE_WORKERS - 1):
+            extra_driver = setup_driver(exit_on_error=False)
+            if extra_driver is None:
+                # Keep the listing already scraped; go on with the browsers that started
+                break
+            drivers.append(extra_driver)
+        print(f"\nScraping {len(articles)} articles with {len(drivers)} browsers...")
+        driver_pool = queue.Queue()
+        for pooled_driver in drivers:
+            driver_pool.put(pooled_driver)
         
-        for i, (pub_id, article_url) in enumerate(articles, 1):
-            if i % 10 == 0:
-                print(f"  Progress: {i}/{len(articles)} articles...")
-            
-            record = scrape_article(driver, article_url, pub_id)
-            if record:
-                records.append(record)
-            
-            time.sleep(1)  # Be polite between requests
+        def scrape_with_pool(article):
+            pub_id, article_url = article
+            pooled_driver = driver_pool.get()
+            try:
+                return scrape_article(pooled_driver, article_url, pub_id)
+            finally:
+                time.sleep(1)  # Be polite between requests (per worker)
+                driver_pool.put(pooled_driver)
+        
+        records = []
+        with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+            for i, record in enumerate(executor.map(scrape_with_pool, articles), 1):
+                if i % 10 == 0:
+                    print(f"  Progress: {i}/{len(articles)} articles...")
+                if record:
+                    records.append(record)
         
         if not records:
             print("\n❌ No articles scraped", file=sys.stderr)
@@ -313,8 +433,8 @@ def main():
         traceback.print_exc()
         sys.exit(1)
     finally:
-        if driver:
-            driver.quit()
+        for pooled_driver in drivers:
+            pooled_driver.quit()
 
 
 if __name__ == "__main__":
@@ -25,6 +25,11 @@ except ImportError:
         print("ERROR: Could not import clinical_investigator module", file=sys.stderr)
         sys.exit(1)
 
+from gpt_ranker import original_row_text, source_row_texts
+
+# Ranker input; source text is read back from here when the outputs do not carry it
+SOURCE_CSV_PATH = Path("data/processed/combined_qui_tam_data.csv")
+
 def load_csv_rows(csv_path: Path) -> List[Dict[str, Any]]:
     """Load all rows from CSV file."""
     rows = []
@@ -37,6 +42,41 @@ def load_csv_rows(csv_path: Path) -> List[Dict[str, Any]]:
         sys.exit(1)
     return rows
 
+def load_original_texts(jsonl_path: Path, source_csv: Path, source_row_indexes: List[int]) -> Dict[int, str]:
+    """Map source_row_index -> original text for the given leads.
+    
+    The ranked JSONL embeds the text only when run with --embed-original-row;
+    otherwise it is read from the --original-rows-output file the record points
+    to, or from the source CSV (one pass for all remaining rows).
+    """
+    import json
+    
+    wanted = set(source_row_indexes)
+    texts: Dict[int, str] = {}
+    if jsonl_path.exists():
+        with open(jsonl_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    metadata = json.loads(line).get('metadata') or {}
+                except json.JSONDecodeError:
+                    continue
+                idx = metadata.get('source_row_index')
+                if idx in wanted and not texts.get(idx):
+                    try:
+                        texts[idx] = original_row_text(metadata)
+                    except (OSError, ValueError) as e:
+                        print(f"Warning: Could not read original row {idx}: {e}", file=sys.stderr)
+    
+    missing = [idx for idx in wanted if not texts.get(idx)]
+    if missing and source_csv.exists():
+        try:
+            texts.update(source_row_texts(source_csv, missing))
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read source CSV {source_csv}: {e}", file=sys.stderr)
+    return texts
+
 def prepare_lead_data(row: Dict[str, Any], original_text: str = "") -> Dict[str, Any]:
     """Prepare lead data for investigation from CSV row."""
     import re
@@ -193,38 +233,40 @@ def update_csv_and_jsonl(csv_path: Path, jsonl_path: Path, source_row_index: int
     
     # Update JSONL (optional - don't fail if JSONL doesn't exist or update fails)
     if jsonl_path.exists():
+        temp_jsonl = jsonl_path.with_suffix('.jsonl.tmp')
         try:
             updated_jsonl = False
-            jsonl_lines = []
             
-            with open(jsonl_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.strip():
+            # Stream record by record into the temp file so the ranked JSONL is never
+            # held in memory; only updated records are re-serialized, every other
+            # line is copied through unchanged
+            try:
+                with open(jsonl_path, 'r', encoding='utf-8') as src, \
+                     open(temp_jsonl, 'w', encoding='utf-8') as dst:
+                    for line in src:
+                        if not line.strip():
+                            continue
                         try:
                             record = json.loads(line)
-                            record_source_idx = record.get('metadata', {}).get('source_row_index')
-                            if record_source_idx == source_row_index:
-                                record['investigation_report'] = investigation_report
-                                record['investigation_viability_score'] = investigation_viability_score
-                                updated_jsonl = True
-                            jsonl_lines.append(record)
                         except json.JSONDecodeError:
                             # Skip invalid JSON lines
                             continue
-            
-            if updated_jsonl:
-                # Write back to JSONL using temp file
-                temp_jsonl = jsonl_path.with_suffix('.jsonl.tmp')
-                try:
-                    with open(temp_jsonl, 'w', encoding='utf-8') as f:
-                        for record in jsonl_lines:
-                            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                        record_source_idx = record.get('metadata', {}).get('source_row_index')
+                        if record_source_idx == source_row_index:
+                            record['investigation_report'] = investigation_report
+                            record['investigation_viability_score'] = investigation_viability_score
+                            updated_jsonl = True
+                            line = json.dumps(record, ensure_ascii=False) + '\n'
+                        elif not line.endswith('\n'):
+                            line += '\n'
+                        dst.write(line)
+                
+                if updated_jsonl:
                     # Atomic replace
                     shutil.move(str(temp_jsonl), str(jsonl_path))
-                except Exception as e:
-                    if temp_jsonl.exists():
-                        temp_jsonl.unlink()
-                    raise
+            finally:
+                if temp_jsonl.exists():
+                    temp_jsonl.unlink()
         except Exception as e:
             # Don't fail if JSONL update fails - CSV update is more important
             print(f"Warning: Could not update JSONL: {e}", file=sys.stderr)
@@ -264,6 +306,16 @@ def main():
         print("No rows to rerun. Exiting.")
         return
     
+    # Ranked outputs no longer embed the source text by default; look it up once for all leads
+    jsonl_path = Path("data/results/qui_tam_ranked.jsonl")
+    wanted_indexes = []
+    for _, row in low_score_rows:
+        try:
+            wanted_indexes.append(int(row.get('source_row_index', '')))
+        except (ValueError, TypeError):
+            continue
+    original_texts = load_original_texts(jsonl_path, SOURCE_CSV_PATH, wanted_indexes)
+    
     # Show summary (no interactive prompt - can run from UI)
     print(f"\nThis will rerun investigations for {len(low_score_rows)} leads.")
     print("Starting rerun...")
@@ -292,9 +344,9 @@ def main():
                 failed += 1
                 continue
             
-            # Prepare lead data (will extract original_text from metadata automatically)
+            # Prepare lead data with the original text looked up above
             try:
-                lead_data = prepare_lead_data(row)
+                lead_data = prepare_lead_data(row, original_texts.get(source_row_index_int, ""))
             except Exception as e:
                 print(f"  ✗ Error preparing lead data: {e}", file=sys.stderr)
                 import traceback
@@ -322,7 +374,6 @@ def main():
             
             # Update CSV and JSONL
             try:
-                jsonl_path = Path("data/results/qui_tam_ranked.jsonl")
                 if update_csv_and_jsonl(csv_path, jsonl_path, source_row_index_int, investigation_report, investigation_viability_score):
                     print(f"  ✓ Updated: viability_score={investigation_viability_score}")
                     successful += 1
@@ -16,6 +16,8 @@ from flask import Flask, abort, jsonify, request, send_from_directory
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 DATA_DIR = SCRIPT_DIR / "data"
+# gpt_ranker.py input; source text is read back from it when ranked records do not embed it
+SOURCE_CSV = DATA_DIR / "processed" / "combined_qui_tam_data.csv"
 
 # Process tracking for /api/stop
 _current_process = None
@@ -284,6 +286,31 @@ def delete_data():
         return jsonify({"ok": False, "error": str(e)}), 500
 
 
+@app.route("/api/original-text", methods=["GET"])
+def original_text():
+    """Source text for a ranked record whose metadata only references it (no --embed-original-row)."""
+    try:
+        from gpt_ranker import original_row_text
+
+        original_row = {}
+        ref_file = request.args.get("ref_file")
+        ref_offset = request.args.get("ref_offset", type=int)
+        if ref_file and ref_offset is not None:
+            # Only serve rows from files under the data folder
+            ref_path = (SCRIPT_DIR / ref_file).resolve()
+            if not str(ref_path).startswith(str(DATA_DIR.resolve()) + os.sep):
+                return jsonify({"ok": False, "error": "Invalid ref_file"}), 400
+            original_row = {"ref_file": str(ref_path), "ref_offset": ref_offset}
+
+        metadata = {
+            "source_row_index": request.args.get("source_row_index", type=int),
+            "original_row": original_row,
+        }
+        return jsonify({"ok": True, "text": original_row_text(metadata, SOURCE_CSV)})
+    except Exception as e:
+        return jsonify({"ok": False, "error": str(e)}), 500
+
+
 @app.errorhandler(404)
 def not_found(error):
     return jsonify({"ok": False, "error": "Not found"}), 404
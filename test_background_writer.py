@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Regression test: BackgroundWriter.close() must not hang when a write fails"""
+
+import threading
+import time
+import unittest
+
+from gpt_ranker import BackgroundWriter
+
+
+class FailingRouter:
+    """Router stub: the first write waits for a gate, every later write fails
+    the way _ensure_chunk does on FileExistsError."""
+
+    def __init__(self):
+        self.entered = threading.Event()
+        self.gate = threading.Event()
+        self.calls = 0
+
+    def write(self, *args):
+        self.calls += 1
+        if self.calls == 1:
+            self.entered.set()
+            self.gate.wait(timeout=5)
+            return
+        raise FileExistsError("chunk already exists")
+
+    def flush(self):
+        pass
+
+
+class BackgroundWriterTest(unittest.TestCase):
+    def test_close_returns_when_write_fails_in_sentinel_batch(self):
+        router = FailingRouter()
+        writer = BackgroundWriter(router, None, maxsize=8)
+        writer.put(0, "a.txt", {}, None, None)
+        self.assertTrue(router.entered.wait(timeout=5))
+
+        # Queue a row and the sentinel while the writer is busy, so both
+        # are taken in the same batch and the row's write fails first
+        writer.put(1, "b.txt", {}, None, None)
+        errors = []
+
+        def close():
+            try:
+                writer.close()
+            except FileExistsError as exc:
+                errors.append(exc)
+
+        closer = threading.Thread(target=close, daemon=True)
+        closer.start()
+        deadline = time.monotonic() + 5
+        while writer.queue.qsize() < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        router.gate.set()
+        closer.join(timeout=3)
+
+        self.assertFalse(closer.is_alive(), "close() hung after a failed write")
+        self.assertFalse(writer.thread.is_alive())
+        self.assertEqual(len(errors), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
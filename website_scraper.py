@@ -4,21 +4,123 @@ Website Scraper - Scrapes a given URL and outputs JSONL format for converter
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import json
+import os
+import re
 import sys
 from pathlib import Path
 from urllib.parse import urlparse, urljoin
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# lxml builds the tree several times faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
 
 DATA_DIR = Path("data/raw")
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+# Set SCRAPER_HTTP_CACHE_HOURS (needs requests-cache) to serve repeat fetches from an
+# on-disk SQLite cache, e.g. while iterating on the parsing code
+HTTP_CACHE_PATH = DATA_DIR.parent / ".http_cache"
+HTTP_CACHE_HOURS = float(os.environ.get("SCRAPER_HTTP_CACHE_HOURS", "0") or 0)
+
+# Common path segments for article pages, compiled into one alternation so each
+# link URL is scanned once instead of once per pattern
+ARTICLE_URL_RE = re.compile('|'.join(re.escape(pattern) for pattern in (
+    '/pubmed/',  # PubMed
+    '/article/',  # Generic articles
+    '/post/',  # Blog posts
+    '/entry/',  # Entries
+    '/news/',  # News articles
+    '/story/',  # Stories
+    '/paper/',  # Papers
+    '/publication/',  # Publications
+)))
+
+# Class-name keywords marking an article container; one case-insensitive pass per
+# class list instead of lowercasing and scanning it once per keyword
+ARTICLE_CLASS_RE = re.compile(r'article|post|entry|item|result', re.IGNORECASE)
+
+# Article pages fetched concurrently when following links; small enough to stay polite
+ARTICLE_FETCH_WORKERS = 4
+# Requests to one host start at least this many seconds apart (the old serial loop's
+# 1 s sleep), so the workers only overlap slow responses and other hosts' pages
+HOST_REQUEST_INTERVAL = 1.0
+
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 }
 
 
+class HostRateLimiter:
+    """Thread-safe per-host spacing: requests to one host start `interval` seconds apart."""
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.next_slot = {}
+
+    def wait(self, url: str) -> None:
+        """Block until url's host may be sent its next request."""
+        host = urlparse(url).netloc
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+HOST_LIMITER = HostRateLimiter(HOST_REQUEST_INTERVAL)
+
+
+def build_session() -> requests.Session:
+    """Keep-alive session so every page fetch reuses the same TCP/TLS connections."""
+    if HTTP_CACHE_HOURS > 0 and REQUESTS_CACHE_AVAILABLE:
+        session = requests_cache.CachedSession(
+            str(HTTP_CACHE_PATH),
+            backend='sqlite',
+            expire_after=int(HTTP_CACHE_HOURS * 3600),
+            allowable_methods=('GET',),
+        )
+    else:
+        if HTTP_CACHE_HOURS > 0:
+            print("Warning: SCRAPER_HTTP_CACHE_HOURS is set but requests-cache is not installed", file=sys.stderr)
+        session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                          respect_retry_after_header=True),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = build_session()
+
+
 def scrape_website(url: str, max_pages: int = 1, link_selector: str = None, url_pattern: str = None) -> list:
     """
     Scrape a website and extract text content.
@@ -35,14 +137,21 @@ def scrape_website(url: str, max_pages: int = 1, link_selector: str = None, url_
     records = []
     visited = set()
     
-    def get_page_content(page_url: str) -> dict:
-        """Get content from a single page."""
+    def fetch_html(page_url: str) -> bytes:
+        """Download one page's raw HTML."""
+        HOST_LIMITER.wait(page_url)  # Be polite
+        print(f"Fetching: {page_url}")
+        response = SESSION.get(page_url, timeout=30)
+        response.raise_for_status()
+        return response.content
+    
+    def get_page_content(page_url: str, html: bytes = None) -> dict:
+        """Get content from a single page, fetching it unless its HTML is given."""
         try:
-            print(f"Fetching: {page_url}")
-            response = requests.get(page_url, headers=HEADERS, timeout=30)
-            response.raise_for_status()
+            if html is None:
+                html = fetch_html(page_url)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(html, HTML_PARSER)
             
             # Remove script and style elements
             for script in soup(["script", "style", "nav", "header", "footer"]):
@@ -101,17 +210,21 @@ def scrape_website(url: str, max_pages: int = 1, link_selector: str = None, url_
             print(f"Error scraping {page_url}: {e}", file=sys.stderr)
             return None
     
-    # Scrape main page
-    main_record = get_page_content(url)
+    # Scrape main page; its HTML is kept for link discovery instead of fetching it twice
+    try:
+        main_html = fetch_html(url)
+    except Exception as e:
+        print(f"Error scraping {url}: {e}", file=sys.stderr)
+        main_html = None
+    main_record = get_page_content(url, main_html) if main_html is not None else None
     if main_record:
         records.append(main_record)
         visited.add(url)
     
     # Optionally follow links to articles
-    if max_pages > 1:
+    if max_pages > 1 and main_html is not None:
         try:
-            response = requests.get(url, headers=HEADERS, timeout=30)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(main_html, HTML_PARSER)
             
             base_url = urlparse(url)
             article_links = []
@@ -137,23 +250,6 @@ def scrape_website(url: str, max_pages: int = 1, link_selector: str = None, url_
                 # Smart detection: look for common article link patterns
                 links = soup.find_all('a', href=True)
                 
-                # Common patterns for article pages
-                article_patterns = [
-                    '/pubmed/',  # PubMed
-                    '/article/',  # Generic articles
-                    '/post/',  # Blog posts
-                    '/entry/',  # Entries
-                    '/news/',  # News articles
-                    '/story/',  # Stories
-                    '/paper/',  # Papers
-                    '/publication/',  # Publications
-                ]
-                
-                # Also look for links in article containers
-                article_containers = soup.find_all(['article', 'div'], class_=lambda x: x and any(
-                    keyword in str(x).lower() for keyword in ['article', 'post', 'entry', 'item', 'result']
-                ))
-                
                 for link in links:
                     href = link.get('href', '')
                     if not href:
@@ -163,13 +259,12 @@ def scrape_website(url: str, max_pages: int = 1, link_selector: str = None, url_
                     parsed = urlparse(full_url)
                     
                     # Check if it matches article patterns
-                    is_article_link = any(pattern in full_url for pattern in article_patterns)
+                    is_article_link = ARTICLE_URL_RE.search(full_url) is not None
                     
                     # Check if link is in an article container
                     if not is_article_link:
                         parent = link.find_parent(['article', 'div'])
-                        if parent and any(keyword in str(parent.get('class', [])).lower() 
-                                        for keyword in ['article', 'post', 'entry', 'item', 'result']):
+                        if parent and ARTICLE_CLASS_RE.search(str(parent.get('class', []))):
                             is_article_link = True
                     
                     # Check if URL looks like an article (has ID or slug)
@@ -199,15 +294,13 @@ def scrape_website(url: str, max_pages: int = 1, link_selector: str = None, url_
             
             print(f"Found {len(unique_links)} article links, following {len(links_to_follow)}...")
             
-            for i, full_url in enumerate(links_to_follow, 1):
-                if full_url in visited:
-                    continue
-                visited.add(full_url)
-                print(f"  [{i}/{len(links_to_follow)}] Scraping article: {full_url}")
-                time.sleep(1)  # Be polite
-                record = get_page_content(full_url)
-                if record:
-                    records.append(record)
+            visited.update(links_to_follow)
+            # Fetch a few articles at a time over the shared session, spaced per host by
+            # HOST_LIMITER; map() yields results in link order, so records keep the page's ordering
+            with ThreadPoolExecutor(max_workers=ARTICLE_FETCH_WORKERS) as executor:
+                for record in executor.map(get_page_content, links_to_follow):
+                    if record:
+                        records.append(record)
         except Exception as e:
             print(f"Error following links: {e}", file=sys.stderr)
     
@@ -247,9 +340,15 @@ def main():
     
     # Write JSONL file
     print(f"\nWriting {len(records)} records to {output_file}...")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        for record in records:
-            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    # Write next to the target and rename, so combine_website_scrapes.py never
+    # picks up a half-written website_scrape_*.jsonl
+    tmp_file = output_file.with_name(output_file.name + '.tmp')
+    with open(tmp_file, 'wb') as f:
+        if ORJSON_AVAILABLE:
+            f.write(b''.join(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE) for record in records))
+        else:
+            f.write(''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records).encode('utf-8'))
+    os.replace(tmp_file, output_file)
     
     print(f"✅ Scraped {len(records)} page(s) from {url}")
     print(f"   Output: {output_file}")